@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+"""检测框叠加层的绘制耗时。
+
+在 MaixPy 设备上运行：在一帧 640x480 的 RGB888 图像上绘制 N 个随机检测框，
+比较逐框调用 `draw_rect` 与 `DetectionOverlay` 一次性绘制的耗时。
+"""
+
+import time
+
+import numpy as np
+from maix import image
+
+from maixpy_ui import DetectionOverlay
+
+REPEAT = 20
+
+
+def time_it(fn):
+    """返回 `fn` 平均每次的耗时（毫秒）。"""
+    fn()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def draw_each(img, boxes):
+    """逐框调用 `draw_rect`。"""
+    for x, y, w, h in boxes.tolist():
+        img.draw_rect(x, y, w, h, image.COLOR_BLUE, 2)
+
+
+if __name__ == '__main__':
+    img = image.Image(640, 480, image.Format.FMT_RGB888)
+    rng = np.random.default_rng(0)
+    overlay = DetectionOverlay(palette=[(0, 0, 255)], thickness=2)
+    for n in (10, 100, 500, 2000):
+        boxes = np.column_stack([rng.integers(0, 600, n), rng.integers(0, 440, n),
+                                 rng.integers(4, 60, n), rng.integers(4, 60, n)])
+        overlay.set_boxes(boxes)
+        each = time_it(lambda: draw_each(img, boxes))
+        batched = time_it(lambda: overlay.draw(img))
+        print(f"N={n:5d}  draw_rect per box: {each:7.2f} ms  DetectionOverlay: {batched:7.2f} ms")
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+"""空闲任务的慢分片恢复测试。
+
+模拟每帧 20 ms 的空闲预算：一个生成器任务的分片通常只需 1 ms，但其中
+一个分片遇到一次 50 ms 的停顿（例如垃圾回收）。检查该任务在停顿之后
+仍能继续执行并最终完成，而不是因估计耗时超过预算而永远得不到执行。
+不依赖 MaixPy 硬件，可以在任意 Python 环境中运行。
+"""
+
+import time
+
+from maixpy_ui.core.idle import IdleScheduler
+
+BUDGET = 0.020
+FRAMES = 200
+SLICES = 100
+
+
+def work(log):
+    """每个分片约 1 ms，第 3 个分片停顿 50 ms。"""
+    for i in range(SLICES):
+        time.sleep(0.050 if i == 2 else 0.001)
+        log.append(i)
+        yield
+
+
+def main():
+    idle = IdleScheduler()
+    log = []
+    task = idle.add(work(log))
+    longest = 0
+    for frame in range(FRAMES):
+        idle.run(BUDGET)
+        longest = max(longest, task.skipped)
+        if task.done:
+            break
+    print(f"帧数: {frame + 1}  执行的分片: {len(log)}  最长连续跳过: {longest}  "
+          f"当前估计: {task.estimate * 1000:.1f} ms")
+    assert task.done, "停顿之后任务没有再被执行"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+"""页面增删的内存泄漏测试。
+
+在 MaixPy 设备上运行：反复添加 10k 个页面并在它们之间导航，然后通过
+`UIManager.remove_page` 移除，检查内存是否回到基线，以及被移除的页面
+是否都已被释放（不依赖循环垃圾回收）。
+"""
+
+import gc
+import tracemalloc
+import weakref
+
+from maixpy_ui import Page, UIManager
+
+N = 10000
+
+
+class LeafPage(Page):
+    """持有一块缓冲区的页面，用来模拟页面中的组件和图像。"""
+
+    def __init__(self, ui_manager, name):
+        super().__init__(ui_manager, name)
+        self.payload = bytearray(256)
+
+    def update(self, img):
+        pass
+
+
+def run_round(ui, root):
+    """添加 N 个页面（部分带有子页面），在其中导航后全部移除，返回仍存活的页面数。"""
+    refs = []
+    for i in range(N):
+        page = LeafPage(ui, f"p{i}")
+        if i % 10 == 0:
+            page.add_child(LeafPage(ui, "child"))
+        root.add_child(page)
+        refs.append(weakref.ref(page))
+    del page
+    for i in range(0, N, 100):
+        ui.navigate_to_path([f"p{i}"])
+        ui.navigate_to_child("child")
+    for ref in refs:
+        ui.remove_page(ref())
+    return sum(ref() is not None for ref in refs)
+
+
+if __name__ == '__main__':
+    ui = UIManager()
+    root = LeafPage(ui, "root")
+    ui.set_root_page(root)
+
+    gc.collect()
+    gc.disable()  # 只依靠引用计数释放页面
+    tracemalloc.start()
+    run_round(ui, root)  # 预热，排除解释器内部缓存的增长
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(3):
+        alive = run_round(ui, root)
+        current = tracemalloc.get_traced_memory()[0]
+        print(f"alive pages: {alive:5d}  history: {len(ui.navigation_history):3d}  "
+              f"memory delta: {current - baseline:+8d} B")
+    tracemalloc.stop()
+    gc.enable()
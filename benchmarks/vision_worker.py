@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+"""视觉子进程对 UI 帧率的影响。
+
+在 MaixPy 设备上运行：用一个每帧耗时约 200 ms 的处理函数模拟繁重的视觉
+处理，分别在 UI 线程中串行处理和交给 `VisionWorker` 处理，比较 UI 主循环
+的帧率和视觉结果的更新频率。
+"""
+
+import time
+
+import numpy as np
+
+from maixpy_ui.vision import VisionWorker
+
+WIDTH, HEIGHT = 320, 240
+DURATION = 3.0
+UI_WORK = 0.005  # 每帧 UI 工作的耗时
+
+
+def slow_detect(frame, mask, params):
+    """模拟一次耗时约 200 ms 的检测。"""
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        pass
+    if mask is not None:
+        mask[:] = frame[..., 0] > params['threshold']
+    return [(0, 0, 10, 10, 100)]
+
+
+def busy(seconds):
+    """忙等 `seconds` 秒，模拟 UI 工作。"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def run_inline(frame):
+    """在 UI 线程中串行处理，返回 (UI 帧率, 结果帧率)。"""
+    mask = np.zeros((HEIGHT, WIDTH), np.uint8)
+    frames = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        slow_detect(frame, mask, {'threshold': 128})
+        busy(UI_WORK)
+        frames += 1
+    fps = frames / DURATION
+    return fps, fps
+
+
+def run_worker(frame):
+    """交给视觉子进程处理，返回 (UI 帧率, 结果帧率)。"""
+    with VisionWorker(slow_detect, WIDTH, HEIGHT, params={'threshold': 128}) as worker:
+        frames = results = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < DURATION:
+            worker.submit(frame)
+            if worker.poll() is not None:
+                results += 1
+            busy(UI_WORK)
+            frames += 1
+    return frames / DURATION, results / DURATION
+
+
+if __name__ == '__main__':
+    frame = np.random.randint(0, 256, (HEIGHT, WIDTH, 3), np.uint8)
+    for name, run in (("inline", run_inline), ("worker", run_worker)):
+        ui_fps, result_fps = run(frame)
+        print(f"{name:6s}  UI: {ui_fps:6.1f} FPS  detection: {result_fps:5.1f} FPS")
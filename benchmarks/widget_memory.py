@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+"""组件内存与属性访问开销基准测试。
+
+在 MaixPy 设备上运行：创建 10k 个各类组件，统计每个实例平均占用的内存，
+并测量热路径中命中测试的耗时。
+"""
+
+import time
+import tracemalloc
+
+from maixpy_ui import Button, Slider, Switch, Checkbox, RadioButton
+
+N = 10000
+
+FACTORIES = {
+    "Button": lambda i: Button([i % 300, i % 200, 40, 20], "B", None),
+    "Slider": lambda i: Slider([i % 300, i % 200, 100, 10]),
+    "Switch": lambda i: Switch([i % 300, i % 200]),
+    "Checkbox": lambda i: Checkbox([i % 300, i % 200], "C"),
+    "RadioButton": lambda i: RadioButton([i % 300, i % 200], "R", i),
+}
+
+
+def measure_memory(factory):
+    """返回创建 N 个组件后平均每个实例占用的字节数。"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    widgets = [factory(i) for i in range(N)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return total / len(widgets), widgets
+
+
+def measure_hit_test(widgets):
+    """返回对所有组件执行一次事件处理的耗时（取 5 次中的最小值，微秒/组件）。"""
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for w in widgets:
+            w.handle_event(150, 100, 0, 320, 240, 320, 240)
+        best = min(best, time.perf_counter() - start)
+    return best / len(widgets) * 1e6
+
+
+if __name__ == '__main__':
+    for name, factory in FACTORIES.items():
+        per_widget, widgets = measure_memory(factory)
+        has_dict = hasattr(widgets[0], '__dict__')
+        line = f"{name:12s} {per_widget:8.1f} B/widget  __dict__={has_dict}"
+        if hasattr(widgets[0], 'handle_event'):
+            line += f"  {measure_hit_test(widgets):6.2f} us/event"
+        print(line)
@@ -1,5 +1,10 @@
-from .button import Button, ButtonManager
-from .slider import Slider, SliderManager
-from .switch import Switch, SwitchManager
-from .checkbox import Checkbox, CheckboxManager
-from .radio import RadioButton, RadioManager
\ No newline at end of file
+from .base import Widget, BaseManager
+from .button import Button, ButtonManager
+from .slider import Slider, SliderManager
+from .switch import Switch, SwitchManager
+from .checkbox import Checkbox, CheckboxManager
+from .radio import RadioButton, RadioManager
+from .array_manager import ArrayWidgetManager
+from .widget_manager import WidgetManager
+from .threshold_tuner import ThresholdTuner
+from .overlay import DetectionOverlay
\ No newline at end of file
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+import maix.image as image
+import maix.touchscreen as touchscreen
+import maix.display as display
+from array import array
+from typing import Collection
+
+from ..core.power import activity
+from .base import Widget, BaseManager
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时退化为逐项比较
+    np = None
+
+class ArrayWidgetManager(BaseManager):
+    """以列式（struct-of-arrays）存储组件状态的管理器，适用于组件数量很多的页面。
+
+    所有组件的触摸区域、按下/待点击标志和可交互标志都保存在连续的数组列中。
+    每帧只需一次向量化比较即可得到触摸点命中的组件，之后仅对命中或
+    处于按下状态的组件调用其 `handle_touch`，其余组件只参与绘制。
+
+    组件的显示屏坐标只在图像或显示屏尺寸变化时重新计算。如果在添加之后
+    修改了组件的 `rect`，需要调用 `invalidate()`。
+
+    删除组件时只将其所在的行标记为空位，耗时为 O(1)；当空位超过一半时，
+    会在下一帧开始时一次性压缩所有数组列。
+    """
+
+    def __init__(self, ts: touchscreen.TouchScreen, disp: display.Display):
+        """初始化列式组件管理器。
+
+        Args:
+            ts (maix.touchscreen.TouchScreen): 触摸屏设备实例。
+            disp (maix.display.Display): 显示设备实例。
+        """
+        super().__init__(ts, disp)
+        # 显示屏坐标下的触摸区域 [x0, x1) x [y0, y1)
+        self._x0, self._x1 = array('i'), array('i')
+        self._y0, self._y1 = array('i'), array('i')
+        self._active = array('b')   # 组件处于按下或待点击状态
+        self._hittable = array('b') # 组件可见且可用
+        self._slots = []            # 每一行对应的组件，已删除的行为 None
+        self._slot_of = {}          # 组件 ID -> 行下标
+        self._dead = 0              # 空位的数量
+        self._map_key = None
+
+    def add_widget(self, widget: Widget) -> int:
+        """向管理器中添加一个组件。
+
+        Args:
+            widget (Widget): 要添加的组件实例。
+
+        Returns:
+            int: 组件的 ID，可用于 `get` 和 `remove`。
+
+        Raises:
+            TypeError: 如果添加的对象不是 Widget 类的实例。
+        """
+        if not isinstance(widget, Widget):
+            raise TypeError("只能添加 Widget 类的实例")
+        self._slot_of[widget.widget_id] = len(self._slots)
+        self._slots.append(widget)
+        for column in (self._x0, self._x1, self._y0, self._y1):
+            column.append(0)
+        self._active.append(0)
+        self._hittable.append(1 if (widget.visible and widget.enabled) else 0)
+        self._map_key = None
+        return self._add(widget)
+
+    def _discard(self, widget_id: int) -> Widget | None:
+        """将组件所在的行标记为空位。"""
+        widget = super()._discard(widget_id)
+        if widget is not None:
+            i = self._slot_of.pop(widget_id)
+            self._slots[i] = None
+            self._hittable[i] = self._active[i] = 0
+            self._dead += 1
+        return widget
+
+    def _compact(self):
+        """删除所有空位，保持其余组件的相对顺序。"""
+        keep = [i for i, w in enumerate(self._slots) if w is not None]
+        for name in ('_x0', '_x1', '_y0', '_y1', '_active', '_hittable'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[i] for i in keep]))
+        self._slots = [self._slots[i] for i in keep]
+        self._slot_of = {w.widget_id: i for i, w in enumerate(self._slots)}
+        self._dead = 0
+
+    def _on_widget_state_changed(self, widget: Widget):
+        """组件的可见性或可用性改变时，同步更新可交互标志列。"""
+        super()._on_widget_state_changed(widget)
+        i = self._slot_of[widget.widget_id]
+        self._hittable[i] = 1 if (widget.visible and widget.enabled) else 0
+        self._active[i] = 0
+
+    def invalidate(self):
+        """标记所有组件的显示屏坐标需要在下一帧重新计算。"""
+        self._map_key = None
+
+    def _refresh_mapping(self, img_w: int, img_h: int, disp_w: int, disp_h: int):
+        """将所有组件的触摸区域映射到显示屏坐标，并写入数组列。"""
+        for i, w in enumerate(self._slots):
+            if w is None:
+                continue
+            r = w.disp_rect = image.resize_map_pos(img_w, img_h, disp_w, disp_h, image.Fit.FIT_CONTAIN, *w.hit_rect)
+            self._x0[i], self._x1[i] = r[0], r[0] + r[2]
+            self._y0[i], self._y1[i] = r[1], r[1] + r[3]
+        self._map_key = (img_w, img_h, disp_w, disp_h)
+
+    def _candidates(self, x: int, y: int, pressed: bool | int):
+        """返回本帧需要推进状态机的组件索引及其命中结果。
+
+        只有被触摸点命中（且屏幕被按下）或仍处于按下状态的组件需要处理，
+        其余组件的状态机在本帧不会发生任何变化。
+        """
+        if np is not None:
+            x0 = np.frombuffer(self._x0, dtype=np.intc)
+            x1 = np.frombuffer(self._x1, dtype=np.intc)
+            y0 = np.frombuffer(self._y0, dtype=np.intc)
+            y1 = np.frombuffer(self._y1, dtype=np.intc)
+            hittable = np.frombuffer(self._hittable, dtype=np.int8).astype(bool)
+            hit = (x0 < x) & (x < x1) & (y0 < y) & (y < y1) & hittable
+            need = np.frombuffer(self._active, dtype=np.int8).astype(bool)
+            if pressed:
+                need = need | hit
+            idx = np.flatnonzero(need)
+            return zip(idx.tolist(), hit[idx].tolist())
+        x0, x1, y0, y1 = self._x0, self._x1, self._y0, self._y1
+        result = []
+        for i, hittable in enumerate(self._hittable):
+            is_hit = hittable and x0[i] < x < x1[i] and y0[i] < y < y1[i]
+            if self._active[i] or (pressed and is_hit):
+                result.append((i, bool(is_hit)))
+        return result
+
+    def handle_events(self, img: image.Image, draw: bool | Collection[Widget] = True):
+        """处理所有受管组件的事件并进行绘制。
+
+        Args:
+            img (maix.image.Image): 绘制组件的目标图像，其尺寸决定组件坐标到显示屏坐标的映射。
+            draw (bool | Collection[Widget]): 是否绘制组件。为 False 时只处理触摸事件，例如在
+                `UILayer` 不需要重绘的帧中；为组件的集合时只绘制其中的组件，见 `UILayer.draw`。
+        """
+        if self._dead > len(self._slots) // 2:
+            self._compact()
+        self._set.refresh()
+        x, y, pressed = self.ts.read()
+        if pressed:
+            activity.poke()
+        map_key = (img.width(), img.height(), self.disp.width(), self.disp.height())
+        if map_key != self._map_key:
+            self._refresh_mapping(*map_key)
+
+        slots = self._slots
+        for i, is_hit in self._candidates(x, y, pressed):
+            w = slots[i]
+            if w is None:  # 已在本帧的回调中被删除
+                continue
+            w.handle_touch(x, y, pressed, is_hit)
+            self._active[i] = 1 if (w.is_pressed or w.click_armed) else 0
+
+        if draw:
+            only = None if draw is True else draw
+            for w in self._set.drawn.values():
+                if only is None or w in only:
+                    w.draw(img)
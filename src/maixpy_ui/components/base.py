@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+import maix.image as image
+import maix.touchscreen as touchscreen
+import maix.display as display
+import itertools
+import weakref
+from typing import Callable, Collection, Sequence
+
+from ..core.dispatch import invoke
+from ..core.tween import scheduler as tweens
+from ..core.power import activity
+
+class Widget:
+    """所有可交互组件的基类。
+
+    该类统一实现了颜色转换、命中测试以及“按下-释放”点击状态机，
+    具体组件只需实现 `draw` 并在 `_on_click` 中响应点击。
+    所有子类都应声明 `__slots__`，以避免每个实例携带 `__dict__`。
+
+    Attributes:
+        rect (list[int]): 组件的触摸区域 `[x, y, w, h]`。
+        callback (Callable | None): 组件被操作时调用的函数。
+        is_pressed (bool): 组件当前是否处于按下状态。
+        click_armed (bool): 是否已在组件内按下，等待释放以完成一次点击。
+        disp_rect (list[int]): 触摸区域映射到显示屏坐标后的矩形。
+        widget_id (int): 组件的唯一 ID，在创建时分配且不会改变。
+        visible (bool): 组件是否可见。不可见的组件既不绘制也不响应触摸。
+        enabled (bool): 组件是否可用。不可用的组件照常绘制，但不响应触摸。
+    """
+    __slots__ = ('widget_id', 'rect', 'callback', 'is_pressed', 'click_armed', 'disp_rect',
+                 '_visible', '_enabled', '_owners')
+
+    _next_id = itertools.count(1)
+
+    # 按下后手指移出组件时是否立即取消点击
+    CANCEL_ON_LEAVE = False
+    # 组件状态切换动画的默认时长（秒）
+    ANIMATION_DURATION = 0.15
+
+    def __init__(self, rect: Sequence[int], callback: Callable | None=None):
+        """初始化组件的公共状态。
+
+        Args:
+            rect (Sequence[int]): 组件的触摸区域 `[x, y, w, h]`。
+            callback (callable | None, optional): 组件被操作时调用的函数。
+        """
+        self.widget_id = next(Widget._next_id)
+        self.rect = rect
+        self.callback = callback
+        self.is_pressed = False
+        self.click_armed = False
+        self.disp_rect = [0, 0, 0, 0]
+        self._visible = True
+        self._enabled = True
+        self._owners = ()  # 管理此组件的管理器的弱引用
+
+    @property
+    def visible(self) -> bool:
+        """组件是否可见。"""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool):
+        value = bool(value)
+        if value != self._visible:
+            self._visible = value
+            self._state_changed()
+
+    @property
+    def enabled(self) -> bool:
+        """组件是否可用。"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        value = bool(value)
+        if value != self._enabled:
+            self._enabled = value
+            self._state_changed()
+
+    def _state_changed(self):
+        """可见性或可用性改变时，取消进行中的点击并通知所属的管理器。"""
+        if not (self._visible and self._enabled):
+            self.is_pressed = False
+            self.click_armed = False
+        activity.poke()
+        for ref in self._owners:
+            manager = ref()
+            if manager is not None:
+                manager._on_widget_state_changed(self)
+
+    @staticmethod
+    def _normalize_color(color: Sequence[int] | None):
+        """将元组颜色转换为 maix.image.Color 对象。"""
+        if color is None:
+            return None
+        if isinstance(color, tuple):
+            if len(color) == 3:
+                return image.Color.from_rgb(color[0], color[1], color[2])
+            else:
+                raise ValueError("颜色元组必须是 3 个元素的 RGB 格式")
+        return color
+
+    @staticmethod
+    def _is_in_rect(x: int, y: int, rect: Sequence[int]):
+        """检查坐标 (x, y) 是否在指定的矩形区域内。"""
+        return rect[0] < x < rect[0] + rect[2] and \
+               rect[1] < y < rect[1] + rect[3]
+
+    def _on_click(self):
+        """完成一次点击时调用，子类按需重写。"""
+        if self.callback is not None:
+            invoke(self.callback, owner=self)
+
+    def _animate(self, attr: str, end, duration: float | None = None):
+        """通过共享的动画调度器将属性过渡到 `end`。"""
+        tweens.animate(self, attr, end, self.ANIMATION_DURATION if duration is None else duration)
+
+    @property
+    def hit_rect(self):
+        """用于命中测试的区域（图像坐标），默认即 `rect`。"""
+        return self.rect
+
+    @property
+    def bounds(self) -> list | None:
+        """动画播放期间组件可能覆盖的区域 `[x, y, w, h]`（图像坐标）。
+
+        `UILayer` 只重绘动画中的组件时，先将该区域清为透明再重绘组件。
+        默认为 None，表示区域未知，此时 UI 层会整体重绘。有动画的组件应重写此属性。
+        """
+        return None
+
+    def handle_event(self, x: int, y: int, pressed: bool | int, img_w: int, img_h: int, disp_w: int, disp_h: int):
+        """处理触摸事件并更新组件状态。
+
+        Args:
+            x (int): 触摸点的 X 坐标。
+            y (int): 触摸点的 Y 坐标。
+            pressed (bool | int): 触摸屏是否被按下。
+            img_w (int): 图像缓冲区的宽度。
+            img_h (int): 图像缓冲区的高度。
+            disp_w (int): 显示屏的宽度。
+            disp_h (int): 显示屏的高度。
+        """
+        r = self.disp_rect = image.resize_map_pos(img_w, img_h, disp_w, disp_h, image.Fit.FIT_CONTAIN, *self.hit_rect)
+        self.handle_touch(x, y, pressed, r[0] < x < r[0] + r[2] and r[1] < y < r[1] + r[3])
+
+    def handle_touch(self, x: int, y: int, pressed: bool | int, is_hit: bool):
+        """在已完成命中测试的前提下推进组件的状态机。
+
+        调用前 `disp_rect` 必须已更新为当前的显示屏坐标。管理器可以批量完成
+        命中测试后直接调用此方法，从而跳过 `handle_event` 中的坐标映射。
+
+        Args:
+            x (int): 触摸点的 X 坐标。
+            y (int): 触摸点的 Y 坐标。
+            pressed (bool | int): 触摸屏是否被按下。
+            is_hit (bool): 触摸点是否落在 `disp_rect` 内。
+        """
+        if pressed:
+            if is_hit:
+                if not self.click_armed:
+                    self.click_armed = self.is_pressed = True
+            elif self.CANCEL_ON_LEAVE and self.click_armed:
+                self.click_armed = self.is_pressed = False
+        elif self.click_armed:
+            self.click_armed = self.is_pressed = False
+            if is_hit:
+                self._on_click()
+
+    def draw(self, img: image.Image):
+        """在指定的图像上绘制组件。
+
+        组件只通过 `Canvas` 接口中的方法绘制，因此 `img` 也可以是 `NumpyCanvas`
+        等其他绘图后端。
+
+        Args:
+            img (maix.image.Image | Canvas): 绘制组件的目标图像。
+
+        Raises:
+            NotImplementedError: 如果子类没有实现此方法。
+        """
+        raise NotImplementedError("每个组件都必须实现 draw 方法")
+
+
+class WidgetSet:
+    """按添加顺序保存一组组件，以及其中可见和可交互的子集。
+
+    三个集合都是以组件 ID 为键的字典，添加和删除都是 O(1)，且迭代顺序
+    始终与添加顺序一致。组件的可见性或可用性改变后，只需将 `dirty` 置为
+    True，两个子集会在下一次 `refresh()` 时按添加顺序重建。
+    """
+    __slots__ = ('all', 'drawn', 'interactive', 'dirty')
+
+    def __init__(self):
+        """创建一个空的组件集合。"""
+        self.all = {}
+        self.drawn = {}        # 可见的组件
+        self.interactive = {}  # 可见且可用的组件
+        self.dirty = False
+
+    def add(self, widget: Widget):
+        """添加一个组件。"""
+        wid = widget.widget_id
+        self.all[wid] = widget
+        if widget._visible:
+            self.drawn[wid] = widget
+            if widget._enabled:
+                self.interactive[wid] = widget
+
+    def discard(self, widget_id: int):
+        """移除一个组件，返回被移除的组件；不存在时返回 None。"""
+        self.drawn.pop(widget_id, None)
+        self.interactive.pop(widget_id, None)
+        return self.all.pop(widget_id, None)
+
+    def refresh(self):
+        """如果有组件的状态发生了改变，则按添加顺序重建两个子集。"""
+        if self.dirty:
+            self.drawn = {k: w for k, w in self.all.items() if w._visible}
+            self.interactive = {k: w for k, w in self.drawn.items() if w._enabled}
+            self.dirty = False
+
+
+class BaseManager:
+    """组件管理器的基类。
+
+    管理器以组件 ID 为键保存组件，添加、查找和删除都是 O(1)，迭代顺序与
+    添加顺序一致。绘制和命中测试只遍历可见（以及可用）的组件；组件的
+    `visible` / `enabled` 改变后，活动集合会在下一帧重建一次，因此隐藏的
+    组件在每帧的热路径中没有任何开销。
+    """
+
+    def __init__(self, ts: touchscreen.TouchScreen, disp: display.Display):
+        """初始化管理器。
+
+        Args:
+            ts (maix.touchscreen.TouchScreen): 触摸屏设备实例。
+            disp (maix.display.Display): 显示设备实例。
+        """
+        self.ts = ts
+        self.disp = disp
+        self._set = WidgetSet()
+
+    @property
+    def widgets(self) -> list:
+        """按添加顺序排列的所有组件（新建的列表）。"""
+        return list(self._set.all.values())
+
+    def __len__(self):
+        return len(self._set.all)
+
+    def __contains__(self, widget: Widget):
+        return self._set.all.get(widget.widget_id) is widget
+
+    def get(self, widget_id: int) -> Widget | None:
+        """根据组件 ID 查找组件。
+
+        Args:
+            widget_id (int): 组件的 ID，即添加时返回的值。
+
+        Returns:
+            Widget | None: 找到的组件，如果不存在则返回 None。
+        """
+        return self._set.all.get(widget_id)
+
+    def _add(self, widget: Widget) -> int:
+        """登记一个组件，并让它在状态改变时通知本管理器。"""
+        self._set.add(widget)
+        self._watch(widget)
+        return widget.widget_id
+
+    def _watch(self, widget: Widget):
+        """让组件在可见性或可用性改变时通知本管理器。"""
+        widget._owners += (weakref.ref(self),)
+
+    def _unwatch(self, widget: Widget):
+        """解除组件与本管理器的关联，并取消其进行中的点击。"""
+        widget._owners = tuple(ref for ref in widget._owners if ref() is not self)
+        widget.is_pressed = False
+        widget.click_armed = False
+
+    def _discard(self, widget_id: int) -> Widget | None:
+        """从存储中移除组件，返回被移除的组件。"""
+        return self._set.discard(widget_id)
+
+    def remove(self, widget: Widget | int) -> bool:
+        """从管理器中移除一个组件，耗时为 O(1)。
+
+        Args:
+            widget (Widget | int): 要移除的组件实例或其 ID。
+
+        Returns:
+            bool: 如果成功移除则返回 True，否则返回 False。
+        """
+        widget_id = widget if isinstance(widget, int) else widget.widget_id
+        removed = self._discard(widget_id)
+        if removed is None:
+            return False
+        self._unwatch(removed)
+        return True
+
+    def _on_widget_state_changed(self, widget: Widget):
+        """组件的可见性或可用性改变时由组件调用。"""
+        self._set.dirty = True
+
+    def handle_events(self, img: image.Image, draw: bool | Collection[Widget] = True):
+        """处理所有可交互组件的事件，并绘制所有可见组件。
+
+        Args:
+            img (maix.image.Image): 绘制组件的目标图像，其尺寸决定组件坐标到显示屏坐标的映射。
+            draw (bool | Collection[Widget]): 是否绘制组件。为 False 时只处理触摸事件，例如在
+                `UILayer` 不需要重绘的帧中；为组件的集合时只绘制其中的组件，见 `UILayer.draw`。
+        """
+        self._set.refresh()
+        x, y, pressed = self.ts.read()
+        if pressed:
+            activity.poke()
+        img_w, img_h = img.width(), img.height()
+        disp_w, disp_h = self.disp.width(), self.disp.height()
+        for w in list(self._set.interactive.values()):
+            w.handle_event(x, y, pressed, img_w, img_h, disp_w, disp_h)
+        if draw:
+            only = None if draw is True else draw
+            for w in self._set.drawn.values():
+                if only is None or w in only:
+                    w.draw(img)
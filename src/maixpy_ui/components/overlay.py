@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import maix.image as image
+import math
+from typing import Sequence
+
+from .base import Widget
+from ..core.canvas import NumpyCanvas
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时逐个检测框剔除和绘制
+    np = None
+
+# 默认的类别颜色 (R, G, B)，类别编号超出时循环使用
+DEFAULT_PALETTE = (
+    (0, 120, 255), (255, 60, 60), (60, 220, 60), (255, 200, 0),
+    (200, 0, 255), (0, 220, 220), (255, 120, 0), (255, 255, 255),
+)
+
+
+def _numpy_canvas(img):
+    """返回图像的零拷贝 NumPy 视图；不是 RGB888 图像时返回 None。"""
+    if np is None:
+        return None
+    if isinstance(img, NumpyCanvas):
+        img = img.array
+    if isinstance(img, np.ndarray):
+        return img if img.ndim == 3 and img.shape[2] == 3 and img.dtype == np.uint8 else None
+    if img.format() != image.Format.FMT_RGB888:
+        return None
+    return image.image2cv(img, ensure_bgr=False, copy=False)
+
+
+def _spans(starts, lengths):
+    """将若干段 `[start, start + length)` 展开为一个下标数组。"""
+    total = int(lengths.sum())
+    ends = np.cumsum(lengths)
+    return np.repeat(starts - (ends - lengths), lengths) + np.arange(total)
+
+
+class DetectionOverlay(Widget):
+    """批量绘制检测框的叠加层组件。
+
+    检测框以 `(N, 4+)` 的数组 `(x, y, w, h, ...)` 传入，可以附带每个框的
+    标签和类别。绘制时先一次性剔除宽或高小于 `min_size`、或完全落在 `view`
+    之外的框；部分伸出 `view` 的框只绘制落在 `view` 内的边，伸出去的边
+    不会被画在 `view` 的边缘上。
+
+    对 RGB888 图像（以及 RGB 的 `NumpyCanvas` 或 NumPy 数组），所有边框的像素下标和颜色会
+    被展开为数组，每条边框厚度只需两次切片赋值即可画完全部的横边和竖边，
+    调用次数与检测框的数量无关；其他格式逐框调用 `draw_rect`。标签仍需逐个
+    调用 `draw_string`，其尺寸按文本缓存，并可以用 `max_labels` 限制数量。
+
+    叠加层不响应触摸，可以和其他组件一样交给管理器绘制，也可以直接调用
+    `draw`。
+
+    Attributes:
+        view (list[int] | None): 可见区域 `[x, y, w, h]`，为 None 时为整幅图像。
+        scale (float): 绘制前对检测框坐标的缩放比例，用于检测分辨率与绘制分辨率不同的情况。
+        thickness (int): 边框厚度（像素）。
+        min_size (int): 宽或高小于该值（缩放后）的检测框不绘制。
+        max_labels (int | None): 最多绘制的标签数量，为 None 时不限制。
+        drawn (int): 上一次绘制的检测框数量。
+        culled (int): 上一次被剔除的检测框数量。
+    """
+    __slots__ = ('view', 'scale', 'thickness', 'min_size', 'max_labels', 'text_scale', 'font',
+                 'class_names', 'drawn', 'culled', '_boxes', '_classes', '_labels',
+                 '_palette', '_palette_colors', '_metrics')
+
+    # 缓存的标签尺寸数量上限，超过时清空重建
+    MAX_CACHED_LABELS = 256
+
+    def __init__(self, view: Sequence[int] | None = None, palette: Sequence[Sequence[int]] = DEFAULT_PALETTE,
+                 thickness: int = 2, min_size: int = 2, scale: float = 1.0, text_scale: float = 1.0,
+                 font: str | None = None, class_names: Sequence[str] | None = None,
+                 max_labels: int | None = None):
+        """初始化检测框叠加层。
+
+        Args:
+            view (Sequence[int] | None): 可见区域 `[x, y, w, h]`，为 None 时为整幅图像。
+            palette (Sequence[Sequence[int]]): 类别颜色 (R, G, B) 列表，第 k 类使用
+                `palette[k % len(palette)]`。
+            thickness (int): 边框厚度（像素）。
+            min_size (int): 宽或高小于该值的检测框不绘制。
+            scale (float): 检测框坐标的缩放比例。
+            text_scale (float): 标签文本的缩放比例。
+            font (str | None, optional): 标签使用的字体文件路径。默认为 None。
+            class_names (Sequence[str] | None): 类别名称，没有逐框标签时以此作为标签。
+            max_labels (int | None): 最多绘制的标签数量。
+
+        Raises:
+            ValueError: 如果 `palette` 为空或 `thickness` 小于 1。
+        """
+        if not palette:
+            raise ValueError("palette 不能为空")
+        if thickness < 1:
+            raise ValueError("thickness 至少为 1")
+        super().__init__(list(view) if view is not None else [0, 0, 0, 0])
+        self._enabled = False  # 叠加层只绘制，不参与命中测试
+        self.view = list(view) if view is not None else None
+        self.scale = scale
+        self.thickness = thickness
+        self.min_size = min_size
+        self.max_labels = max_labels
+        self.text_scale = text_scale
+        self.font = font
+        self.class_names = list(class_names) if class_names is not None else None
+        self.drawn = 0
+        self.culled = 0
+        self._boxes = None
+        self._classes = None
+        self._labels = None
+        self._metrics = {}  # (标签文本, 缩放比例, 字体) -> (宽, 高)
+        self.set_palette(palette)
+
+    def set_palette(self, palette: Sequence[Sequence[int]]):
+        """修改类别颜色。
+
+        Args:
+            palette (Sequence[Sequence[int]]): 类别颜色 (R, G, B) 列表。
+        """
+        colors = [tuple(c) for c in palette]
+        self._palette_colors = [self._normalize_color(c) for c in colors]
+        self._palette = np.array(colors, dtype=np.uint8) if np is not None else colors
+
+    def set_boxes(self, boxes, labels: Sequence[str] | None = None, classes=None):
+        """设置要绘制的检测框，替换之前的全部检测框。
+
+        Args:
+            boxes (numpy.ndarray | Sequence): 形状为 `(N, 4+)` 的检测框 `(x, y, w, h, ...)`，
+                只使用前四列。
+            labels (Sequence[str] | None): 每个检测框的标签，为 None 时使用 `class_names`。
+            classes (numpy.ndarray | Sequence[int] | None): 每个检测框的类别，决定颜色和
+                默认标签，为 None 时全部为第 0 类。
+        """
+        n = len(boxes)
+        if np is not None:
+            if n:
+                self._boxes = np.asarray(boxes, dtype=np.float64).reshape(n, -1)[:, :4]
+            else:
+                self._boxes = np.zeros((0, 4))
+            self._classes = np.zeros(n, np.intp) if classes is None else np.asarray(classes, dtype=np.intp)
+        else:
+            self._boxes = [tuple(b[:4]) for b in boxes]
+            self._classes = [0] * n if classes is None else [int(c) for c in classes]
+        self._labels = list(labels) if labels is not None else None
+
+    def clear(self):
+        """清除所有检测框。"""
+        self.set_boxes(())
+
+    def __len__(self):
+        return 0 if self._boxes is None else len(self._boxes)
+
+    def _view(self, img_w: int, img_h: int):
+        """返回裁剪到图像内的可见区域 `(x0, y0, x1, y1)`（不含 x1、y1）。"""
+        if self.view is None:
+            return 0, 0, img_w, img_h
+        x, y, w, h = self.view
+        return max(0, x), max(0, y), min(img_w, x + w), min(img_h, y + h)
+
+    def _label_for(self, i: int, cls: int) -> str | None:
+        """返回第 i 个检测框的标签。"""
+        if self._labels is not None:
+            return self._labels[i]
+        if self.class_names is not None and 0 <= cls < len(self.class_names):
+            return self.class_names[cls]
+        return None
+
+    def _text_size(self, text: str):
+        """返回标签的尺寸，按文本、缩放比例和字体缓存。"""
+        key = (text, self.text_scale, self.font)
+        size = self._metrics.get(key)
+        if size is None:
+            if len(self._metrics) >= self.MAX_CACHED_LABELS:
+                self._metrics.clear()
+            s = image.string_size(text, scale=self.text_scale, font=self.font or "")
+            size = self._metrics[key] = (s[0], s[1])
+        return size
+
+    def _visible_boxes(self, img_w: int, img_h: int):
+        """剔除检测框，返回 (下标, x0, y0, x1, y1, 类别)，坐标包含端点且未裁剪。"""
+        vx0, vy0, vx1, vy1 = self._view(img_w, img_h)
+        if np is not None:
+            b = self._boxes * self.scale if self.scale != 1.0 else self._boxes
+            x0, y0 = np.floor(b[:, 0]).astype(np.intp), np.floor(b[:, 1]).astype(np.intp)
+            w, h = np.rint(b[:, 2]).astype(np.intp), np.rint(b[:, 3]).astype(np.intp)
+            x1, y1 = x0 + w - 1, y0 + h - 1
+            keep = ((w >= max(self.min_size, 1)) & (h >= max(self.min_size, 1))
+                    & (x1 >= vx0) & (x0 < vx1) & (y1 >= vy0) & (y0 < vy1))
+            idx = np.flatnonzero(keep)
+            return idx, x0[idx], y0[idx], x1[idx], y1[idx], self._classes[idx]
+        result = ([], [], [], [], [], [])
+        for i, (bx, by, bw, bh) in enumerate(self._boxes):
+            x0, y0 = math.floor(bx * self.scale), math.floor(by * self.scale)
+            w, h = round(bw * self.scale), round(bh * self.scale)
+            x1, y1 = x0 + w - 1, y0 + h - 1
+            if w < max(self.min_size, 1) or h < max(self.min_size, 1):
+                continue
+            if x1 < vx0 or x0 >= vx1 or y1 < vy0 or y0 >= vy1:
+                continue
+            for column, v in zip(result, (i, x0, y0, x1, y1, self._classes[i])):
+                column.append(v)
+        return result
+
+    def _draw_numpy(self, canvas, view, x0, y0, x1, y1, classes):
+        """通过切片赋值在 NumPy 画布上一次画完所有边框。
+
+        横边的列范围和竖边的行范围裁剪到 `view` 内；边本身所在的行或列落在
+        `view` 之外时不绘制。
+        """
+        vx0, vy0, vx1, vy1 = view
+        colors = self._palette[classes % len(self._palette)]
+        cx0, cx1 = np.maximum(x0, vx0), np.minimum(x1, vx1 - 1)
+        cy0, cy1 = np.maximum(y0, vy0), np.minimum(y1, vy1 - 1)
+        widths, heights = cx1 - cx0 + 1, cy1 - cy0 + 1
+        cols = _spans(cx0, widths)
+        rows = _spans(cy0, heights)
+        row_colors = np.repeat(colors, widths, axis=0)
+        col_colors = np.repeat(colors, heights, axis=0)
+        top, bottom = np.repeat(y0, widths), np.repeat(y1, widths)
+        left, right = np.repeat(x0, heights), np.repeat(x1, heights)
+        for k in range(self.thickness):
+            # 边框向框内加厚，不超过框的中线
+            for r in (np.minimum(top + k, bottom), np.maximum(bottom - k, top)):
+                inside = (r >= vy0) & (r < vy1)
+                canvas[r[inside], cols[inside]] = row_colors[inside]
+            for c in (np.minimum(left + k, right), np.maximum(right - k, left)):
+                inside = (c >= vx0) & (c < vx1)
+                canvas[rows[inside], c[inside]] = col_colors[inside]
+
+    def _draw_rect(self, img: image.Image, view, x0: int, y0: int, x1: int, y1: int, color: image.Color):
+        """用 `draw_rect` 绘制一个边框，只绘制落在 `view` 内的部分。"""
+        vx0, vy0, vx1, vy1 = view
+        if x0 >= vx0 and y0 >= vy0 and x1 < vx1 and y1 < vy1:
+            img.draw_rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1, color=color, thickness=self.thickness)
+            return
+        t = self.thickness - 1
+        # 四条边各为一个实心矩形 (x0, y0, x1, y1)，坐标包含端点
+        for sx0, sy0, sx1, sy1 in ((x0, y0, x1, min(y0 + t, y1)), (x0, max(y1 - t, y0), x1, y1),
+                                   (x0, y0, min(x0 + t, x1), y1), (max(x1 - t, x0), y0, x1, y1)):
+            sx0, sy0, sx1, sy1 = max(sx0, vx0), max(sy0, vy0), min(sx1, vx1 - 1), min(sy1, vy1 - 1)
+            if sx0 <= sx1 and sy0 <= sy1:
+                img.draw_rect(sx0, sy0, sx1 - sx0 + 1, sy1 - sy0 + 1, color=color, thickness=-1)
+
+    def draw(self, img: image.Image):
+        """在指定的图像上绘制所有可见的检测框及其标签。
+
+        Args:
+            img (maix.image.Image | NumpyCanvas | numpy.ndarray): 目标图像。传入 `(高, 宽, 3)`
+                的 NumPy 数组时只绘制边框，不绘制标签。
+        """
+        if not len(self):
+            self.drawn = self.culled = 0
+            return
+        canvas = _numpy_canvas(img)
+        if canvas is not None:
+            img_h, img_w = canvas.shape[:2]
+        else:
+            img_w, img_h = img.width(), img.height()
+        view = self._view(img_w, img_h)
+        idx, x0, y0, x1, y1, classes = self._visible_boxes(img_w, img_h)
+        self.drawn = len(idx)
+        self.culled = len(self) - self.drawn
+        if not self.drawn:
+            return
+        if canvas is not None:
+            self._draw_numpy(canvas, view, x0, y0, x1, y1, classes)
+        if np is not None:
+            idx, x0, y0, x1, y1, classes = (a.tolist() for a in (idx, x0, y0, x1, y1, classes))
+        palette = self._palette_colors
+        if canvas is None:
+            for bx0, by0, bx1, by1, cls in zip(x0, y0, x1, y1, classes):
+                self._draw_rect(img, view, bx0, by0, bx1, by1, palette[cls % len(palette)])
+        if (self._labels is None and self.class_names is None) or (np is not None and isinstance(img, np.ndarray)):
+            return
+        limit = self.drawn if self.max_labels is None else min(self.drawn, self.max_labels)
+        font = self.font or ""
+        for i, bx0, by0, cls in zip(idx[:limit], x0, y0, classes):
+            text = self._label_for(i, cls)
+            if not text:
+                continue
+            text_w, text_h = self._text_size(text)
+            bx0, by0 = max(bx0, view[0]), max(by0, view[1])
+            tx = max(0, min(bx0, img_w - text_w))
+            ty = by0 - text_h - 2 if by0 >= text_h + 2 else by0 + self.thickness + 2
+            img.draw_string(tx, ty, text, color=palette[cls % len(palette)],
+                            scale=self.text_scale, font=font)
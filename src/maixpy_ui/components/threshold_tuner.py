@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .button import Button
+from .slider import Slider
+from ..core.dispatch import invoke
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时不提供 lower/upper 数组
+    np = None
+
+# 每个颜色空间的三个通道：(名称, 最小值, 最大值)。
+# LAB 的范围与 find_blobs 相同，HSV 的范围与 OpenCV 的 8 位图像相同。
+CHANNELS: Dict[str, Tuple[Tuple[str, int, int], ...]] = {
+    'lab': (('L', 0, 100), ('A', -128, 127), ('B', -128, 127)),
+    'hsv': (('H', 0, 180), ('S', 0, 255), ('V', 0, 255)),
+}
+
+_BOUND_NAMES = ('Min', 'Max')
+
+
+class ThresholdTuner:
+    """将颜色阈值绑定到编辑组件上的阈值调节器。
+
+    阈值为 `[c0_min, c0_max, c1_min, c1_max, c2_min, c2_max]`，每个颜色空间
+    各保存一份。调节器通过 `CHANNELS` 表把一个滑块映射到当前选中的通道
+    和上下界：滑块的 0~100 按表中的范围线性换算为阈值，按钮和滑块的
+    标签也由表生成，不需要为每个通道单独编写分支。
+
+    只有阈值真正改变时 `version` 才会递增，`lower`、`upper` 等供分割使用
+    的数据也只在此时重新生成，因此每帧读取它们不会产生任何分配。
+
+    Attributes:
+        space (str): 当前的颜色空间，`'lab'` 或 `'hsv'`。
+        channel (int): 当前编辑的通道（0~2）。
+        bound (int): 当前编辑的是下界（0）还是上界（1）。
+        version (int): 阈值的版本号，每次阈值改变时递增。
+        callback (Callable | None): 阈值改变时调用的函数，参数为当前阈值列表。
+    """
+
+    def __init__(self, space: str = 'lab', thresholds: Dict[str, Sequence[int]] | None = None,
+                 callback: Callable | None = None):
+        """初始化阈值调节器。
+
+        Args:
+            space (str): 初始的颜色空间。
+            thresholds (dict | None): 各颜色空间的初始阈值，未给出的颜色空间使用
+                完整的通道范围。
+            callback (Callable | None): 阈值改变时调用的函数。
+
+        Raises:
+            ValueError: 如果颜色空间未知或阈值长度不为 6。
+        """
+        if space not in CHANNELS:
+            raise ValueError(f"未知的颜色空间 '{space}'")
+        self._thresholds = {}
+        for name, channels in CHANNELS.items():
+            values = (thresholds or {}).get(name)
+            if values is None:
+                values = [v for _, lo, hi in channels for v in (lo, hi)]
+            if len(values) != 6:
+                raise ValueError("阈值必须包含 6 个值")
+            self._thresholds[name] = [int(v) for v in values]
+        self.space = space
+        self.channel = 0
+        self.bound = 0
+        self.version = 0
+        self.callback = callback
+        self._slider = None
+        self._mode_button = None
+        self._channel_buttons = []
+        self._cache_version = -1
+        self._lower = self._upper = None
+        self._blob_thresholds = None
+
+    @property
+    def threshold(self) -> List[int]:
+        """当前颜色空间的阈值，返回的列表不应被修改。"""
+        return self._thresholds[self.space]
+
+    def get_threshold(self, space: str) -> List[int]:
+        """返回指定颜色空间的阈值副本。"""
+        return list(self._thresholds[space])
+
+    def set_value(self, index: int, value: int) -> bool:
+        """设置当前颜色空间阈值中的一项。
+
+        Args:
+            index (int): 阈值下标（0~5），即 `通道 * 2 + 上下界`。
+            value (int): 新的值，会被限制在通道的范围内。
+
+        Returns:
+            bool: 阈值是否真的发生了改变。
+        """
+        _, lo, hi = CHANNELS[self.space][index // 2]
+        value = min(max(int(value), lo), hi)
+        values = self._thresholds[self.space]
+        if values[index] == value:
+            return False
+        values[index] = value
+        self._changed()
+        return True
+
+    def _changed(self):
+        """阈值或颜色空间改变后递增版本号并通知回调。"""
+        self.version += 1
+        if self.callback is not None:
+            invoke(self.callback, self.threshold, owner=self)
+
+    def _refresh_cache(self):
+        """版本号改变时重新生成分割用的数据。"""
+        if self._cache_version == self.version:
+            return
+        values = self.threshold
+        self._blob_thresholds = [list(values)]
+        if np is not None:
+            self._lower = np.array(values[0::2], dtype=np.int16 if self.space == 'lab' else np.uint8)
+            self._upper = np.array(values[1::2], dtype=np.int16 if self.space == 'lab' else np.uint8)
+        self._cache_version = self.version
+
+    @property
+    def lower(self):
+        """当前阈值的下界数组，可直接传给 `cv2.inRange`。"""
+        self._refresh_cache()
+        return self._lower
+
+    @property
+    def upper(self):
+        """当前阈值的上界数组，可直接传给 `cv2.inRange`。"""
+        self._refresh_cache()
+        return self._upper
+
+    @property
+    def blob_thresholds(self) -> List[List[int]]:
+        """可直接传给 `find_blobs` 或 `binary` 的 `thresholds` 参数。"""
+        self._refresh_cache()
+        return self._blob_thresholds
+
+    @property
+    def index(self) -> int:
+        """当前编辑的阈值下标。"""
+        return self.channel * 2 + self.bound
+
+    def label_for(self, channel: int, bound: int | None = None) -> str:
+        """生成通道的标签，例如 `"L Min"`。"""
+        name = CHANNELS[self.space][channel][0]
+        return f"{name} {_BOUND_NAMES[self.bound if bound is None else bound]}"
+
+    def to_percent(self, value: int, channel: int | None = None) -> int:
+        """将阈值换算为滑块的 0~100。"""
+        _, lo, hi = CHANNELS[self.space][self.channel if channel is None else channel]
+        return int((value - lo) * 100 / (hi - lo))
+
+    def from_percent(self, percent: int, channel: int | None = None) -> int:
+        """将滑块的 0~100 换算为阈值。"""
+        _, lo, hi = CHANNELS[self.space][self.channel if channel is None else channel]
+        return int(lo + percent * (hi - lo) / 100)
+
+    def set_space(self, space: str):
+        """切换颜色空间，并回到第一个通道的下界。
+
+        Raises:
+            ValueError: 如果颜色空间未知。
+        """
+        if space not in CHANNELS:
+            raise ValueError(f"未知的颜色空间 '{space}'")
+        if space != self.space:
+            self.space = space
+            self.channel = self.bound = 0
+            self._changed()
+        self._sync_widgets()
+
+    def toggle_space(self):
+        """在颜色空间之间轮流切换。"""
+        names = list(CHANNELS)
+        self.set_space(names[(names.index(self.space) + 1) % len(names)])
+
+    def select(self, channel: int):
+        """选中一个通道；再次选中同一通道时在下界与上界之间切换。
+
+        Args:
+            channel (int): 通道（0~2）。
+        """
+        if channel == self.channel:
+            self.bound ^= 1
+        else:
+            self.channel = channel
+        self._sync_widgets()
+
+    def on_slider(self, percent: int):
+        """滑块的回调：将 0~100 换算为当前通道和上下界的阈值。"""
+        self.set_value(self.index, self.from_percent(percent))
+
+    def bind(self, slider: Slider | None = None, mode_button: Button | None = None,
+             channel_buttons: Sequence[Button] = ()):
+        """将调节器绑定到编辑组件，并接管它们的回调和标签。
+
+        Args:
+            slider (Slider | None): 编辑当前阈值的滑块，范围应为 0~100。
+            mode_button (Button | None): 切换颜色空间的按钮。
+            channel_buttons (Sequence[Button]): 三个通道的按钮，依次对应通道 0~2。
+        """
+        self._slider = slider
+        self._mode_button = mode_button
+        self._channel_buttons = list(channel_buttons)
+        if slider is not None:
+            slider.callback = self.on_slider
+        if mode_button is not None:
+            mode_button.callback = self.toggle_space
+        for channel, button in enumerate(self._channel_buttons):
+            button.callback = lambda channel=channel: self.select(channel)
+        self._sync_widgets()
+
+    def _sync_widgets(self):
+        """根据当前状态更新绑定组件的标签和滑块位置。"""
+        if self._mode_button is not None:
+            self._mode_button.label = self.space.upper()
+        for channel, button in enumerate(self._channel_buttons):
+            button.label = self.label_for(channel)
+        if self._slider is not None:
+            self._slider.label = self.label_for(self.channel)
+            self._slider.value = self.to_percent(self.threshold[self.index])
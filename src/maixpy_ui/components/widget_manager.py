@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+import maix.image as image
+import maix.touchscreen as touchscreen
+import maix.display as display
+from bisect import bisect_left
+from typing import Collection
+
+from ..core.power import activity
+from .base import Widget, WidgetSet, BaseManager
+
+class WidgetManager(BaseManager):
+    """统一管理任意类型组件的管理器，支持 z 序和触摸事件消费。
+
+    每帧只读取一次触摸输入：先按 z 序从上到下进行命中测试，触摸点只交给
+    最上层被命中的组件（已被按下的组件会持续占有本次触摸，直到手指抬起），
+    下层组件不会同时响应；随后按 z 序从下到上绘制所有组件。
+
+    单选按钮需要先加入 `RadioManager` 以组成单选组，之后可以交由本管理器
+    统一处理事件和绘制。
+
+    组件按 z 值分层保存，每层内部以组件 ID 为键，因此添加、删除和修改
+    z 序都无需移动其他组件。
+
+    Attributes:
+        widgets (list[Widget]): 按 z 序从下到上排列的组件列表。
+    """
+
+    def __init__(self, ts: touchscreen.TouchScreen, disp: display.Display):
+        """初始化组件管理器。
+
+        Args:
+            ts (maix.touchscreen.TouchScreen): 触摸屏设备实例。
+            disp (maix.display.Display): 显示设备实例。
+        """
+        super().__init__(ts, disp)
+        self._layers = {}  # z -> 该层的 WidgetSet
+        self._zs = []      # 已有的 z 值，从小到大排列
+        self._z_of = {}    # 组件 ID -> z
+        self._map_key = None
+        self._captured = None  # 当前占有触摸的组件
+
+    @property
+    def widgets(self) -> list:
+        """按 z 序从下到上排列的所有组件（新建的列表）。"""
+        return [w for z in self._zs for w in self._layers[z].all.values()]
+
+    def add_widget(self, widget: Widget, z: int=0) -> int:
+        """向管理器中添加一个组件。
+
+        z 值越大越靠上；z 值相同的组件，后添加的位于上层。
+
+        Args:
+            widget (Widget): 要添加的组件实例。
+            z (int): 组件的 z 序。
+
+        Returns:
+            int: 组件的 ID，可用于 `get`、`set_z` 和 `remove`。
+
+        Raises:
+            TypeError: 如果添加的对象不是 Widget 类的实例。
+        """
+        if not isinstance(widget, Widget):
+            raise TypeError("只能添加 Widget 类的实例")
+        self._insert(widget, z)
+        return self._add(widget)
+
+    def _insert(self, widget: Widget, z: int):
+        """将组件放到第 z 层的最上方。"""
+        layer = self._layers.get(z)
+        if layer is None:
+            layer = self._layers[z] = WidgetSet()
+            self._zs.insert(bisect_left(self._zs, z), z)
+        layer.add(widget)
+        self._z_of[widget.widget_id] = z
+        self._map_key = None
+
+    def _take(self, widget_id: int):
+        """将组件从其所在的层中取出，空层会被一并删除。"""
+        z = self._z_of.pop(widget_id)
+        layer = self._layers[z]
+        layer.discard(widget_id)
+        if not layer.all:
+            del self._layers[z]
+            self._zs.remove(z)
+
+    def _discard(self, widget_id: int) -> Widget | None:
+        """从存储中移除组件，并释放其对触摸的占有。"""
+        widget = super()._discard(widget_id)
+        if widget is not None:
+            self._take(widget_id)
+            if self._captured is widget:
+                self._captured = None
+        return widget
+
+    def set_z(self, widget: Widget | int, z: int):
+        """修改组件的 z 序，并将其置于同一 z 值的最上层。
+
+        Args:
+            widget (Widget | int): 已添加到管理器中的组件实例或其 ID。
+            z (int): 新的 z 序。
+
+        Raises:
+            KeyError: 如果组件不在管理器中。
+        """
+        widget_id = widget if isinstance(widget, int) else widget.widget_id
+        widget = self._set.all[widget_id]
+        self._take(widget_id)
+        self._insert(widget, z)
+
+    def _on_widget_state_changed(self, widget: Widget):
+        """组件的可见性或可用性改变时，标记其所在的层需要重建活动集合。"""
+        z = self._z_of.get(widget.widget_id)
+        if z is not None:
+            self._layers[z].dirty = True
+
+    def invalidate(self):
+        """组件的 `rect` 被修改后调用，使其显示屏坐标在下一帧重新计算。"""
+        self._map_key = None
+
+    def _refresh_mapping(self, img_w: int, img_h: int, disp_w: int, disp_h: int):
+        """将所有组件的触摸区域映射到显示屏坐标。"""
+        for w in self._set.all.values():
+            w.disp_rect = image.resize_map_pos(img_w, img_h, disp_w, disp_h, image.Fit.FIT_CONTAIN, *w.hit_rect)
+        self._map_key = (img_w, img_h, disp_w, disp_h)
+
+    def _find_owner(self, x: int, y: int, pressed: bool | int):
+        """找出本帧接收触摸的组件。
+
+        正处于按下状态的组件优先；否则在屏幕被按下时选择最上层被命中的组件。
+        """
+        captured = self._captured
+        if captured is not None:
+            if captured.visible and captured.enabled:
+                return captured
+            self._captured = None
+        if pressed:
+            layers = self._layers
+            for z in reversed(self._zs):
+                for w in reversed(layers[z].interactive.values()):
+                    r = w.disp_rect
+                    if r[0] < x < r[0] + r[2] and r[1] < y < r[1] + r[3]:
+                        return w
+        return None
+
+    def handle_events(self, img: image.Image, draw: bool | Collection[Widget] = True):
+        """处理所有受管组件的事件并进行绘制。
+
+        Args:
+            img (maix.image.Image): 绘制组件的目标图像，其尺寸决定组件坐标到显示屏坐标的映射。
+            draw (bool | Collection[Widget]): 是否绘制组件。为 False 时只处理触摸事件，例如在
+                `UILayer` 不需要重绘的帧中；为组件的集合时只绘制其中的组件，见 `UILayer.draw`。
+        """
+        layers = [self._layers[z] for z in self._zs]
+        for layer in layers:
+            layer.refresh()
+        x, y, pressed = self.ts.read()
+        if pressed:
+            activity.poke()
+        map_key = (img.width(), img.height(), self.disp.width(), self.disp.height())
+        if map_key != self._map_key:
+            self._refresh_mapping(*map_key)
+
+        owner = self._find_owner(x, y, pressed)
+        if owner is not None:
+            r = owner.disp_rect
+            owner.handle_touch(x, y, pressed, r[0] < x < r[0] + r[2] and r[1] < y < r[1] + r[3])
+            self._captured = owner if (owner.is_pressed or owner.click_armed) else None
+
+        if draw:
+            only = None if draw is True else draw
+            for layer in layers:
+                for w in layer.drawn.values():
+                    if only is None or w in only:
+                        w.draw(img)
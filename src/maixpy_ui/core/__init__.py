@@ -1,2 +1,11 @@
-from .ui_manager import Page, UIManager
-from .resolution_adapter import ResolutionAdapter
\ No newline at end of file
+from .ui_manager import Page, UIManager
+from .router import Router
+from .transition import Transition, SlideTransition, FadeTransition
+from .tween import TweenScheduler
+from .timers import TimerService, TimerHandle
+from .idle import IdleScheduler, IdleTask
+from .watchdog import FrameWatchdog
+from .power import PowerSaver
+from .resolution_adapter import ResolutionAdapter
+from .canvas import Canvas, NumpyCanvas
+from .layer import UILayer
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import maix.image as image
+from typing import Dict, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumpyCanvas 需要 NumPy
+    np = None
+
+
+class Canvas:
+    """组件绘图后端的接口。
+
+    组件的 `draw` 和管理器的 `handle_events` 只通过下列方法访问目标图像，
+    方法的签名与 `maix.image.Image` 的同名方法一致，因此 `maix.image.Image`
+    本身就是默认的后端，任何实现了这些方法的对象都可以作为绘制目标传给
+    组件和管理器。颜色为 `maix.image.Color` 或 `(R, G, B)` 元组，
+    `thickness` 为 -1 时表示填充。
+    """
+
+    def width(self) -> int:
+        """画布的宽度。"""
+        raise NotImplementedError
+
+    def height(self) -> int:
+        """画布的高度。"""
+        raise NotImplementedError
+
+    def draw_rect(self, x: int, y: int, w: int, h: int, color, thickness: int = 1):
+        """绘制矩形。"""
+        raise NotImplementedError
+
+    def draw_circle(self, x: int, y: int, radius: int, color, thickness: int = 1):
+        """绘制圆。"""
+        raise NotImplementedError
+
+    def draw_line(self, x1: int, y1: int, x2: int, y2: int, color, thickness: int = 1):
+        """绘制线段。"""
+        raise NotImplementedError
+
+    def draw_string(self, x: int, y: int, text: str, color, scale: float = 1, **kwargs):
+        """绘制文本。"""
+        raise NotImplementedError
+
+
+class NumpyCanvas(Canvas):
+    """直接在帧的 NumPy 视图上绘制的后端。
+
+    矩形的填充和边框都是对数组切片的整块赋值；圆使用按 `(半径, 厚度)`
+    预先计算并缓存的布尔掩码，裁剪到画布内后一次赋值；线段的所有像素
+    坐标由向量化的插值一次算出，水平和竖直线段直接按切片赋值。整个
+    过程不经过 `maix.image` 的绘制接口，也不需要在 NumPy 数组和
+    `maix.image.Image` 之间来回转换。
+
+    文本无法用数组运算绘制，`draw_string` 会委托给共享同一块内存的
+    `maix.image.Image`：由 `maix.image.Image` 创建的画布直接使用原图像，
+    由数组创建的画布在第一次绘制文本时通过 `cv2image(copy=False)`
+    零拷贝地包装该数组。
+
+    Attributes:
+        array (numpy.ndarray): 画布的像素，形状为 `(高, 宽, 3)` 的 RGB 或 `(高, 宽)` 的灰度。
+    """
+
+    # 缓存的圆形掩码数量上限，超过时清空重建
+    MAX_CACHED_MASKS = 64
+
+    _masks: Dict[Tuple[int, int], object] = {}  # (半径, 厚度) -> 布尔掩码，所有画布共享
+
+    def __init__(self, target):
+        """创建画布。
+
+        Args:
+            target (maix.image.Image | numpy.ndarray): 绘制的目标。`maix.image.Image`
+                通过 `image2cv(copy=False)` 取得零拷贝视图，因此必须是 RGB888 或灰度图像；
+                数组必须是 uint8 的 `(高, 宽, 3)` RGB 或 `(高, 宽)` 灰度。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果数组的形状或类型不受支持。
+        """
+        if np is None:
+            raise RuntimeError("NumpyCanvas 需要 NumPy")
+        if isinstance(target, np.ndarray):
+            self.array = target
+            self._image = None
+        else:
+            self.array = image.image2cv(target, ensure_bgr=False, copy=False)
+            self._image = target
+        if self.array.dtype != np.uint8 or not (self.array.ndim == 2 or
+                                                (self.array.ndim == 3 and self.array.shape[2] == 3)):
+            raise ValueError("画布必须是 uint8 的 (高, 宽, 3) 或 (高, 宽) 数组")
+        self._gray = self.array.ndim == 2
+
+    @property
+    def image(self) -> image.Image:
+        """与画布共享内存的 `maix.image.Image`，用于绘制文本等数组无法完成的操作。"""
+        if self._image is None:
+            self._image = image.cv2image(self.array, bgr=False, copy=False)
+        return self._image
+
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    def _value(self, color):
+        """将颜色转换为可以直接赋给像素的值。"""
+        if isinstance(color, tuple):
+            r, g, b = color
+        else:
+            r, g, b = color.r, color.g, color.b
+        if self._gray:
+            return (r * 77 + g * 150 + b * 29) >> 8
+        return (r, g, b)
+
+    def _clip(self, x0: int, y0: int, x1: int, y1: int):
+        """将 `[x0, x1) x [y0, y1)` 裁剪到画布内。"""
+        h, w = self.array.shape[:2]
+        return max(0, x0), max(0, y0), min(w, x1), min(h, y1)
+
+    def _fill(self, x0: int, y0: int, x1: int, y1: int, value):
+        """填充 `[x0, x1) x [y0, y1)`，超出画布的部分被忽略。"""
+        x0, y0, x1, y1 = self._clip(x0, y0, x1, y1)
+        if x0 < x1 and y0 < y1:
+            self.array[y0:y1, x0:x1] = value
+
+    def draw_rect(self, x: int, y: int, w: int, h: int, color, thickness: int = 1):
+        """绘制矩形，边框向矩形内侧加厚。
+
+        Args:
+            x (int): 左上角的 x 坐标。
+            y (int): 左上角的 y 坐标。
+            w (int): 宽度。
+            h (int): 高度。
+            color (maix.image.Color | tuple): 颜色。
+            thickness (int): 边框厚度，-1 表示填充。
+        """
+        if w <= 0 or h <= 0:
+            return
+        value = self._value(color)
+        x, y, w, h = int(x), int(y), int(w), int(h)
+        t = min(thickness, w, h)
+        if thickness < 0 or 2 * t >= min(w, h):
+            self._fill(x, y, x + w, y + h, value)
+            return
+        self._fill(x, y, x + w, y + t, value)
+        self._fill(x, y + h - t, x + w, y + h, value)
+        self._fill(x, y + t, x + t, y + h - t, value)
+        self._fill(x + w - t, y + t, x + w, y + h - t, value)
+
+    @classmethod
+    def _circle_mask(cls, radius: int, thickness: int):
+        """返回 `(2r+1, 2r+1)` 的圆形掩码，`thickness` 为 -1 时为实心圆。"""
+        key = (radius, thickness)
+        mask = cls._masks.get(key)
+        if mask is None:
+            if len(cls._masks) >= cls.MAX_CACHED_MASKS:
+                cls._masks.clear()
+            d = np.arange(-radius, radius + 1)
+            d2 = d[:, None] ** 2 + d[None, :] ** 2
+            mask = d2 <= radius * radius + radius
+            if 0 <= thickness < radius:
+                inner = radius - thickness
+                mask &= d2 > inner * inner + inner
+            cls._masks[key] = mask
+        return mask
+
+    def draw_circle(self, x: int, y: int, radius: int, color, thickness: int = 1):
+        """绘制圆，圆环向圆心方向加厚。
+
+        Args:
+            x (int): 圆心的 x 坐标。
+            y (int): 圆心的 y 坐标。
+            radius (int): 半径。
+            color (maix.image.Color | tuple): 颜色。
+            thickness (int): 圆环厚度，-1 表示填充。
+        """
+        radius = int(radius)
+        if radius < 0:
+            return
+        x, y = int(x), int(y)
+        x0, y0, x1, y1 = self._clip(x - radius, y - radius, x + radius + 1, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        mask = self._circle_mask(radius, thickness)
+        mask = mask[y0 - (y - radius):y1 - (y - radius), x0 - (x - radius):x1 - (x - radius)]
+        self.array[y0:y1, x0:x1][mask] = self._value(color)
+
+    def draw_line(self, x1: int, y1: int, x2: int, y2: int, color, thickness: int = 1):
+        """绘制线段，线宽为 `thickness` 像素的方形笔触。
+
+        Args:
+            x1 (int): 起点的 x 坐标。
+            y1 (int): 起点的 y 坐标。
+            x2 (int): 终点的 x 坐标。
+            y2 (int): 终点的 y 坐标。
+            color (maix.image.Color | tuple): 颜色。
+            thickness (int): 线宽。
+        """
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        t = max(1, thickness)
+        lo = t // 2
+        value = self._value(color)
+        if y1 == y2 or x1 == x2:
+            self._fill(min(x1, x2) - lo, min(y1, y2) - lo, max(x1, x2) - lo + t, max(y1, y2) - lo + t, value)
+            return
+        n = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        xs = np.rint(np.linspace(x1, x2, n)).astype(np.intp)
+        ys = np.rint(np.linspace(y1, y2, n)).astype(np.intp)
+        if t > 1:
+            offsets = np.arange(t) - lo
+            xs = (xs[:, None, None] + offsets[None, None, :]).repeat(t, axis=1).ravel()
+            ys = (ys[:, None, None] + offsets[None, :, None]).repeat(t, axis=2).ravel()
+        h, w = self.array.shape[:2]
+        keep = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+        self.array[ys[keep], xs[keep]] = value
+
+    def draw_string(self, x: int, y: int, text: str, color, scale: float = 1, **kwargs):
+        """通过共享内存的 `maix.image.Image` 绘制文本，参数与 `maix.image.Image.draw_string` 相同。"""
+        if isinstance(color, tuple):
+            color = image.Color.from_rgb(*color)
+        self.image.draw_string(x, y, text, color, scale=scale, **kwargs)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+import asyncio
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+# 持有正在运行的回调任务的强引用，避免任务在完成前被垃圾回收
+_pending_tasks = set()
+
+# 每个线程私有的事件循环，供没有运行中事件循环的同步代码反复使用
+_local = threading.local()
+
+# 线程 ID -> 该线程中正在执行的回调栈 [(回调, 所有者)]，由 `invoke` 在调用线程中维护，
+# 供 `FrameWatchdog` 在后台线程中归因，无需读取其他线程栈帧的局部变量
+active_calls: Dict[int, List[Tuple[Callable, Any]]] = {}
+
+
+def _sync_loop() -> asyncio.AbstractEventLoop:
+    """返回当前线程私有的事件循环，第一次调用时创建。"""
+    loop = getattr(_local, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _local.loop = asyncio.new_event_loop()
+    return loop
+
+
+def schedule(awaitable: Awaitable):
+    """调度一个可等待对象。
+
+    如果当前线程中有正在运行的事件循环，则将其包装为任务交给该循环执行；
+    否则在当前线程私有的事件循环中同步运行直到完成。该循环在多次调用之间
+    复用而不会关闭，因此协程中创建的任务不会被取消，会在之后的调用中继续
+    运行。需要让协程与主循环并发执行时，应使用 `UIManager.run_async`。
+
+    Args:
+        awaitable (Awaitable): 要调度的协程或其他可等待对象。
+
+    Returns:
+        asyncio.Future | Any: 有事件循环时返回对应的任务，否则返回其执行结果。
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _sync_loop().run_until_complete(awaitable)
+    task = asyncio.ensure_future(awaitable)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+    return task
+
+
+def invoke(callback: Callable, *args, owner: Any = None) -> Any:
+    """调用回调函数，回调既可以是普通函数，也可以是协程函数。
+
+    调用期间回调及其所有者记录在 `active_calls` 中。
+
+    Args:
+        callback (Callable): 要调用的回调函数。
+        *args: 传递给回调函数的参数。
+        owner (Any): 触发回调的对象，例如组件；为 None 时使用绑定方法所属的对象。
+
+    Returns:
+        Any: 普通函数的返回值；协程函数则返回 `schedule` 的结果。
+    """
+    ident = threading.get_ident()
+    calls = active_calls.get(ident)
+    if calls is None:
+        calls = active_calls[ident] = []
+    calls.append((callback, owner if owner is not None else getattr(callback, '__self__', None)))
+    try:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            return schedule(result)
+        return result
+    finally:
+        calls.pop()
+
+
+async def invoke_async(callback: Callable, *args, owner: Any = None) -> Any:
+    """`invoke` 的异步版本：调用回调并等待其结果，等待期间同样记录在 `active_calls` 中。
+
+    Args:
+        callback (Callable): 要调用的回调函数，可以是普通函数或协程函数。
+        *args: 传递给回调函数的参数。
+        owner (Any): 触发回调的对象；为 None 时使用绑定方法所属的对象。
+
+    Returns:
+        Any: 回调的返回值，协程函数则为协程的结果。
+    """
+    ident = threading.get_ident()
+    calls = active_calls.get(ident)
+    if calls is None:
+        calls = active_calls[ident] = []
+    entry = (callback, owner if owner is not None else getattr(callback, '__self__', None))
+    calls.append(entry)
+    try:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    finally:
+        # 等待期间其他任务可能压入了自己的记录，因此按对象移除
+        calls.remove(entry)
+
+
+async def maybe_await(value: Any) -> Any:
+    """如果 `value` 是可等待对象则等待它，否则直接返回。"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import itertools
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+
+class IdleTask:
+    """`add_idle_task` 返回的空闲任务句柄。
+
+    Attributes:
+        priority (int): 优先级，数值越小越先执行。
+        estimate (float): 根据实测得到的单个分片的耗时估计（秒）。
+        skipped (int): 因估计耗时超过整个预算而连续未被执行的次数，执行一个分片后清零。
+        done (bool): 任务是否已经结束，即已执行完毕、出错或被取消。
+    """
+    __slots__ = ('priority', 'owner', 'estimate', 'skipped', 'done', '_step', '_seq', '_scheduler')
+
+    def __init__(self, scheduler: 'IdleScheduler', step: Callable[[], bool], priority: int,
+                 owner: Any, estimate: float, seq: int):
+        self.priority = priority
+        self.owner = owner
+        self.estimate = estimate
+        self.skipped = 0
+        self.done = False
+        self._step = step  # 执行一个分片，任务结束时返回 True
+        self._seq = seq
+        self._scheduler = scheduler
+
+    def cancel(self):
+        """取消任务，尚未执行的分片不会再被执行。"""
+        if not self.done:
+            self.done = True
+            self._scheduler._remove(self)
+
+    def _record(self, elapsed: float):
+        """记录一个分片的实测耗时。
+
+        耗时变长时立即采用新的值，变短时缓慢回落，使估计偏向保守。
+        """
+        self.skipped = 0
+        if elapsed >= self.estimate:
+            self.estimate = elapsed
+        else:
+            self.estimate += 0.1 * (elapsed - self.estimate)
+
+
+def _make_step(work: Callable | Iterable) -> Callable[[], bool]:
+    """将普通函数或生成器包装为“执行一个分片”的函数。"""
+    if callable(work):
+        def step() -> bool:
+            work()
+            return True
+        return step
+    iterator: Iterator = iter(work)
+
+    def step() -> bool:
+        try:
+            next(iterator)
+        except StopIteration:
+            return True
+        return False
+    return step
+
+
+class IdleScheduler:
+    """利用每帧剩余时间执行低优先级任务的调度器。
+
+    任务可以是普通函数（整体作为一个分片执行一次），也可以是生成器
+    （每次 `next` 执行一个分片，生成器结束即任务结束），例如分批预加载
+    资源、写出日志、整理缓存。
+
+    `run` 在给定的时间预算内按优先级挑选分片执行。每个任务都记录了其分片
+    的实测耗时，只有估计耗时能放进剩余预算的分片才会被执行，因此空闲任务
+    不会使本帧超过截止时间。
+
+    估计耗时超过整个预算的任务在每次 `run` 中会被跳过，其估计按
+    `starve_decay` 逐次衰减，直到放得进预算后再次尝试。因此偶发的慢分片
+    （例如垃圾回收或缺页造成的停顿）不会让任务永远得不到执行；而分片本身
+    就超过整帧预算的任务会周期性地使某一帧超时，应拆分成更小的分片，
+    `IdleTask.skipped` 可用于发现这类任务。
+
+    Attributes:
+        reserve (float): 每次 `run` 在预算末尾保留不用的时间（秒），用于吸收
+            计时和休眠的误差。
+        default_estimate (float): 尚未执行过的任务的分片耗时估计（秒）。
+        starve_decay (float): 任务因估计耗时超过整个预算而被跳过时，其估计
+            乘以的系数。
+    """
+
+    def __init__(self, reserve: float = 0.001, default_estimate: float = 0.002,
+                 starve_decay: float = 0.95):
+        """创建一个空的调度器。
+
+        Args:
+            reserve (float): 每次 `run` 在预算末尾保留不用的时间（秒）。
+            default_estimate (float): 尚未执行过的任务的分片耗时估计（秒）。
+            starve_decay (float): 被跳过的任务的估计每次乘以的系数，取值在 (0, 1]，
+                为 1 时不衰减。
+        """
+        self.reserve = reserve
+        self.default_estimate = default_estimate
+        self.starve_decay = starve_decay
+        self._tasks = []  # 按 (优先级, 序号) 排列的 IdleTask
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, work: Callable | Iterable, priority: int = 0, owner: Any = None,
+            estimate: float | None = None) -> IdleTask:
+        """登记一个空闲任务。
+
+        Args:
+            work (Callable | Iterable): 普通函数或生成器。
+            priority (int): 优先级，数值越小越先执行，同优先级的任务轮流执行。
+            owner (Any, optional): 任务的所有者，可通过 `cancel_owner` 一并取消。
+            estimate (float | None): 单个分片耗时的初始估计（秒），为 None 时
+                使用 `default_estimate`。
+
+        Returns:
+            IdleTask: 任务句柄。
+        """
+        task = IdleTask(self, _make_step(work), priority, owner,
+                        self.default_estimate if estimate is None else estimate, next(self._seq))
+        self._insert(task)
+        return task
+
+    def _insert(self, task: IdleTask):
+        """按 (优先级, 序号) 将任务插入队列。"""
+        key = (task.priority, task._seq)
+        tasks = self._tasks
+        i = len(tasks)
+        while i > 0 and (tasks[i - 1].priority, tasks[i - 1]._seq) > key:
+            i -= 1
+        tasks.insert(i, task)
+
+    def _remove(self, task: IdleTask):
+        try:
+            self._tasks.remove(task)
+        except ValueError:
+            pass
+
+    def cancel_owner(self, owner: Any):
+        """取消属于 `owner` 的所有任务。
+
+        Args:
+            owner (Any): 任务的所有者。
+        """
+        for task in [t for t in self._tasks if t.owner is owner]:
+            task.cancel()
+
+    def run(self, budget: float) -> float:
+        """在 `budget` 秒内执行尽可能多的分片。
+
+        每次从优先级最高的任务开始，挑选第一个估计耗时放得进剩余预算的
+        任务执行一个分片；执行过的任务移到同优先级的末尾，使同优先级的
+        任务轮流执行。没有任何分片放得进剩余预算时立即返回；估计耗时超过
+        整个预算的任务的估计按 `starve_decay` 衰减。
+
+        Args:
+            budget (float): 可用的时间（秒）。
+
+        Returns:
+            float: 实际用于执行分片的时间（秒）。
+        """
+        if not self._tasks:
+            return 0.0
+        start = time.perf_counter()
+        deadline = start + budget - self.reserve
+        now = start
+        while self._tasks:
+            remaining = deadline - now
+            task = next((t for t in self._tasks if t.estimate <= remaining), None)
+            if task is None:
+                break
+            try:
+                finished = task._step()
+            except BaseException:
+                task.cancel()
+                raise
+            end = time.perf_counter()
+            task._record(end - now)
+            now = end
+            if task.done:
+                continue  # 分片中取消了自己
+            self._tasks.remove(task)
+            if finished:
+                task.done = True
+            else:
+                task._seq = next(self._seq)
+                self._insert(task)
+        usable = budget - self.reserve
+        for task in self._tasks:
+            if task.estimate > usable:
+                task.skipped += 1
+                task.estimate *= self.starve_decay
+        return now - start
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import time
+from typing import Collection, Sequence, Tuple
+
+import maix.image as image
+
+from .canvas import NumpyCanvas
+from .power import activity
+
+try:
+    import numpy as np
+except ImportError:  # UI 层需要 NumPy
+    np = None
+
+
+class UILayer:
+    """独立于相机画面、拥有自己的分辨率和刷新率的 UI 层。
+
+    组件绘制在一块较小的画布上（例如 640x480 的画面上使用 320x240 的 UI 层），
+    并且只在需要时重绘：距上次重绘超过 `1 / fps`、`hold` 秒内有过用户活动
+    （触摸、组件状态改变、页面切换），或调用过 `invalidate` 时整体重绘；
+    只有动画在播放时，只清除并重绘动画中的组件（`Widget.bounds` 内的区域）。
+    其余的帧里组件只处理触摸事件而不绘制，见 `draw`。
+
+    局部重绘假定动画中的组件不与其他组件重叠；组件之间有重叠（例如通过
+    `WidgetManager` 的 z 序叠放）时，应以 `partial=False` 创建 UI 层。
+
+    每次重绘后，UI 层按关键色 `key_color` 计算不透明像素的掩码，按最近邻
+    放大到画面的尺寸，并裁剪到所有不透明像素的外接矩形内。之后每一帧只需
+    一次 `numpy.copyto` 即可合成到相机画面上，因此组件的绘制开销既不随
+    相机分辨率增长，也不随相机帧率增长。
+
+    Attributes:
+        canvas (NumpyCanvas): UI 层的画布，组件应绘制到这里。
+        fps (float): 没有用户活动时的重绘频率。
+        hold (float): 用户活动后保持逐帧重绘的时间（秒）。
+        key_color (tuple): 透明的关键色 (R, G, B)，组件绘制为该颜色的像素不会被合成。
+        partial (bool): 是否允许只重绘动画中的组件。
+        redraw (bool): 本帧是否需要重绘（整体或局部），由 `begin` 设置。
+        dirty (frozenset | None): 局部重绘时需要重绘的组件，整体重绘或不重绘时为 None。
+        composited (bool): 本帧是否已经调用过 `composite`，由 `begin` 重置。
+        redraws (int): 累计整体重绘的次数。
+        partial_redraws (int): 累计局部重绘的次数。
+        composites (int): 累计合成的次数。
+    """
+
+    def __init__(self, width: int = 320, height: int = 240, fps: float = 5.0, hold: float = 0.5,
+                 key_color: Sequence[int] = (255, 0, 255), partial: bool = True):
+        """创建 UI 层。
+
+        Args:
+            width (int): UI 层的宽度。
+            height (int): UI 层的高度，宽高比应与相机画面一致。
+            fps (float): 没有用户活动时的重绘频率，小于等于 0 时只在有活动时重绘。
+            hold (float): 用户活动后保持逐帧重绘的时间（秒）。
+            key_color (Sequence[int]): 透明的关键色 (R, G, B)。
+            partial (bool): 是否允许只重绘动画中的组件，组件之间有重叠时应为 False。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+        """
+        if np is None:
+            raise RuntimeError("UILayer 需要 NumPy")
+        self.canvas = NumpyCanvas(np.empty((height, width, 3), np.uint8))
+        self.fps = fps
+        self.hold = hold
+        self.key_color = tuple(int(c) for c in key_color)
+        self.partial = partial
+        self.redraw = False
+        self.dirty = None
+        self.composited = False
+        self.redraws = 0
+        self.partial_redraws = 0
+        self.composites = 0
+        self._last_redraw = None
+        self._invalid = True
+        self._stale = True         # 画布已重绘，合成用的数据尚未更新
+        self._maps = {}            # 画面的 (高, 宽) -> (行下标, 列下标)
+        self._patch = None         # (x0, y0, 像素, 掩码)，坐标为画面坐标
+        self._patch_shape = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """UI 层的尺寸 `(宽, 高)`。"""
+        return self.canvas.width(), self.canvas.height()
+
+    def invalidate(self):
+        """要求下一帧整体重绘，例如在组件的标签或数值被程序修改之后。"""
+        self._invalid = True
+
+    @property
+    def draw(self):
+        """本帧应传给管理器 `handle_events` 的 `draw` 参数。
+
+        整体重绘时为 True，局部重绘时为需要重绘的组件集合，不重绘时为 False。
+        """
+        if self.dirty is not None:
+            return self.dirty
+        return self.redraw
+
+    def begin(self, now: float | None = None, animated: Collection = ()) -> bool:
+        """在页面更新之前调用，决定本帧是否重绘，并清除需要重绘的区域。
+
+        Args:
+            now (float | None): 当前时刻（`time.perf_counter()`），为 None 时自动获取。
+            animated (Collection): 本帧属性被动画改变的对象，即 `TweenScheduler.dirty`。
+
+        Returns:
+            bool: 本帧是否需要重绘，同时保存在 `redraw` 中。
+        """
+        if now is None:
+            now = time.perf_counter()
+        last = self._last_redraw
+        self.composited = False
+        self.dirty = None
+        full = (self._invalid or last is None
+                or now - activity.stamp < self.hold or activity.stamp > last
+                or (self.fps > 0 and now - last >= 1.0 / self.fps))
+        regions = None
+        if not full and animated:
+            regions = self._regions(animated)
+            full = regions is None
+        self.redraw = full or regions is not None
+        if full:
+            self.canvas.array[...] = self.key_color
+            self._last_redraw = now
+            self._invalid = False
+            self.redraws += 1
+        elif regions is not None:
+            for x, y, w, h in regions:
+                self.canvas.draw_rect(x, y, w, h, self.key_color, thickness=-1)
+            self.dirty = frozenset(animated)
+            self.partial_redraws += 1
+        if self.redraw:
+            self._stale = True
+        return self.redraw
+
+    def _regions(self, animated: Collection):
+        """返回局部重绘需要清除的区域；不能局部重绘时返回 None。"""
+        from ..components.base import Widget
+        if not self.partial:
+            return None
+        regions = []
+        for obj in animated:
+            bounds = obj.bounds if isinstance(obj, Widget) else None
+            if bounds is None:
+                return None
+            regions.append(bounds)
+        return regions
+
+    def _maps_for(self, height: int, width: int):
+        """返回将画面坐标映射到 UI 层坐标的最近邻下标。"""
+        key = (height, width)
+        maps = self._maps.get(key)
+        if maps is None:
+            lh, lw = self.canvas.array.shape[:2]
+            ys = np.arange(height) * lh // height
+            xs = np.arange(width) * lw // width
+            maps = self._maps[key] = (ys, xs)
+        return maps
+
+    def _build_patch(self, shape: Tuple[int, ...]):
+        """根据画布生成放大到画面尺寸、裁剪到不透明区域的像素和掩码。"""
+        layer = self.canvas.array
+        opaque = (layer != np.array(self.key_color, np.uint8)).any(axis=2)
+        rows = np.flatnonzero(opaque.any(axis=1))
+        self._patch_shape = shape
+        self._stale = False
+        if len(rows) == 0:
+            self._patch = None
+            return
+        cols = np.flatnonzero(opaque.any(axis=0))
+        ys, xs = self._maps_for(shape[0], shape[1])
+        # 画面中映射到不透明行列范围内的部分
+        y0, y1 = np.searchsorted(ys, rows[0]), np.searchsorted(ys, rows[-1], side='right')
+        x0, x1 = np.searchsorted(xs, cols[0]), np.searchsorted(xs, cols[-1], side='right')
+        sy, sx = ys[y0:y1, None], xs[None, x0:x1]
+        pixels, mask = layer[sy, sx], opaque[sy, sx]
+        if len(shape) == 2:
+            # 灰度画面（例如二值图预览）
+            pixels = ((pixels[..., 0] * np.uint16(77) + pixels[..., 1] * np.uint16(150)
+                       + pixels[..., 2] * np.uint16(29)) >> 8).astype(np.uint8)
+        else:
+            mask = mask[..., None]
+        self._patch = (x0, y0, pixels, mask)
+
+    def composite(self, frame):
+        """将 UI 层合成到画面上。
+
+        启用了 UI 层的 `UIManager` 会在页面的 `update` 返回后自动合成；在
+        `update` 中自行显示画面的页面应在显示之前调用本方法，之后 `UIManager`
+        不会再次合成同一帧。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): RGB888 或灰度的相机画面，尺寸可以与
+                UI 层不同。
+        """
+        self.composited = True
+        if not isinstance(frame, np.ndarray):
+            frame = image.image2cv(frame, ensure_bgr=False, copy=False)
+        if self._stale or self._patch_shape != frame.shape:
+            self._build_patch(frame.shape)
+        if self._patch is None:
+            return
+        x0, y0, pixels, mask = self._patch
+        h, w = mask.shape[:2]
+        np.copyto(frame[y0:y0 + h, x0:x0 + w], pixels, where=mask)
+        self.composites += 1
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import time
+from typing import Any, Dict
+
+
+class ActivityMonitor:
+    """记录最近一次用户活动的时刻。
+
+    组件管理器读到触摸按下、组件状态改变以及页面切换时都会调用 `poke`，
+    `PowerSaver` 据此判断设备是否处于空闲状态。
+
+    Attributes:
+        stamp (float): 最近一次活动的时刻（`time.perf_counter()`）。
+    """
+    __slots__ = ('stamp',)
+
+    def __init__(self):
+        self.stamp = time.perf_counter()
+
+    def poke(self):
+        """记录一次用户活动。"""
+        self.stamp = time.perf_counter()
+
+
+# 所有组件管理器和 UIManager 共用的活动记录
+activity = ActivityMonitor()
+
+
+class _ModeStats:
+    """一种运行模式下累计的帧数、时间和 CPU 时间。"""
+    __slots__ = ('frames', 'seconds', 'cpu')
+
+    def __init__(self):
+        self.frames = 0
+        self.seconds = 0.0
+        self.cpu = 0.0
+
+
+class PowerSaver:
+    """空闲省电模式。
+
+    超过 `idle_after` 秒没有用户活动后进入低速模式：主循环以 `idle_fps` 的
+    频率运行，每次先读取一次触摸屏作为唤醒检查，读到按下或有其他活动时立即
+    恢复全速运行。`UIManager.run_async` 和 `sleep_if_idle` 在低速模式下跳过
+    读图、页面更新和显示；直接调用 `UIManager.update` 的主循环则由 `update`
+    休眠到下一次检查，再照常更新页面。
+
+    每种模式下的帧数、时间和进程 CPU 时间都会被分别累计，可通过 `stats`
+    查看省电效果。
+
+    Attributes:
+        touchscreen: 用于唤醒检查的触摸屏，为 None 时只能由其他活动唤醒。
+        idle_after (float): 进入低速模式前的空闲时间（秒）。
+        idle_fps (float): 低速模式下唤醒检查的频率。
+        sleeping (bool): 当前是否处于低速模式。
+    """
+
+    ACTIVE = 'active'
+    IDLE = 'idle'
+
+    def __init__(self, touchscreen: Any = None, idle_after: float = 60.0, idle_fps: float = 2.0):
+        """初始化省电模式。
+
+        Args:
+            touchscreen (maix.touchscreen.TouchScreen | None): 用于唤醒检查的触摸屏。
+            idle_after (float): 进入低速模式前的空闲时间（秒）。
+            idle_fps (float): 低速模式下唤醒检查的频率，必须大于 0。
+
+        Raises:
+            ValueError: 如果 `idle_fps` 不大于 0。
+        """
+        if idle_fps <= 0:
+            raise ValueError("idle_fps 必须大于 0")
+        self.touchscreen = touchscreen
+        self.idle_after = idle_after
+        self.idle_fps = idle_fps
+        self.sleeping = False
+        self._slept_at = 0.0
+        self._stats = {self.ACTIVE: _ModeStats(), self.IDLE: _ModeStats()}
+        self._mark = (time.perf_counter(), time.process_time())
+
+    @property
+    def idle_period(self) -> float:
+        """低速模式下两次唤醒检查的间隔（秒）。"""
+        return 1.0 / self.idle_fps
+
+    def _account(self):
+        """将上次记录以来的时间计入当前模式。"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        stats = self._stats[self.IDLE if self.sleeping else self.ACTIVE]
+        stats.seconds += wall - self._mark[0]
+        stats.cpu += cpu - self._mark[1]
+        self._mark = (wall, cpu)
+
+    def frame_done(self, now: float, busy: bool = False):
+        """全速模式下每帧结束时调用，空闲时间足够长时进入低速模式。
+
+        Args:
+            now (float): 当前时刻（`time.perf_counter()`）。
+            busy (bool): 是否有动画等仍在进行，为 True 时不进入低速模式。
+        """
+        self._stats[self.ACTIVE].frames += 1
+        if busy:
+            activity.stamp = now
+        elif now - activity.stamp >= self.idle_after:
+            self._account()
+            self.sleeping = True
+            self._slept_at = now
+
+    def wake_check(self) -> bool:
+        """低速模式下的唤醒检查，读到触摸按下或其他活动时恢复全速运行。
+
+        Returns:
+            bool: 检查后是否仍处于低速模式。
+        """
+        if not self.sleeping:
+            return False
+        self._stats[self.IDLE].frames += 1
+        if self.touchscreen is not None and self.touchscreen.read()[2]:
+            activity.poke()
+        if activity.stamp > self._slept_at:
+            self.wake()
+        return self.sleeping
+
+    def wake(self):
+        """立即恢复全速运行。"""
+        activity.poke()
+        if self.sleeping:
+            self._account()
+            self.sleeping = False
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """返回每种模式下的运行统计。
+
+        Returns:
+            dict: 以 `'active'` 和 `'idle'` 为键，值包含 `frames`（帧数）、
+            `seconds`（累计时间）、`fps`（平均帧率）和 `cpu`（进程 CPU 时间
+            占累计时间的比例）。
+        """
+        self._account()
+        result = {}
+        for mode, stats in self._stats.items():
+            seconds = stats.seconds
+            result[mode] = {
+                'frames': stats.frames,
+                'seconds': seconds,
+                'fps': stats.frames / seconds if seconds > 0 else 0.0,
+                'cpu': stats.cpu / seconds if seconds > 0 else 0.0,
+            }
+        return result
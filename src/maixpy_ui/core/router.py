@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .ui_manager import Page
+
+# 以该前缀开头的页面名称是参数段，可以匹配任意一段路径
+PARAM_PREFIX = ':'
+
+
+def split_path(path: str | Sequence[str]) -> List[str]:
+    """将 `"/a/b/c"` 形式的字符串路径拆分为路径段列表。
+
+    Args:
+        path (str | Sequence[str]): 字符串路径或路径段序列。
+
+    Returns:
+        List[str]: 路径段列表，空段会被忽略。
+    """
+    if isinstance(path, str):
+        return [segment for segment in path.split('/') if segment]
+    return list(path)
+
+
+class _RouteNode:
+    """路由前缀树的节点。"""
+    __slots__ = ('page', 'static', 'param_name', 'param_node')
+
+    def __init__(self, page: 'Page'):
+        self.page = page
+        self.static = {}         # 路径段 -> 子节点
+        self.param_name = None   # 参数子页面的参数名（不含前缀）
+        self.param_node = None   # 参数子页面对应的子节点
+
+
+class Router:
+    """将字符串路径映射到页面的路由表。
+
+    路由表以前缀树保存根页面下的整棵页面树，每个节点对应一个页面。页面
+    的增删会增量地更新前缀树，因此按路径查找页面只需沿路径逐段查字典，
+    按页面查找路径只需一次字典查询，而不必遍历页面树。
+
+    名称以 `:` 开头的页面（如 `":item_id"`）是参数段，可以匹配任意一段
+    路径，匹配到的值以参数名为键返回。同一父页面下的普通子页面优先于
+    参数子页面匹配。
+    """
+
+    def __init__(self):
+        """创建一个空的路由表。"""
+        self._root = None   # 根页面对应的节点
+        self._nodes = {}    # 页面 -> 节点
+        self._paths = {}    # 页面 -> 路径段元组（不含根页面）
+
+    def __contains__(self, page: 'Page') -> bool:
+        return page in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def rebuild(self, root: Optional['Page']):
+        """以 `root` 为根重新建立整张路由表。
+
+        Args:
+            root (Page | None): 根页面，为 None 时清空路由表。
+        """
+        self._root = None
+        self._nodes.clear()
+        self._paths.clear()
+        if root is not None:
+            self._root = self._nodes[root] = _RouteNode(root)
+            self._paths[root] = ()
+            for child in root.children:
+                self.attach(root, child)
+
+    def attach(self, parent: 'Page', child: 'Page'):
+        """登记 `child` 及其所有后代页面。
+
+        如果 `parent` 不在路由表中（例如页面树尚未设置为根页面），则不做任何事。
+
+        Args:
+            parent (Page): 父页面。
+            child (Page): 新添加的子页面。
+
+        Raises:
+            ValueError: 如果父页面下已经存在另一个参数子页面。
+        """
+        parent_node = self._nodes.get(parent)
+        if parent_node is None:
+            return
+        node = _RouteNode(child)
+        if child.name.startswith(PARAM_PREFIX):
+            if parent_node.param_node is not None:
+                raise ValueError(f"页面 '{parent.name}' 已有参数子页面 "
+                                 f"'{PARAM_PREFIX}{parent_node.param_name}'")
+            parent_node.param_name = child.name[len(PARAM_PREFIX):]
+            parent_node.param_node = node
+        else:
+            parent_node.static[child.name] = node
+        self._nodes[child] = node
+        self._paths[child] = self._paths[parent] + (child.name,)
+        for grandchild in child.children:
+            self.attach(child, grandchild)
+
+    def detach(self, parent: 'Page', child: 'Page'):
+        """注销 `child` 及其所有后代页面。
+
+        Args:
+            parent (Page): 父页面。
+            child (Page): 被移除的子页面。
+        """
+        parent_node = self._nodes.get(parent)
+        if parent_node is None or child not in self._nodes:
+            return
+        if parent_node.param_node is not None and parent_node.param_node.page is child:
+            parent_node.param_name = parent_node.param_node = None
+        else:
+            parent_node.static.pop(child.name, None)
+        for page in child.iter_subtree():
+            self._nodes.pop(page, None)
+            self._paths.pop(page, None)
+
+    def _match(self, node: _RouteNode, segments: List[str], i: int, params: Dict[str, str]) -> Optional[_RouteNode]:
+        """从 `node` 开始匹配 `segments[i:]`，参数段不匹配时回溯。"""
+        if i == len(segments):
+            return node
+        child = node.static.get(segments[i])
+        if child is not None:
+            found = self._match(child, segments, i + 1, params)
+            if found is not None:
+                return found
+        if node.param_node is not None:
+            params[node.param_name] = segments[i]
+            found = self._match(node.param_node, segments, i + 1, params)
+            if found is not None:
+                return found
+            del params[node.param_name]
+        return None
+
+    def resolve(self, path: str | Sequence[str], base: Optional['Page'] = None) -> Optional[Tuple['Page', Dict[str, str]]]:
+        """根据路径查找页面。
+
+        绝对路径从根页面开始，可以省略根页面的名称，也可以像 `Page.get_path()`
+        的结果那样以根页面的名称开头。
+
+        Args:
+            path (str | Sequence[str]): `"/a/b/c"` 形式的路径或路径段序列。
+            base (Page | None): 相对路径的起点，为 None 时按绝对路径查找。
+
+        Returns:
+            tuple[Page, dict] | None: 找到的页面及匹配到的参数，未找到时返回 None。
+        """
+        segments = split_path(path)
+        start = self._root if base is None else self._nodes.get(base)
+        if start is None:
+            return None
+        params = {}
+        node = self._match(start, segments, 0, params)
+        if node is None and base is None and segments and segments[0] == start.page.name:
+            node = self._match(start, segments, 1, params)
+        return (node.page, params) if node is not None else None
+
+    def path_of(self, page: 'Page') -> Optional[str]:
+        """返回页面在路由表中的路径，形如 `"/a/b/c"`，根页面为 `"/"`。
+
+        Args:
+            page (Page): 要查询的页面。
+
+        Returns:
+            str | None: 页面的路径，如果页面不在路由表中则返回 None。
+        """
+        segments = self._paths.get(page)
+        if segments is None:
+            return None
+        return '/' + '/'.join(segments)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import heapq
+import itertools
+import time
+from typing import Any, Callable
+
+from .dispatch import invoke
+
+
+class TimerHandle:
+    """`call_later` / `call_every` 返回的定时器句柄，可用于取消定时器。
+
+    Attributes:
+        cancelled (bool): 定时器是否已失效，即已被取消或一次性定时器已经触发。
+    """
+    __slots__ = ('callback', 'args', 'interval', 'owner', 'cancelled', '_service')
+
+    def __init__(self, service: 'TimerService', callback: Callable, args: tuple,
+                 interval: float | None, owner: Any):
+        self.callback, self.args = callback, args
+        self.interval = interval  # 为 None 时只触发一次
+        self.owner = owner
+        self.cancelled = False
+        self._service = service
+
+    def cancel(self):
+        """取消定时器。已经触发过的一次性定时器取消时不做任何事。"""
+        if not self.cancelled:
+            self.cancelled = True
+            self._service._on_cancel()
+
+
+class TimerService:
+    """基于最小堆的定时器服务。
+
+    所有定时器按触发时刻保存在一个最小堆中，`tick` 每帧只需查看堆顶即可
+    判断是否有定时器到期，没有到期时开销为 O(1)，与定时器的数量无关。
+    取消定时器只做标记，被标记的定时器在到达堆顶时丢弃；当被取消的定时器
+    超过一半时整体重建一次堆。
+    """
+
+    def __init__(self):
+        """创建一个空的定时器服务。"""
+        self._heap = []  # (触发时刻, 序号, TimerHandle)
+        self._seq = itertools.count()
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def _push(self, due: float, handle: TimerHandle):
+        heapq.heappush(self._heap, (due, next(self._seq), handle))
+
+    def call_later(self, delay: float, callback: Callable, *args, owner: Any = None) -> TimerHandle:
+        """在 `delay` 秒后调用一次 `callback(*args)`。
+
+        Args:
+            delay (float): 延迟时间（秒）。
+            callback (Callable): 回调函数，可以是协程函数。
+            *args: 传递给回调函数的参数。
+            owner (Any, optional): 定时器的所有者，可通过 `cancel_owner` 一并取消。
+
+        Returns:
+            TimerHandle: 定时器句柄。
+        """
+        handle = TimerHandle(self, callback, args, None, owner)
+        self._push(time.perf_counter() + delay, handle)
+        return handle
+
+    def call_every(self, interval: float, callback: Callable, *args, owner: Any = None) -> TimerHandle:
+        """每隔 `interval` 秒调用一次 `callback(*args)`，直到被取消。
+
+        触发时刻按固定间隔推进，不会因为帧的抖动而累积误差；如果错过了
+        多个周期（例如主循环被阻塞），只补触发一次。
+
+        Args:
+            interval (float): 触发间隔（秒），必须大于 0。
+            callback (Callable): 回调函数，可以是协程函数。
+            *args: 传递给回调函数的参数。
+            owner (Any, optional): 定时器的所有者，可通过 `cancel_owner` 一并取消。
+
+        Returns:
+            TimerHandle: 定时器句柄。
+
+        Raises:
+            ValueError: 如果 `interval` 不大于 0。
+        """
+        if interval <= 0:
+            raise ValueError("interval 必须大于 0")
+        handle = TimerHandle(self, callback, args, interval, owner)
+        self._push(time.perf_counter() + interval, handle)
+        return handle
+
+    def cancel_owner(self, owner: Any):
+        """取消属于 `owner` 的所有定时器。
+
+        Args:
+            owner (Any): 定时器的所有者。
+        """
+        for _, _, handle in list(self._heap):
+            if handle.owner is owner:
+                handle.cancel()
+
+    def _on_cancel(self):
+        """记录一次取消，被取消的定时器过多时重建堆。"""
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            # 原地重建，使 tick 中持有的引用保持有效
+            self._heap[:] = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def next_due(self) -> float | None:
+        """返回最近一个定时器的触发时刻，没有定时器时返回 None。"""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0][0] if heap else None
+
+    def tick(self, now: float | None = None):
+        """触发所有已到期的定时器。
+
+        Args:
+            now (float | None): 当前时刻（`time.perf_counter()`），为 None 时自动获取。
+        """
+        heap = self._heap
+        if not heap:
+            return
+        if now is None:
+            now = time.perf_counter()
+        if heap[0][0] > now:
+            return
+        while heap and heap[0][0] <= now:
+            due, _, handle = heapq.heappop(heap)
+            if handle.cancelled:
+                self._cancelled -= 1
+                continue
+            if handle.interval is None:
+                handle.cancelled = True  # 已触发，之后的 cancel() 不再计数
+            else:
+                due += handle.interval
+                self._push(due if due > now else now + handle.interval, handle)
+            invoke(handle.callback, *handle.args)
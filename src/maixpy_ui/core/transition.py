@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import maix.image as image
+
+from .tween import ease
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时使用 maix.image 的裁剪和绘制接口
+    np = None
+
+
+class Transition:
+    """页面切换动画的基类。
+
+    切换开始时，`UIManager` 只对离开的页面和进入的页面各截取一次画面，
+    之后的每一帧都只在两张截图之间按偏移或透明度进行合成，不会重新绘制
+    任何一个页面。动画的帧数根据实测的帧间隔计算，并且不少于
+    `min_frames`，因此在帧率较低时动画会相应变长，而不是跳帧。
+
+    Attributes:
+        duration (float): 帧率足够时动画的时长（秒）。
+        min_frames (int): 动画至少持续的帧数。
+    """
+
+    def __init__(self, duration: float = 0.25, min_frames: int = 4):
+        """初始化切换动画。
+
+        Args:
+            duration (float): 帧率足够时动画的时长（秒）。
+            min_frames (int): 动画至少持续的帧数。
+        """
+        self.duration = duration
+        self.min_frames = min_frames
+
+    def frame_count(self, frame_time: float) -> int:
+        """根据帧间隔计算动画的帧数。
+
+        Args:
+            frame_time (float): 实测的平均帧间隔（秒）。
+
+        Returns:
+            int: 动画的帧数。
+        """
+        if frame_time <= 0:
+            return self.min_frames
+        return max(self.min_frames, round(self.duration / frame_time))
+
+    def snapshot(self, img: image.Image):
+        """截取一帧画面，返回的对象会原样传给 `compose`。"""
+        if np is not None:
+            return np.array(image.image2cv(img, ensure_bgr=False, copy=False))
+        return img.copy()
+
+    def compose(self, dst: image.Image, outgoing, incoming, progress: float, reverse: bool):
+        """将两张截图按进度合成到目标图像上。
+
+        Args:
+            dst (maix.image.Image): 目标图像，尺寸与截图相同。
+            outgoing: 离开的页面的截图。
+            incoming: 进入的页面的截图。
+            progress (float): 动画进度，范围为 (0, 1]。
+            reverse (bool): 是否为返回方向的导航（返回父页面或历史记录）。
+
+        Raises:
+            NotImplementedError: 如果子类没有实现此方法。
+        """
+        raise NotImplementedError("每个切换动画都必须实现 compose 方法")
+
+
+class SlideTransition(Transition):
+    """滑动切换：进入的页面推动离开的页面移出屏幕，返回时方向相反。"""
+
+    def __init__(self, duration: float = 0.25, min_frames: int = 4, vertical: bool = False):
+        """初始化滑动切换动画。
+
+        Args:
+            duration (float): 帧率足够时动画的时长（秒）。
+            min_frames (int): 动画至少持续的帧数。
+            vertical (bool): 为 True 时上下滑动，否则左右滑动。
+        """
+        super().__init__(duration, min_frames)
+        self.vertical = vertical
+
+    def compose(self, dst: image.Image, outgoing, incoming, progress: float, reverse: bool):
+        """按偏移拼接两张截图。"""
+        size = dst.height() if self.vertical else dst.width()
+        offset = int(size * ease('ease_out', progress))
+        if offset <= 0:
+            first, second, split = outgoing, incoming, size
+        elif reverse:
+            # 离开的页面向后（右/下）移出，进入的页面从前方移入
+            first, second, split = incoming, outgoing, offset
+        else:
+            first, second, split = outgoing, incoming, size - offset
+        if np is not None:
+            out = image.image2cv(dst, ensure_bgr=False, copy=False)
+            if self.vertical:
+                out[:split] = first[size - split:]
+                out[split:] = second[:size - split]
+            else:
+                out[:, :split] = first[:, size - split:]
+                out[:, split:] = second[:, :size - split]
+            return
+        w, h = dst.width(), dst.height()
+        if self.vertical:
+            if split > 0:
+                dst.draw_image(0, 0, first.crop(0, size - split, w, split))
+            if split < size:
+                dst.draw_image(0, split, second.crop(0, 0, w, size - split))
+        else:
+            if split > 0:
+                dst.draw_image(0, 0, first.crop(size - split, 0, split, h))
+            if split < size:
+                dst.draw_image(split, 0, second.crop(0, 0, size - split, h))
+
+
+class FadeTransition(Transition):
+    """淡入淡出切换。
+
+    需要 NumPy 进行逐像素混合；没有 NumPy 时退化为在动画中点直接切换。
+    """
+
+    def snapshot(self, img: image.Image):
+        """截取一帧画面，使用 16 位整数保存以便混合。"""
+        if np is not None:
+            return image.image2cv(img, ensure_bgr=False, copy=False).astype(np.uint16)
+        return img.copy()
+
+    def compose(self, dst: image.Image, outgoing, incoming, progress: float, reverse: bool):
+        """按透明度混合两张截图。"""
+        alpha = int(256 * ease('ease_out', progress))
+        if np is not None:
+            out = image.image2cv(dst, ensure_bgr=False, copy=False)
+            out[:] = (outgoing * (256 - alpha) + incoming * alpha) >> 8
+            return
+        dst.draw_image(0, 0, incoming if alpha >= 128 else outgoing)
+
+
+class _ActiveTransition:
+    """一次正在进行的页面切换。"""
+    __slots__ = ('transition', 'outgoing', 'incoming', 'reverse', 'frame', 'frames')
+
+    def __init__(self, transition: Transition, outgoing, reverse: bool):
+        self.transition = transition
+        self.outgoing = outgoing
+        self.incoming = None  # 进入的页面第一次绘制后截取
+        self.reverse = reverse
+        self.frame = 0
+        self.frames = 1
+
+    def capture(self, img: image.Image, frame_time: float):
+        """截取进入的页面，并根据帧间隔确定动画的帧数。"""
+        self.incoming = self.transition.snapshot(img)
+        self.frames = self.transition.frame_count(frame_time)
+
+    def render(self, img: image.Image) -> bool:
+        """将下一帧动画合成到图像上，动画结束时返回 True。"""
+        self.frame += 1
+        self.transition.compose(img, self.outgoing, self.incoming, self.frame / self.frames, self.reverse)
+        return self.frame >= self.frames
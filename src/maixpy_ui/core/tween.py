@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+__author__ = 'Aristore'
+
+import time
+import weakref
+from array import array
+from typing import Any, Callable, Dict
+
+import maix.image as image
+
+# 缓动表的分段数，查表时在相邻两项之间线性插值
+EASING_STEPS = 64
+
+
+def _build_table(fn: Callable[[float], float]) -> array:
+    """在 [0, 1] 上对缓动函数等距采样，生成缓动表。"""
+    return array('f', [fn(i / EASING_STEPS) for i in range(EASING_STEPS + 1)])
+
+
+EASINGS: Dict[str, array] = {
+    'linear': _build_table(lambda t: t),
+    'ease_in': _build_table(lambda t: t * t * t),
+    'ease_out': _build_table(lambda t: 1 - (1 - t) ** 3),
+    'ease_in_out': _build_table(lambda t: 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2),
+}
+
+
+def ease(easing: str, t: float) -> float:
+    """查表计算缓动曲线在 `t` 处的值。
+
+    Args:
+        easing (str): 缓动曲线的名称，见 `EASINGS`。
+        t (float): 进度，会被限制在 [0, 1] 内。
+
+    Returns:
+        float: 缓动后的进度。
+    """
+    table = EASINGS[easing]
+    if t <= 0:
+        return table[0]
+    if t >= 1:
+        return table[EASING_STEPS]
+    pos = t * EASING_STEPS
+    i = int(pos)
+    return table[i] + (table[i + 1] - table[i]) * (pos - i)
+
+
+def lerp_color(start: image.Color, end: image.Color, t: float) -> image.Color:
+    """在两个颜色之间线性插值。
+
+    Args:
+        start (maix.image.Color): 起始颜色。
+        end (maix.image.Color): 结束颜色。
+        t (float): 插值系数，0 为起始颜色，1 为结束颜色。
+
+    Returns:
+        maix.image.Color: 插值得到的颜色；`t` 为 0 或 1 时直接返回端点颜色。
+    """
+    if t <= 0:
+        return start
+    if t >= 1:
+        return end
+    return image.Color.from_rgb(int(start.r + (end.r - start.r) * t),
+                                int(start.g + (end.g - start.g) * t),
+                                int(start.b + (end.b - start.b) * t))
+
+
+class Tween:
+    """一个正在进行的属性动画。"""
+    __slots__ = ('target', 'attr', 'start', 'end', 'began', 'duration', 'easing', 'on_done')
+
+    def __init__(self, target: Any, attr: str, start, end, began: float, duration: float,
+                 easing: str, on_done: Callable | None):
+        self.target, self.attr = target, attr
+        self.start, self.end = start, end
+        self.began, self.duration = began, duration
+        self.easing, self.on_done = easing, on_done
+
+    def value_at(self, now: float):
+        """计算 `now` 时刻的属性值，返回 (值, 是否结束)。"""
+        t = (now - self.began) / self.duration if self.duration > 0 else 1.0
+        if t >= 1:
+            return self.end, True
+        k = ease(self.easing, t)
+        if isinstance(self.end, image.Color):
+            return lerp_color(self.start, self.end, k), False
+        return self.start + (self.end - self.start) * k, False
+
+
+class TweenScheduler:
+    """集中驱动所有属性动画的调度器。
+
+    `animate` 登记一个从属性当前值到目标值的动画，`UIManager` 每帧调用一次
+    `tick`，按帧时钟推进所有动画并写回属性。没有进行中的动画时 `tick`
+    立即返回，不产生任何开销。
+
+    如果当前没有任何 `UIManager` 驱动调度器（例如只使用组件管理器而没有
+    使用 `UIManager`），`animate` 会直接将属性设为目标值，不播放动画。
+
+    组件通过模块级的默认调度器 `scheduler` 登记动画，所有 `UIManager`
+    都驱动这同一个调度器。同一帧中被多个 `UIManager` 推进不会改变结果，
+    因为属性值只取决于当前时刻；`active` 反映的是所有组件的动画。
+
+    Attributes:
+        dirty (frozenset): 最近一次 `tick` 中属性发生变化的对象，`UILayer` 据此只重绘
+            动画中的组件。
+    """
+
+    def __init__(self):
+        """创建一个空的调度器。"""
+        self._tweens = {}  # (id(target), attr) -> Tween
+        self._drivers = weakref.WeakSet()
+        self.dirty = frozenset()
+
+    def attach(self, driver: Any):
+        """登记一个每帧调用 `tick` 的驱动者，驱动者被释放后自动注销。"""
+        self._drivers.add(driver)
+
+    @property
+    def driven(self) -> bool:
+        """是否有驱动者在每帧推进动画。"""
+        return len(self._drivers) > 0
+
+    @property
+    def active(self) -> bool:
+        """是否有进行中的动画。"""
+        return bool(self._tweens)
+
+    def animate(self, target: Any, attr: str, end, duration: float = 0.15,
+                easing: str = 'ease_out', on_done: Callable | None = None) -> Tween | None:
+        """将 `target.attr` 从当前值过渡到 `end`。
+
+        同一属性上已有的动画会被替换，新动画从属性的当前值开始，因此
+        连续改变目标值时不会出现跳变。
+
+        Args:
+            target (Any): 拥有该属性的对象，通常是组件。
+            attr (str): 属性名，属性值必须是数值或 `maix.image.Color`。
+            end: 目标值。
+            duration (float): 动画时长（秒）。
+            easing (str): 缓动曲线的名称，见 `EASINGS`。
+            on_done (Callable | None): 动画结束时调用的函数，不带参数。
+
+        Returns:
+            Tween | None: 登记的动画；直接设置了目标值时返回 None。
+        """
+        if easing not in EASINGS:
+            raise ValueError(f"未知的缓动曲线 '{easing}'")
+        key = (id(target), attr)
+        if not self.driven or duration <= 0:
+            self._tweens.pop(key, None)
+            setattr(target, attr, end)
+            if on_done is not None:
+                on_done()
+            return None
+        tween = Tween(target, attr, getattr(target, attr), end, time.perf_counter(), duration, easing, on_done)
+        self._tweens[key] = tween
+        return tween
+
+    def cancel(self, target: Any, attr: str | None = None, finish: bool = False):
+        """取消对象上的动画。
+
+        Args:
+            target (Any): 动画的对象。
+            attr (str | None): 属性名，为 None 时取消该对象上的所有动画。
+            finish (bool): 为 True 时将属性直接设为目标值，否则停留在当前值。
+        """
+        keys = [(id(target), attr)] if attr is not None else \
+               [key for key in self._tweens if key[0] == id(target)]
+        for key in keys:
+            tween = self._tweens.pop(key, None)
+            if tween is not None and finish:
+                setattr(target, tween.attr, tween.end)
+
+    def tick(self, now: float | None = None) -> frozenset:
+        """推进所有动画。
+
+        Args:
+            now (float | None): 当前帧的时刻（`time.perf_counter()`），为 None 时自动获取。
+
+        Returns:
+            frozenset: 本次属性发生变化的对象，同 `dirty`；动画在本次结束的对象也包括在内。
+        """
+        if not self._tweens:
+            self.dirty = frozenset()
+            return self.dirty
+        if now is None:
+            now = time.perf_counter()
+        dirty = set()
+        finished = []
+        for key, tween in self._tweens.items():
+            value, done = tween.value_at(now)
+            setattr(tween.target, tween.attr, value)
+            dirty.add(tween.target)
+            if done:
+                finished.append(key)
+        for key in finished:
+            tween = self._tweens.pop(key)
+            if tween.on_done is not None:
+                tween.on_done()
+        self.dirty = frozenset(dirty)
+        return self.dirty
+
+
+# 所有组件和 UIManager 共用的默认调度器，见 TweenScheduler 的说明
+scheduler = TweenScheduler()
@@ -1,434 +1,1087 @@
-# -*- coding: utf-8 -*-
-__author__ = 'HYKMAX'
-
-import maix.image as image
-from typing import List, Optional
-
-class Page:
-    """页面（Page）的基类，支持树型父子节点结构。
-
-    每个页面可以有一个父页面和多个子页面，形成树型结构。
-    这种设计允许更灵活的页面组织和导航。
-
-    Attributes:
-        ui_manager (UIManager): 管理此页面的 UIManager 实例。
-        name (str): 页面的名称，用于在父页面中唯一标识。
-        parent (Page | None): 父页面，如果为 None 则表示根页面。
-        children (List[Page]): 子页面列表。
-    """
-
-    def __init__(self, ui_manager: 'UIManager', name: str = ""):
-        """初始化页面。
-
-        Args:
-            ui_manager (UIManager): 用于页面导航的 UIManager 实例。
-            name (str): 页面的唯一名称标识符。
-        """
-        self.ui_manager = ui_manager
-        self.name = name
-        self.parent = None
-        self.children = []
-
-    def add_child(self, child_page: 'Page'):
-        """添加一个子页面。
-
-        Args:
-            child_page (Page): 要添加的子页面实例。
-
-        Raises:
-            ValueError: 如果子页面的名称已存在或为空。
-            TypeError: 如果传入的不是 Page 实例。
-        """
-        if not isinstance(child_page, Page):
-            raise TypeError("只能添加 Page 类的实例")
-        if not child_page.name:
-            raise ValueError("子页面必须有一个非空的名称")
-        if self.get_child(child_page.name) is not None:
-            raise ValueError(f"名称为 '{child_page.name}' 的子页面已存在")
-        
-        child_page.parent = self
-        self.children.append(child_page)
-
-    def remove_child(self, child_page: 'Page'):
-        """移除一个子页面。
-
-        Args:
-            child_page (Page): 要移除的子页面实例。
-
-        Returns:
-            bool: 如果成功移除则返回 True，否则返回 False。
-        """
-        if child_page in self.children:
-            child_page.parent = None
-            self.children.remove(child_page)
-            return True
-        return False
-
-    def get_child(self, name: str) -> Optional['Page']:
-        """根据名称获取子页面。
-
-        Args:
-            name (str): 子页面的名称。
-
-        Returns:
-            Page | None: 如果找到则返回子页面实例，否则返回 None。
-        """
-        for child in self.children:
-            if child.name == name:
-                return child
-        return None
-
-    def get_root(self) -> 'Page':
-        """获取当前页面的根页面。
-
-        Returns:
-            Page: 树结构的根页面。
-        """
-        current = self
-        while current.parent:
-            current = current.parent
-        return current
-
-    def get_path(self) -> List[str]:
-        """获取从根页面到当前页面的路径。
-
-        Returns:
-            List[str]: 页面名称的路径列表。
-        """
-        path = []
-        current = self
-        while current:
-            if current.name:  # 只有非空名称才加入路径
-                path.insert(0, current.name)
-            current = current.parent
-        return path
-
-    def get_depth(self) -> int:
-        """获取当前页面在树中的深度。
-
-        Returns:
-            int: 页面深度，根页面深度为0。
-        """
-        depth = 0
-        current = self.parent
-        while current:
-            depth += 1
-            current = current.parent
-        return depth
-
-    def find_page_by_path(self, path: List[str]) -> Optional['Page']:
-        """根据路径查找页面。
-
-        Args:
-            path (List[str]): 页面路径，从当前页面开始的相对路径。
-
-        Returns:
-            Page | None: 如果找到则返回页面实例，否则返回 None。
-        """
-        if not path:
-            return self
-        
-        child = self.get_child(path[0])
-        if child is None:
-            return None
-        
-        if len(path) == 1:
-            return child
-        else:
-            return child.find_page_by_path(path[1:])
-
-    def on_enter(self):
-        """当页面进入视图时调用。
-
-        子类可以重写此方法来实现页面进入时的初始化逻辑。
-        """
-        pass
-
-    def on_exit(self):
-        """当页面离开视图时调用。
-
-        子类可以重写此方法来实现页面退出时的清理逻辑。
-        """
-        pass
-
-    def on_child_enter(self, child: 'Page'):
-        """当子页面进入视图时调用。
-
-        Args:
-            child (Page): 进入视图的子页面。
-        """
-        pass
-
-    def on_child_exit(self, child: 'Page'):
-        """当子页面离开视图时调用。
-
-        Args:
-            child (Page): 离开视图的子页面。
-        """
-        pass
-
-    def update(self, img: image.Image):
-        """每帧调用的更新和绘制方法。
-
-        子类必须重写此方法以实现页面的UI逻辑和绘制。
-
-        Args:
-            img (maix.image.Image): 用于绘制的图像缓冲区。
-
-        Raises:
-            NotImplementedError: 如果子类没有实现此方法。
-        """
-        raise NotImplementedError("每个页面都必须实现 update 方法")
-
-
-class UIManager:
-    """UI 管理器，基于树型页面结构提供灵活的导航功能。
-
-    该管理器支持树型页面结构的导航，包括导航到子页面、返回父页面、
-    按路径导航等功能。
-    """
-
-    def __init__(self, root_page: Optional[Page] = None):
-        """初始化UI管理器。
-
-        Args:
-            root_page (Page | None): 根页面实例，如果为None则需要后续设置。
-        """
-        self.root_page = root_page
-        self.current_page = root_page
-        self.navigation_history = []  # 用于记录导航历史
-        
-        if root_page:
-            root_page.on_enter()
-
-    def set_root_page(self, page: Page):
-        """设置根页面。
-
-        Args:
-            page (Page): 新的根页面实例。
-        """
-        if self.current_page:
-            self.current_page.on_exit()
-        
-        self.root_page = page
-        self.current_page = page
-        self.navigation_history.clear()
-        
-        if page:
-            page.on_enter()
-
-    def remove_page(self, page: Page) -> bool:
-        """移除指定的页面。
-
-        Args:
-            page (Page): 要移除的页面实例。
-
-        Returns:
-            bool: 如果成功移除则返回 True，否则返回 False。
-        """
-        if page is None or page not in self.navigation_history:
-            return False
-        
-        # 如果当前页面是要移除的页面，首先返回到父页面
-        if self.current_page == page:
-            self.navigate_to_parent()
-        
-        # 如果页面有父页面，则从父页面的子页面列表中移除该页面
-        if page.parent:
-            success = page.parent.remove_child(page)
-            if success:
-                return True
-        
-        return False    
-    
-    def get_current_page(self) -> Optional[Page]:
-        """获取当前活动的页面。
-
-        Returns:
-            Page | None: 当前页面实例，如果没有则返回 None。
-        """
-        return self.current_page
-
-    def navigate_to_child(self, child_name: str) -> bool:
-        """导航到当前页面的指定子页面。
-
-        Args:
-            child_name (str): 子页面的名称。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not self.current_page:
-            return False
-        
-        child = self.current_page.get_child(child_name)
-        if child:
-            # 记录导航历史
-            self.navigation_history.append(self.current_page)
-            
-            # 通知当前页面和父页面
-            self.current_page.on_exit()
-            self.current_page.on_child_enter(child)
-            
-            # 切换页面
-            self.current_page = child
-            child.on_enter()
-            
-            return True
-        return False
-
-    def navigate_to_parent(self) -> bool:
-        """导航到当前页面的父页面。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not self.current_page or not self.current_page.parent:
-            return False
-        
-        parent = self.current_page.parent
-        
-        # 通知相关页面
-        parent.on_child_exit(self.current_page)
-        self.current_page.on_exit()
-        
-        # 从历史记录中移除（如果存在）
-        if self.navigation_history and self.navigation_history[-1] == parent:
-            self.navigation_history.pop()
-        
-        # 切换页面
-        self.current_page = parent
-        parent.on_enter()
-        
-        return True
-
-    def navigate_to_root(self) -> bool:
-        """导航到根页面。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not self.root_page:
-            return False
-        
-        return self.navigate_to_page(self.root_page)
-
-    def navigate_to_path(self, path: List[str]) -> bool:
-        """根据路径导航到指定页面。
-
-        Args:
-            path (List[str]): 从根页面开始的绝对路径。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not self.root_page or not path:
-            return False
-        
-        target_page = self.root_page.find_page_by_path(path)
-        if target_page:
-            return self.navigate_to_page(target_page)
-        return False
-
-    def navigate_to_relative_path(self, path: List[str]) -> bool:
-        """根据相对路径导航到指定页面。
-
-        Args:
-            path (List[str]): 从当前页面开始的相对路径。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not self.current_page:
-            return False
-        
-        target_page = self.current_page.find_page_by_path(path)
-        if target_page:
-            return self.navigate_to_page(target_page)
-        return False
-
-    def navigate_to_page(self, target_page: Page) -> bool:
-        """直接导航到指定页面。
-
-        Args:
-            target_page (Page): 目标页面实例。
-
-        Returns:
-            bool: 如果导航成功则返回 True，否则返回 False。
-        """
-        if not target_page:
-            return False
-        
-        if self.current_page:
-            # 记录当前页面到历史（如果不是返回操作）
-            if (not self.navigation_history or 
-                self.navigation_history[-1] != target_page):
-                self.navigation_history.append(self.current_page)
-            
-            self.current_page.on_exit()
-        
-        self.current_page = target_page
-        target_page.on_enter()
-        
-        return True
-
-    def go_back(self) -> bool:
-        """返回到历史记录中的前一个页面。
-
-        Returns:
-            bool: 如果返回成功则返回 True，否则返回 False。
-        """
-        if not self.navigation_history:
-            return False
-        
-        previous_page = self.navigation_history.pop()
-        
-        if self.current_page:
-            self.current_page.on_exit()
-        
-        self.current_page = previous_page
-        previous_page.on_enter()
-        
-        return True
-
-    def clear_history(self):
-        """清空导航历史记录。"""
-        self.navigation_history.clear()
-
-    def get_current_path(self) -> List[str]:
-        """获取当前页面的完整路径。
-
-        Returns:
-            List[str]: 当前页面的路径。
-        """
-        if self.current_page:
-            return self.current_page.get_path()
-        return []
-
-    def get_navigation_info(self) -> dict:
-        """获取当前导航状态信息。
-
-        Returns:
-            dict: 包含当前页面、路径、历史等信息的字典。
-        """
-        return {
-            'current_page': self.current_page.name if self.current_page else None,
-            'current_path': self.get_current_path(),
-            'can_go_back': len(self.navigation_history) > 0,
-            'can_go_to_parent': (self.current_page and 
-                                self.current_page.parent is not None),
-            'history_depth': len(self.navigation_history),
-            'page_depth': (self.current_page.get_depth() 
-                          if self.current_page else 0)
-        }
-
-    def update(self, img: image.Image):
-        """更新当前活动页面的状态。
-
-        此方法应在主循环中每帧调用，它会调用当前页面的 `update` 方法。
-
-        Args:
-            img (maix.image.Image): 用于绘制的图像缓冲区。
-        """
-        if self.current_page:
-            self.current_page.update(img)
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import maix.image as image
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from .dispatch import invoke, invoke_async, maybe_await
+from .router import Router, split_path
+from .transition import Transition, _ActiveTransition
+from .tween import TweenScheduler, scheduler as default_tweens
+from .timers import TimerHandle, TimerService
+from .idle import IdleScheduler, IdleTask
+from .watchdog import FrameWatchdog
+from .power import PowerSaver, activity
+from .layer import UILayer
+
+class Page:
+    """页面（Page）的基类，支持树型父子节点结构。
+
+    每个页面可以有一个父页面和多个子页面，形成树型结构。
+    这种设计允许更灵活的页面组织和导航。
+
+    Attributes:
+        ui_manager (UIManager): 管理此页面的 UIManager 实例。
+        name (str): 页面的名称，用于在父页面中唯一标识。
+        parent (Page | None): 父页面，如果为 None 则表示根页面。页面只以弱引用
+            持有父页面，子页面由父页面的 `children` 持有。
+        children (List[Page]): 子页面列表。
+        prefetch_hints (List[str | Page]): 在此页面显示期间应提前准备的页面，
+            可以是子页面的名称或任意页面实例。
+    """
+
+    def __init__(self, ui_manager: 'UIManager', name: str = ""):
+        """初始化页面。
+
+        Args:
+            ui_manager (UIManager): 用于页面导航的 UIManager 实例。
+            name (str): 页面的唯一名称标识符。
+        """
+        self.ui_manager = ui_manager
+        self.name = name
+        self._parent_ref = None  # 父页面的弱引用，避免父子页面互相持有
+        self.children = []
+        self.prefetch_hints = []
+
+    @property
+    def parent(self) -> Optional['Page']:
+        """父页面，如果为 None 则表示根页面或父页面已被释放。"""
+        ref = self._parent_ref
+        return ref() if ref is not None else None
+
+    @parent.setter
+    def parent(self, page: Optional['Page']):
+        self._parent_ref = weakref.ref(page) if page is not None else None
+
+    def add_child(self, child_page: 'Page'):
+        """添加一个子页面。
+
+        Args:
+            child_page (Page): 要添加的子页面实例。
+
+        Raises:
+            ValueError: 如果子页面的名称已存在或为空。
+            TypeError: 如果传入的不是 Page 实例。
+        """
+        if not isinstance(child_page, Page):
+            raise TypeError("只能添加 Page 类的实例")
+        if not child_page.name:
+            raise ValueError("子页面必须有一个非空的名称")
+        if self.get_child(child_page.name) is not None:
+            raise ValueError(f"名称为 '{child_page.name}' 的子页面已存在")
+        
+        router = getattr(self.ui_manager, 'router', None)
+        if router is not None:
+            router.attach(self, child_page)
+        child_page.parent = self
+        self.children.append(child_page)
+
+    def remove_child(self, child_page: 'Page'):
+        """移除一个子页面。
+
+        Args:
+            child_page (Page): 要移除的子页面实例。
+
+        Returns:
+            bool: 如果成功移除则返回 True，否则返回 False。
+        """
+        if child_page in self.children:
+            router = getattr(self.ui_manager, 'router', None)
+            if router is not None:
+                router.detach(self, child_page)
+            child_page.parent = None
+            self.children.remove(child_page)
+            return True
+        return False
+
+    def get_child(self, name: str) -> Optional['Page']:
+        """根据名称获取子页面。
+
+        Args:
+            name (str): 子页面的名称。
+
+        Returns:
+            Page | None: 如果找到则返回子页面实例，否则返回 None。
+        """
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+    def iter_subtree(self) -> Iterator['Page']:
+        """按深度优先的顺序遍历当前页面及其所有后代页面。
+
+        Yields:
+            Page: 当前页面及其后代页面。
+        """
+        stack = [self]
+        while stack:
+            page = stack.pop()
+            yield page
+            stack.extend(reversed(page.children))
+
+    def get_root(self) -> 'Page':
+        """获取当前页面的根页面。
+
+        Returns:
+            Page: 树结构的根页面。
+        """
+        current = self
+        while current.parent:
+            current = current.parent
+        return current
+
+    def get_path(self) -> List[str]:
+        """获取从根页面到当前页面的路径。
+
+        Returns:
+            List[str]: 页面名称的路径列表。
+        """
+        path = []
+        current = self
+        while current:
+            if current.name:  # 只有非空名称才加入路径
+                path.insert(0, current.name)
+            current = current.parent
+        return path
+
+    def get_depth(self) -> int:
+        """获取当前页面在树中的深度。
+
+        Returns:
+            int: 页面深度，根页面深度为0。
+        """
+        depth = 0
+        current = self.parent
+        while current:
+            depth += 1
+            current = current.parent
+        return depth
+
+    def find_page_by_path(self, path: List[str]) -> Optional['Page']:
+        """根据路径查找页面。
+
+        Args:
+            path (List[str]): 页面路径，从当前页面开始的相对路径。
+
+        Returns:
+            Page | None: 如果找到则返回页面实例，否则返回 None。
+        """
+        if not path:
+            return self
+        
+        child = self.get_child(path[0])
+        if child is None:
+            return None
+        
+        if len(path) == 1:
+            return child
+        else:
+            return child.find_page_by_path(path[1:])
+
+    def prepare(self, cancelled: threading.Event):
+        """加载页面所需的资源（字体、图像、模型等）。
+
+        `UIManager` 会在页面第一次进入视图之前调用此方法，并且可能在父页面
+        显示期间就在后台线程中提前调用，因此这里不应访问显示屏、触摸屏等
+        只能在主线程中使用的设备。如果预取被取消，`cancelled` 会被置位，
+        耗时较长的实现应定期检查并尽早返回；被取消的准备不算完成，之后会
+        重新调用。
+
+        Args:
+            cancelled (threading.Event): 预取被取消时置位的事件。
+        """
+        pass
+
+    def on_enter(self):
+        """当页面进入视图时调用。
+
+        子类可以重写此方法来实现页面进入时的初始化逻辑。该方法也可以定义为
+        `async def`，在 `UIManager.run_async` 中运行时，等待其完成之前不会
+        调用此页面的 `update`。
+        """
+        pass
+
+    def on_exit(self):
+        """当页面离开视图时调用。
+
+        子类可以重写此方法来实现页面退出时的清理逻辑。该方法也可以定义为
+        `async def`。
+        """
+        pass
+
+    def on_child_enter(self, child: 'Page'):
+        """当子页面进入视图时调用。
+
+        Args:
+            child (Page): 进入视图的子页面。
+        """
+        pass
+
+    def on_child_exit(self, child: 'Page'):
+        """当子页面离开视图时调用。
+
+        Args:
+            child (Page): 离开视图的子页面。
+        """
+        pass
+
+    def update(self, img: image.Image):
+        """每帧调用的更新和绘制方法。
+
+        子类必须重写此方法以实现页面的UI逻辑和绘制。该方法也可以定义为
+        `async def`，此时应通过 `UIManager.update_async` 或 `run_async` 驱动。
+
+        Args:
+            img (maix.image.Image): 用于绘制的图像缓冲区。
+
+        Raises:
+            NotImplementedError: 如果子类没有实现此方法。
+        """
+        raise NotImplementedError("每个页面都必须实现 update 方法")
+
+
+class UIManager:
+    """UI 管理器，基于树型页面结构提供灵活的导航功能。
+
+    该管理器支持树型页面结构的导航，包括导航到子页面、返回父页面、
+    按路径导航等功能。根页面下的整棵页面树由 `router` 维护为路由表，
+    按路径导航和查询页面路径都无需遍历页面树。
+
+    每进入一个页面，管理器会在后台线程中提前调用接下来可能访问的页面的
+    `Page.prepare`：先是该页面 `prefetch_hints` 中列出的页面，再是按导航
+    记录统计出的、从该页面出发最常访问的页面。导航到其他页面时，不再需要
+    的预取会被取消。
+
+    Attributes:
+        router (Router): 根页面下所有页面的路由表。
+        prefetch_limit (int): 根据导航记录自动预取的页面数量上限，为 0 时
+            只预取 `prefetch_hints` 中的页面。
+        transition (Transition | None): 页面切换动画，为 None 时直接切换。
+        frame_time (float): 实测的平均帧间隔（秒），用于计算切换动画的帧数。
+        tweens (TweenScheduler): 组件属性动画的调度器，每帧在页面更新之前推进一次。
+            所有 `UIManager` 共用同一个默认调度器。
+        timers (TimerService): 定时器服务，每帧在页面更新之前检查一次。
+        idle (IdleScheduler): 空闲任务调度器，利用每帧剩余的时间执行低优先级任务。
+        watchdog (FrameWatchdog | None): 帧超时看门狗，见 `enable_watchdog`。
+        power (PowerSaver | None): 空闲省电模式，见 `enable_power_save`。
+        overlay (UILayer | None): 独立分辨率和刷新率的 UI 层，见 `enable_overlay`。
+    """
+
+    def __init__(self, root_page: Optional[Page] = None, prefetch_limit: int = 2,
+                 transition: Optional[Transition] = None):
+        """初始化UI管理器。
+
+        Args:
+            root_page (Page | None): 根页面实例，如果为None则需要后续设置。
+            prefetch_limit (int): 根据导航记录自动预取的页面数量上限。
+            transition (Transition | None): 页面切换动画，为 None 时直接切换。
+        """
+        self.root_page = root_page
+        self.current_page = root_page
+        self.navigation_history = []  # 用于记录导航历史
+        self.router = Router()
+        self.router.rebuild(root_page)
+        self._route_params = {}  # 页面 -> 最近一次按路径导航到该页面时匹配到的参数
+        self._enter_tasks = {}  # 尚未完成的异步 on_enter 任务
+        self._running = False
+        self.prefetch_limit = prefetch_limit
+        self._prepared = set()    # 已完成 prepare 的页面
+        self._prefetches = {}     # 页面 -> (后台 prepare 的 Future, 取消事件)
+        self._cancelled_prefetches = {}  # 页面 -> 已取消但仍在运行的后台 prepare 的 Future
+        self._transitions = {}    # 页面 -> {下一个页面: 导航次数}
+        self._executor = None
+        self.transition = transition
+        self.frame_time = 1 / 30
+        self._frame_stamp = None
+        self._last_frame = None   # 上一帧最终显示的图像
+        self._active_transition = None
+        self.tweens: TweenScheduler = default_tweens
+        self.tweens.attach(self)
+        self.timers = TimerService()
+        self.idle = IdleScheduler()
+        self.watchdog = None
+        self.power = None
+        self.overlay = None
+        
+        if root_page:
+            self._enter_page(root_page)
+
+    def _call_hook(self, hook: Callable, *args):
+        """调用页面的生命周期钩子，钩子可以是普通方法或协程方法。"""
+        return invoke(hook, *args)
+
+    def _enter_page(self, page: Page, previous: Optional[Page] = None, reverse: bool = False):
+        """确保页面已准备好，调度后续页面的预取，然后调用页面的 `on_enter`。
+
+        如果 `on_enter` 是协程且正在事件循环中运行，则记录对应的任务，
+        在任务完成前跳过该页面的 `update`。
+
+        Args:
+            page (Page): 进入视图的页面。
+            previous (Page | None): 导航前的页面，用于统计导航记录和播放切换动画。
+            reverse (bool): 是否为返回方向的导航。
+        """
+        if previous is not None and previous is not page:
+            counts = self._transitions.setdefault(previous, {})
+            counts[page] = counts.get(page, 0) + 1
+            self._begin_transition(reverse)
+        activity.poke()
+        self._ensure_prepared(page)
+        self._schedule_prefetch(page)
+        result = self._call_hook(page.on_enter)
+        if isinstance(result, asyncio.Future):
+            self._enter_tasks[page] = result
+
+    def _ensure_prepared(self, page: Page):
+        """确保页面的 `prepare` 已经完成。
+
+        正在后台预取的页面会等待预取完成；尚未预取的页面在当前线程中准备。
+        如果该页面有一次已取消但仍在运行的预取，会先等待它结束，避免同一个
+        页面的两次 `prepare` 同时执行。
+
+        Raises:
+            Exception: 如果后台的 `prepare` 抛出了异常，则在此处重新抛出。
+        """
+        if page in self._prepared:
+            return
+        stale = self._cancelled_prefetches.pop(page, None)
+        if stale is not None:
+            wait([stale])  # 已取消的预取的结果和异常都不再需要
+        entry = self._prefetches.pop(page, None)
+        if entry is not None:
+            entry[0].result()
+        if page not in self._prepared:
+            page.prepare(threading.Event())
+            self._prepared.add(page)
+
+    def _run_prepare(self, page: Page, cancelled: threading.Event):
+        """在后台线程中准备页面。"""
+        page.prepare(cancelled)
+        if not cancelled.is_set():
+            self._prepared.add(page)
+
+    def _prefetch_candidates(self, page: Page) -> List[Page]:
+        """返回在 `page` 显示期间应预取的页面。"""
+        candidates = []
+        for hint in page.prefetch_hints:
+            target = page.get_child(hint) if isinstance(hint, str) else hint
+            if target is not None and target not in candidates:
+                candidates.append(target)
+        counts = self._transitions.get(page)
+        if counts and self.prefetch_limit > 0:
+            learned = sorted(counts, key=counts.get, reverse=True)
+            candidates.extend([p for p in learned if p not in candidates][:self.prefetch_limit])
+        return candidates
+
+    def _schedule_prefetch(self, page: Page):
+        """取消不再需要的预取，并为 `page` 之后可能访问的页面启动预取。"""
+        wanted = self._prefetch_candidates(page)
+        for p in list(self._prefetches):
+            if p not in wanted:
+                self.cancel_prefetch(p)
+        for p in wanted:
+            if p is not page:
+                self.prefetch(p)
+
+    def prefetch(self, page: Page) -> Optional[Future]:
+        """在后台线程中提前调用页面的 `prepare`。
+
+        通常在页面的 `on_enter` 中调用，预取会一直保留到下一次导航；
+        下一次导航时如果目标页面不再需要该预取，它会被取消。
+
+        Args:
+            page (Page): 要预取的页面。
+
+        Returns:
+            concurrent.futures.Future | None: 后台准备任务；页面已准备好时返回 None。
+        """
+        if page in self._prepared:
+            return None
+        entry = self._prefetches.get(page)
+        if entry is not None:
+            return entry[0]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='maixpy-ui-prefetch')
+        cancelled = threading.Event()
+        future = self._executor.submit(self._run_prepare, page, cancelled)
+        self._prefetches[page] = (future, cancelled)
+        return future
+
+    def cancel_prefetch(self, page: Optional[Page] = None):
+        """取消页面的预取。
+
+        尚未开始的预取会被直接取消；正在进行的预取会收到取消事件，并保留到
+        结束为止，以便再次需要该页面时等待它结束。
+
+        Args:
+            page (Page | None): 要取消预取的页面，为 None 时取消所有预取。
+        """
+        pages = list(self._prefetches) if page is None else [page]
+        for p in pages:
+            entry = self._prefetches.pop(p, None)
+            if entry is not None:
+                entry[1].set()
+                if not entry[0].cancel():
+                    self._cancelled_prefetches[p] = entry[0]
+                    entry[0].add_done_callback(lambda f, p=p: self._forget_cancelled(p, f))
+
+    def _forget_cancelled(self, page: Page, future: Future):
+        """已取消的预取结束后不再保留它，以免继续引用页面。"""
+        if self._cancelled_prefetches.get(page) is future:
+            del self._cancelled_prefetches[page]
+
+    def _is_page_ready(self, page: Page) -> bool:
+        """检查页面的异步 `on_enter` 是否已经完成。
+
+        Raises:
+            Exception: 如果异步 `on_enter` 抛出了异常，则在此处重新抛出。
+        """
+        task = self._enter_tasks.get(page)
+        if task is None:
+            return True
+        if not task.done():
+            return False
+        del self._enter_tasks[page]
+        task.result()
+        return True
+
+    def set_root_page(self, page: Page):
+        """设置根页面。
+
+        Args:
+            page (Page): 新的根页面实例。
+        """
+        if self.current_page:
+            self._call_hook(self.current_page.on_exit)
+        
+        self.root_page = page
+        self.current_page = page
+        self.navigation_history.clear()
+        self._route_params.clear()
+        self.router.rebuild(page)
+        
+        if page:
+            self._enter_page(page)
+
+    def remove_page(self, page: Page) -> bool:
+        """移除指定的页面及其所有后代页面。
+
+        页面会从其父页面的子页面列表中移除，并且其整个子树会从导航历史、
+        当前页面和内部缓存中清除，使这些页面及其持有的组件和图像能够被
+        及时释放。如果当前页面位于被移除的子树中，则先返回到被移除页面的
+        父页面。根页面不能被移除，请使用 `set_root_page` 替换。
+
+        Args:
+            page (Page): 要移除的页面实例。
+
+        Returns:
+            bool: 如果成功移除则返回 True，否则返回 False。
+        """
+        if page is None or page is self.root_page:
+            return False
+
+        parent = page.parent
+        removed = set(page.iter_subtree())
+        found = self.current_page in removed or any(p in removed for p in self.navigation_history)
+
+        # 如果当前页面位于被移除的子树中，首先返回到被移除页面的父页面
+        if self.current_page in removed:
+            self._call_hook(self.current_page.on_exit)
+            self.current_page = parent
+            if parent is not None:
+                self._call_hook(parent.on_child_exit, page)
+                self._enter_page(parent)
+
+        self._purge_pages(removed)
+
+        # 如果页面有父页面，则从父页面的子页面列表中移除该页面
+        if parent is not None and parent.remove_child(page):
+            return True
+        return found
+
+    def _purge_pages(self, pages: set):
+        """从导航历史和内部缓存中清除指定的页面。
+
+        清除后历史中相邻的重复页面会被合并，栈顶与当前页面相同的记录也会
+        被丢弃，以免 `go_back` 停留在原地。
+        """
+        history = []
+        for p in self.navigation_history:
+            if p not in pages and (not history or history[-1] is not p):
+                history.append(p)
+        while history and history[-1] is self.current_page:
+            history.pop()
+        self.navigation_history[:] = history
+
+        for p in pages & self._enter_tasks.keys():
+            self._enter_tasks.pop(p).cancel()
+        for p in pages & self._route_params.keys():
+            del self._route_params[p]
+        for p in pages & self._prefetches.keys():
+            self.cancel_prefetch(p)
+        self._prepared -= pages
+        for p in pages & self._transitions.keys():
+            del self._transitions[p]
+        for p in pages:
+            self.timers.cancel_owner(p)
+            self.idle.cancel_owner(p)
+        for counts in self._transitions.values():
+            for p in pages & counts.keys():
+                del counts[p]
+
+    def get_current_page(self) -> Optional[Page]:
+        """获取当前活动的页面。
+
+        Returns:
+            Page | None: 当前页面实例，如果没有则返回 None。
+        """
+        return self.current_page
+
+    def navigate_to_child(self, child_name: str) -> bool:
+        """导航到当前页面的指定子页面。
+
+        Args:
+            child_name (str): 子页面的名称。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not self.current_page:
+            return False
+        
+        child = self.current_page.get_child(child_name)
+        if child:
+            # 记录导航历史
+            self.navigation_history.append(self.current_page)
+            
+            # 通知当前页面和父页面
+            self._call_hook(self.current_page.on_exit)
+            self._call_hook(self.current_page.on_child_enter, child)
+            
+            # 切换页面
+            previous, self.current_page = self.current_page, child
+            self._enter_page(child, previous)
+            
+            return True
+        return False
+
+    def navigate_to_parent(self) -> bool:
+        """导航到当前页面的父页面。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not self.current_page or not self.current_page.parent:
+            return False
+        
+        parent = self.current_page.parent
+        
+        # 通知相关页面
+        self._call_hook(parent.on_child_exit, self.current_page)
+        self._call_hook(self.current_page.on_exit)
+        
+        # 从历史记录中移除（如果存在）
+        if self.navigation_history and self.navigation_history[-1] == parent:
+            self.navigation_history.pop()
+        
+        # 切换页面
+        previous, self.current_page = self.current_page, parent
+        self._enter_page(parent, previous, reverse=True)
+        
+        return True
+
+    def navigate_to_root(self) -> bool:
+        """导航到根页面。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not self.root_page:
+            return False
+        
+        return self.navigate_to_page(self.root_page)
+
+    def navigate_to_path(self, path: str | List[str]) -> bool:
+        """根据路径导航到指定页面。
+
+        路径通过路由表查找。名称以 `:` 开头的页面可以匹配任意一段路径，
+        匹配到的值可以在目标页面中通过 `route_params` 读取。
+
+        Args:
+            path (str | List[str]): 从根页面开始的绝对路径，可以是 `"/a/b/c"`
+                形式的字符串或路径段列表，开头可以带上根页面的名称。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not self.root_page:
+            return False
+        
+        match = self.router.resolve(path)
+        if match:
+            return self.navigate_to_page(match[0], params=match[1])
+        return False
+
+    def navigate_to_relative_path(self, path: str | List[str]) -> bool:
+        """根据相对路径导航到指定页面。
+
+        Args:
+            path (str | List[str]): 从当前页面开始的相对路径。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not self.current_page:
+            return False
+        
+        if self.current_page not in self.router:
+            # 当前页面不在根页面的树中，退回到逐级查找
+            target_page = self.current_page.find_page_by_path(split_path(path))
+            return self.navigate_to_page(target_page) if target_page else False
+        
+        match = self.router.resolve(path, base=self.current_page)
+        if match:
+            return self.navigate_to_page(match[0], params=match[1])
+        return False
+
+    def get_page_path(self, page: Page) -> Optional[str]:
+        """查询页面在路由表中的路径。
+
+        Args:
+            page (Page): 要查询的页面。
+
+        Returns:
+            str | None: 形如 `"/a/b/c"` 的路径，根页面为 `"/"`；
+                页面不在根页面的树中时返回 None。
+        """
+        return self.router.path_of(page)
+
+    @property
+    def route_params(self) -> dict:
+        """当前页面最近一次按路径导航时匹配到的参数。"""
+        return self._route_params.get(self.current_page, {})
+
+    def navigate_to_page(self, target_page: Page, params: Optional[dict] = None) -> bool:
+        """直接导航到指定页面。
+
+        Args:
+            target_page (Page): 目标页面实例。
+            params (dict | None): 传递给目标页面的路由参数，在其 `on_enter`
+                中即可通过 `route_params` 读取。
+
+        Returns:
+            bool: 如果导航成功则返回 True，否则返回 False。
+        """
+        if not target_page:
+            return False
+        
+        if self.current_page:
+            # 记录当前页面到历史（如果不是返回操作）
+            if (not self.navigation_history or 
+                self.navigation_history[-1] != target_page):
+                self.navigation_history.append(self.current_page)
+            
+            self._call_hook(self.current_page.on_exit)
+        
+        if params:
+            self._route_params[target_page] = dict(params)
+        previous, self.current_page = self.current_page, target_page
+        self._enter_page(target_page, previous)
+        
+        return True
+
+    def go_back(self) -> bool:
+        """返回到历史记录中的前一个页面。
+
+        Returns:
+            bool: 如果返回成功则返回 True，否则返回 False。
+        """
+        if not self.navigation_history:
+            return False
+        
+        previous_page = self.navigation_history.pop()
+        
+        if self.current_page:
+            self._call_hook(self.current_page.on_exit)
+        
+        current, self.current_page = self.current_page, previous_page
+        self._enter_page(previous_page, current, reverse=True)
+        
+        return True
+
+    def call_later(self, delay: float, callback: Callable, *args, owner: Any = None) -> TimerHandle:
+        """在 `delay` 秒后调用一次 `callback(*args)`。
+
+        回调在 `update` 中、页面更新之前执行，可以是协程函数。
+
+        Args:
+            delay (float): 延迟时间（秒）。
+            callback (Callable): 回调函数。
+            *args: 传递给回调函数的参数。
+            owner (Any, optional): 定时器的所有者，通常是创建它的页面；
+                页面被 `remove_page` 移除时其定时器会被一并取消。
+
+        Returns:
+            TimerHandle: 定时器句柄，调用其 `cancel()` 可以取消定时器。
+        """
+        return self.timers.call_later(delay, callback, *args, owner=owner)
+
+    def call_every(self, interval: float, callback: Callable, *args, owner: Any = None) -> TimerHandle:
+        """每隔 `interval` 秒调用一次 `callback(*args)`，直到被取消。
+
+        Args:
+            interval (float): 触发间隔（秒）。
+            callback (Callable): 回调函数。
+            *args: 传递给回调函数的参数。
+            owner (Any, optional): 定时器的所有者，通常是创建它的页面；
+                页面被 `remove_page` 移除时其定时器会被一并取消。
+
+        Returns:
+            TimerHandle: 定时器句柄，调用其 `cancel()` 可以取消定时器。
+        """
+        return self.timers.call_every(interval, callback, *args, owner=owner)
+
+    def add_idle_task(self, work: Callable | Iterable, priority: int = 0, owner: Any = None) -> IdleTask:
+        """登记一个在帧间空闲时间执行的低优先级任务。
+
+        `run_async` 在每帧显示之后、等待下一帧之前自动执行空闲任务；自行
+        编写主循环时，可以调用 `run_idle` 并传入本帧剩余的时间。
+
+        Args:
+            work (Callable | Iterable): 普通函数（作为一个分片执行一次）或生成器
+                （每次 `next` 执行一个分片）。每个分片应尽量短小。
+            priority (int): 优先级，数值越小越先执行。
+            owner (Any, optional): 任务的所有者，通常是创建它的页面；
+                页面被 `remove_page` 移除时其任务会被一并取消。
+
+        Returns:
+            IdleTask: 任务句柄，调用其 `cancel()` 可以取消任务。
+        """
+        return self.idle.add(work, priority, owner)
+
+    def run_idle(self, budget: float) -> float:
+        """在 `budget` 秒内执行空闲任务，不会超出预算。
+
+        Args:
+            budget (float): 本帧剩余的时间（秒）。
+
+        Returns:
+            float: 实际用于执行空闲任务的时间（秒）。
+        """
+        if budget <= 0:
+            return 0.0
+        return self.idle.run(budget)
+
+    def enable_watchdog(self, deadline: float = 0.1, max_incidents: int = 50,
+                        log_path: str | None = None) -> FrameWatchdog:
+        """启用帧超时看门狗。
+
+        `update` 耗时超过 `deadline` 时，看门狗会截取此刻 UI 线程的调用栈，
+        记录正在处理的页面、组件和回调，用于排查偶发的卡顿。
+
+        Args:
+            deadline (float): 帧超时的阈值（秒）。
+            max_incidents (int): 内存中保留的事件数量上限。
+            log_path (str | None): 日志文件路径，为 None 时只保存在内存中。
+
+        Returns:
+            FrameWatchdog: 已启动的看门狗，其 `incidents` 中保存着最近的事件。
+        """
+        self.disable_watchdog()
+        self.watchdog = FrameWatchdog(deadline, max_incidents, log_path)
+        self.watchdog.start()
+        return self.watchdog
+
+    def disable_watchdog(self):
+        """停止并移除帧超时看门狗。"""
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            self.watchdog = None
+
+    def enable_power_save(self, touchscreen: Any = None, idle_after: float = 60.0,
+                          idle_fps: float = 2.0) -> PowerSaver:
+        """启用空闲省电模式。
+
+        超过 `idle_after` 秒没有触摸、组件状态改变或页面切换后进入低速模式，
+        主循环放慢到 `idle_fps` 的频率，每次先读取触摸屏，读到按下时恢复全速。
+
+        Args:
+            touchscreen (maix.touchscreen.TouchScreen | None): 用于唤醒检查的触摸屏。
+            idle_after (float): 进入低速模式前的空闲时间（秒）。
+            idle_fps (float): 低速模式下唤醒检查的频率。
+
+        Returns:
+            PowerSaver: 省电模式对象，可通过其 `stats()` 查看各模式的帧率和 CPU 占用。
+        """
+        self.power = PowerSaver(touchscreen, idle_after, idle_fps)
+        activity.poke()
+        return self.power
+
+    def disable_power_save(self):
+        """关闭空闲省电模式。"""
+        if self.power is not None:
+            self.power.wake()
+            self.power = None
+
+    @property
+    def sleeping(self) -> bool:
+        """当前是否处于空闲省电模式的低速运行状态。"""
+        return self.power is not None and self.power.sleeping
+
+    def wake(self):
+        """立即退出低速模式，例如在收到串口命令、需要刷新界面时调用。"""
+        if self.power is not None:
+            self.power.wake()
+
+    def _idle_delay(self) -> Optional[float]:
+        """低速模式下做一次唤醒检查，仍需休眠时返回距离下一次检查的时间。"""
+        power = self.power
+        if power is None or not power.sleeping or not power.wake_check():
+            return None
+        now = time.perf_counter()
+        self.timers.tick(now)
+        delay = power.idle_period
+        due = self.timers.next_due()
+        if due is not None:
+            delay = min(delay, max(due - now, 0.0))
+        return delay
+
+    def sleep_if_idle(self) -> bool:
+        """在自行编写的主循环中处理低速模式。
+
+        处于低速模式时做一次唤醒检查，仍未唤醒则休眠到下一次检查并返回 True，
+        调用方应跳过本帧的读图、更新和显示；否则立即返回 False。
+
+        Returns:
+            bool: 本帧是否应被跳过。
+        """
+        delay = self._idle_delay()
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    def enable_overlay(self, width: int = 320, height: int = 240, fps: float = 5.0,
+                       hold: float = 0.5, key_color: Sequence[int] = (255, 0, 255),
+                       partial: bool = True) -> UILayer:
+        """启用独立的 UI 层。
+
+        启用后，每帧在页面更新之前由 `UILayer.begin` 决定本帧是否重绘，页面
+        更新之后将 UI 层合成到画面上。页面应将组件绘制到 `overlay.canvas`，
+        并以 `overlay.draw` 作为管理器 `handle_events` 的 `draw` 参数；只有
+        动画在播放的帧中，`overlay.draw` 只包含动画中的组件：
+
+            layer = self.ui_manager.overlay
+            self.button_manager.handle_events(layer.canvas, draw=layer.draw)
+
+        在 `update` 中自行调用 `disp.show` 的页面必须在显示之前调用
+        `overlay.composite(img)`，否则 UI 层会在画面显示之后才被合成而看不到。
+
+        Args:
+            width (int): UI 层的宽度。
+            height (int): UI 层的高度，宽高比应与相机画面一致。
+            fps (float): 没有用户活动时的重绘频率。
+            hold (float): 用户活动后保持逐帧重绘的时间（秒）。
+            key_color (Sequence[int]): 透明的关键色 (R, G, B)。
+            partial (bool): 是否允许只重绘动画中的组件，组件之间有重叠时应为 False。
+
+        Returns:
+            UILayer: 创建的 UI 层。
+        """
+        self.overlay = UILayer(width, height, fps, hold, key_color, partial)
+        return self.overlay
+
+    def disable_overlay(self):
+        """关闭 UI 层，页面重新直接在画面上绘制组件。"""
+        self.overlay = None
+
+    def _update_page(self, page: Page, img: image.Image, now: float):
+        """同步地更新页面；启用了 UI 层时在前后分别开始重绘和合成，页面已自行合成时不再合成。"""
+        overlay = self.overlay
+        if overlay is not None:
+            overlay.begin(now, self.tweens.dirty)
+        invoke(page.update, img)
+        if overlay is not None and not overlay.composited:
+            overlay.composite(img)
+
+    async def _update_page_async(self, page: Page, img: image.Image, now: float):
+        """`_update_page` 的异步版本。"""
+        overlay = self.overlay
+        if overlay is not None:
+            overlay.begin(now, self.tweens.dirty)
+        await invoke_async(page.update, img)
+        if overlay is not None and not overlay.composited:
+            overlay.composite(img)
+
+    def clear_history(self):
+        """清空导航历史记录。"""
+        self.navigation_history.clear()
+
+    def get_current_path(self) -> List[str]:
+        """获取当前页面的完整路径。
+
+        Returns:
+            List[str]: 当前页面的路径。
+        """
+        if self.current_page:
+            return self.current_page.get_path()
+        return []
+
+    def get_navigation_info(self) -> dict:
+        """获取当前导航状态信息。
+
+        Returns:
+            dict: 包含当前页面、路径、历史等信息的字典。
+        """
+        return {
+            'current_page': self.current_page.name if self.current_page else None,
+            'current_path': self.get_current_path(),
+            'can_go_back': len(self.navigation_history) > 0,
+            'can_go_to_parent': (self.current_page and 
+                                self.current_page.parent is not None),
+            'history_depth': len(self.navigation_history),
+            'page_depth': (self.current_page.get_depth() 
+                          if self.current_page else 0)
+        }
+
+    def update(self, img: image.Image):
+        """更新当前活动页面的状态。
+
+        此方法应在主循环中每帧调用，它会调用当前页面的 `update` 方法。
+        处于空闲省电模式的低速状态时，先做一次唤醒检查，仍未唤醒则休眠到下一次
+        检查再照常更新页面，因此 `cam.read()`、`update`、`disp.show()` 形式的
+        主循环也会以 `idle_fps` 的频率运行；需要在低速状态下跳过读图和显示时，
+        在读图之前调用 `sleep_if_idle`。
+
+        Args:
+            img (maix.image.Image): 用于绘制的图像缓冲区。
+        """
+        idle_delay = self._idle_delay()
+        if idle_delay is not None:
+            time.sleep(idle_delay)
+        watchdog = self.watchdog
+        if watchdog is not None:
+            watchdog.begin_frame()
+        try:
+            now = time.perf_counter()
+            self.timers.tick(now)
+            self.tweens.tick(now)
+            page = self.current_page
+            if page and self._is_page_ready(page):
+                active = self._active_transition
+                if active is None or active.incoming is None:
+                    self._update_page(page, img, now)
+                self._finish_frame(img, active)
+        finally:
+            if watchdog is not None:
+                watchdog.end_frame()
+
+    async def update_async(self, img: image.Image):
+        """`update` 的异步版本，可以等待协程形式的 `Page.update`。
+
+        Args:
+            img (maix.image.Image): 用于绘制的图像缓冲区。
+        """
+        idle_delay = self._idle_delay()
+        if idle_delay is not None:
+            await asyncio.sleep(idle_delay)
+        watchdog = self.watchdog
+        if watchdog is not None:
+            watchdog.begin_frame()
+        try:
+            now = time.perf_counter()
+            self.timers.tick(now)
+            self.tweens.tick(now)
+            page = self.current_page
+            if page and self._is_page_ready(page):
+                active = self._active_transition
+                if active is None or active.incoming is None:
+                    await self._update_page_async(page, img, now)
+                self._finish_frame(img, active)
+        finally:
+            if watchdog is not None:
+                watchdog.end_frame()
+
+    def _begin_transition(self, reverse: bool):
+        """以上一帧的画面作为离开页面的截图，开始一次页面切换动画。"""
+        if self.transition is None or self._last_frame is None:
+            return
+        self._active_transition = _ActiveTransition(self.transition, self.transition.snapshot(self._last_frame), reverse)
+
+    def _finish_frame(self, img: image.Image, active: Optional[_ActiveTransition]):
+        """统计帧间隔，并在切换动画期间将动画合成到本帧图像上。
+
+        切换开始后的第一帧照常绘制进入的页面并截图，之后直到动画结束都
+        不再调用页面的 `update`，只在两张截图之间合成。在本帧中才开始的
+        切换（`active` 不是本帧开始时的动画）从下一帧开始播放。
+        """
+        now = time.perf_counter()
+        if self._frame_stamp is not None:
+            self.frame_time += 0.2 * (now - self._frame_stamp - self.frame_time)
+        self._frame_stamp = now
+
+        if active is not None and active is self._active_transition:
+            if self._last_frame is not None and (img.width(), img.height()) != (self._last_frame.width(), self._last_frame.height()):
+                self._active_transition = None  # 图像尺寸改变，放弃动画
+            else:
+                if active.incoming is None:
+                    active.capture(img, self.frame_time)
+                if active.render(img):
+                    self._active_transition = None
+        self._last_frame = img
+        if self.power is not None and not self.power.sleeping:
+            self.power.frame_done(now, self.tweens.active or self._active_transition is not None)
+
+    async def run_async(self, read_frame: Callable[[], Any], show_frame: Callable[[Any], Any] | None = None,
+                        fps: float = 30, should_exit: Callable[[], bool] | None = None):
+        """以异步方式运行 UI 主循环，按帧截止时间让出事件循环。
+
+        每一帧依次读取图像、更新当前页面并显示图像，然后用本帧剩余的时间执行
+        空闲任务（见 `add_idle_task`），再等待到下一帧的截止时间。等待期间
+        事件循环可以处理网络、串口等其他异步任务，而无需额外的线程。
+        `read_frame` 和 `show_frame` 既可以是普通函数，也可以是协程函数。
+
+        Args:
+            read_frame (Callable): 返回本帧图像的函数，例如 `cam.read`。
+            show_frame (Callable | None, optional): 显示图像的函数，例如 `disp.show`。
+            fps (float): 目标帧率。小于等于 0 时不限制帧率，只在每帧之间让出一次。
+            should_exit (Callable | None, optional): 返回 True 时结束循环，例如 `app.need_exit`。
+        """
+        loop = asyncio.get_running_loop()
+        period = 1.0 / fps if fps > 0 else 0.0
+        deadline = loop.time()
+        self._running = True
+        try:
+            while self._running and not (should_exit and should_exit()):
+                idle_delay = self._idle_delay()
+                if idle_delay is not None:
+                    # 低速模式：不读图也不显示，屏幕保持最后一帧
+                    await asyncio.sleep(idle_delay)
+                    deadline = loop.time()
+                    continue
+                deadline += period
+                img = await maybe_await(read_frame())
+                await self.update_async(img)
+                if show_frame is not None:
+                    await maybe_await(show_frame(img))
+                delay = deadline - loop.time()
+                if delay > 0 and self.idle:
+                    delay -= self.run_idle(delay)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # 本帧已超时，重新对齐截止时间，并至少让出一次事件循环
+                    deadline = loop.time()
+                    await asyncio.sleep(0)
+        finally:
+            self._running = False
+
+    def stop(self):
+        """请求 `run_async` 在当前帧结束后退出。"""
+        self._running = False
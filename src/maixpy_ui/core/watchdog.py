@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import deque
+from typing import List, Optional
+
+from . import dispatch
+
+# 本库源码所在的目录，用于区分库内部的栈帧和用户代码的栈帧
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _widget_codes() -> dict:
+    """返回所有组件类中定义的方法的代码对象到类名的映射。"""
+    from ..components.base import Widget
+    codes = {}
+    classes = [Widget]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        for value in vars(cls).values():
+            code = getattr(value, '__code__', None)
+            if code is not None:
+                codes.setdefault(code, cls.__name__)
+    return codes
+
+
+def _describe_frame(frame) -> str:
+    """将栈帧描述为 `函数名 (文件:行号)`。"""
+    code = frame.f_code
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class Incident:
+    """一次帧超时事件。
+
+    Attributes:
+        time (float): 事件发生的时刻（`time.time()`）。
+        elapsed (float): 截取调用栈时本帧已经耗费的时间（秒）。
+        duration (float | None): 本帧的总耗时（秒），帧尚未结束时为 None。
+        page (str | None): 超时时正在处理的页面的路径或名称。
+        widget (str | None): 超时时正在处理的组件，形如 `Slider#3`；不在组件的回调中时只能确定类型，如 `Slider`。
+        callback (str | None): 超时时正在执行的回调或页面钩子。
+        stack (List[str]): UI 线程的调用栈，从外到内。
+    """
+    __slots__ = ('time', 'elapsed', 'duration', 'page', 'widget', 'callback', 'stack')
+
+    def __init__(self, elapsed: float, page: str | None, widget: str | None,
+                 callback: str | None, stack: List[str]):
+        self.time = time.time()
+        self.elapsed = elapsed
+        self.duration = None
+        self.page, self.widget, self.callback = page, widget, callback
+        self.stack = stack
+
+    def format(self) -> str:
+        """将事件格式化为多行文本。"""
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.time))
+        duration = f"{self.duration * 1000:.1f} ms" if self.duration is not None else "未结束"
+        lines = [f"[{stamp}] 帧超时：截取时已耗时 {self.elapsed * 1000:.1f} ms，本帧共 {duration}",
+                 f"  页面: {self.page or '-'}  组件: {self.widget or '-'}  回调: {self.callback or '-'}"]
+        lines.extend(f"    {entry}" for entry in self.stack)
+        return '\n'.join(lines) + '\n'
+
+
+class FrameWatchdog:
+    """帧超时看门狗。
+
+    UI 线程在每帧开始和结束时分别调用 `begin_frame` 与 `end_frame`，只记录
+    时刻，开销可以忽略。后台线程周期性地检查当前帧，一旦耗时超过
+    `deadline`，就截取 UI 线程此刻的调用栈，并从中找出正在处理的页面、
+    组件和回调，记录为一次 `Incident`。每帧最多记录一次。
+
+    事件保存在长度为 `max_incidents` 的队列中；指定 `log_path` 时还会在
+    帧结束后由后台线程追加写入日志文件，文件超过 `max_log_bytes` 时轮换为
+    `log_path + '.1'`，因此日志占用的空间是有限的。
+
+    Attributes:
+        deadline (float): 帧超时的阈值（秒）。
+        incidents (deque): 最近的帧超时事件。
+        log_path (str | None): 日志文件路径。
+        max_log_bytes (int): 单个日志文件的大小上限（字节）。
+    """
+
+    def __init__(self, deadline: float = 0.1, max_incidents: int = 50,
+                 log_path: str | None = None, max_log_bytes: int = 64 * 1024,
+                 max_stack_depth: int = 24):
+        """初始化看门狗，需要调用 `start` 启动后台线程。
+
+        Args:
+            deadline (float): 帧超时的阈值（秒）。
+            max_incidents (int): 内存中保留的事件数量上限。
+            log_path (str | None): 日志文件路径，为 None 时不写文件。
+            max_log_bytes (int): 单个日志文件的大小上限（字节）。
+            max_stack_depth (int): 每次事件记录的调用栈深度上限（取最内层）。
+        """
+        self.deadline = deadline
+        self.incidents = deque(maxlen=max_incidents)
+        self.log_path = log_path
+        self.max_log_bytes = max_log_bytes
+        self.max_stack_depth = max_stack_depth
+        self._thread_id = None    # UI 线程
+        self._frame_start = None  # 当前帧的开始时刻，帧之间为 None
+        self._frame_seq = 0
+        self._reported_seq = -1   # 最近一次记录了事件的帧
+        self._pending = None      # 帧尚未结束、还不能写入日志的事件
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """启动后台检查线程。"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='FrameWatchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止后台检查线程。"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._flush()
+
+    def begin_frame(self):
+        """在 UI 线程中标记一帧的开始。"""
+        self._thread_id = threading.get_ident()
+        self._frame_seq += 1
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """在 UI 线程中标记一帧的结束。"""
+        start = self._frame_start
+        self._frame_start = None
+        pending = self._pending
+        if pending is not None and start is not None and pending.duration is None:
+            pending.duration = time.perf_counter() - start
+
+    def _run(self):
+        """后台线程：以阈值的四分之一为周期检查当前帧。"""
+        while not self._stop.wait(max(self.deadline / 4, 0.002)):
+            self._flush()
+            start, seq = self._frame_start, self._frame_seq
+            if start is None or seq == self._reported_seq:
+                continue
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.deadline:
+                self._reported_seq = seq
+                incident = self._capture(elapsed)
+                if incident is not None:
+                    self.incidents.append(incident)
+                    self._pending = incident
+
+    def _capture(self, elapsed: float) -> Optional[Incident]:
+        """截取 UI 线程的调用栈并归因。
+
+        只读取栈帧的代码对象和行号，不访问 UI 线程栈帧的局部变量；页面和组件
+        来自 UI 线程在 `dispatch.invoke` 和 `dispatch.invoke_async` 中记录的回调所有者。
+        """
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return None
+        calls = list(dispatch.active_calls.get(self._thread_id, ()))
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()  # 从外到内
+
+        from .ui_manager import Page
+        from ..components.base import Widget
+        page = widget = callback = None
+        for _, owner in calls:
+            if isinstance(owner, Page):
+                path = owner.ui_manager.get_page_path(owner) if owner.ui_manager is not None else None
+                page = path or owner.name
+            elif isinstance(owner, Widget):
+                widget = f"{type(owner).__name__}#{owner.widget_id}"
+        invoke_codes = (dispatch.invoke.__code__, dispatch.invoke_async.__code__)
+        widget_codes = _widget_codes() if widget is None else None
+        for i, f in enumerate(frames):
+            if widget_codes is not None and f.f_code in widget_codes:
+                widget = widget_codes[f.f_code]  # 没有经由回调分发时只能确定组件的类型
+            if i > 0 and frames[i - 1].f_code in invoke_codes:
+                callback = _describe_frame(f)
+        if callback is None:
+            # 没有经由回调分发，归因到最内层的用户代码
+            for f in reversed(frames):
+                if not os.path.abspath(f.f_code.co_filename).startswith(_PACKAGE_DIR):
+                    callback = _describe_frame(f)
+                    break
+        stack = [_describe_frame(f) for f in frames[-self.max_stack_depth:]]
+        return Incident(elapsed, page, widget, callback, stack)
+
+    def _flush(self):
+        """帧结束后将待写入的事件追加到日志文件。"""
+        pending = self._pending
+        if pending is None or (pending.duration is None and self._frame_start is not None
+                               and self._frame_seq == self._reported_seq):
+            return
+        self._pending = None
+        if self.log_path is None:
+            return
+        try:
+            if os.path.exists(self.log_path) and os.path.getsize(self.log_path) >= self.max_log_bytes:
+                os.replace(self.log_path, self.log_path + '.1')
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(pending.format())
+        except OSError as e:
+            warnings.warn(f"写入帧超时日志失败: {e}", RuntimeWarning)
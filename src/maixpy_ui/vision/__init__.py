@@ -0,0 +1,6 @@
+from .worker import VisionWorker, VisionResult, hsv_blobs
+from .colorspace import ColorLUT, get_lut
+from .segment import ColorSegmenter, Region, multi_blobs
+from .tracker import BlobTracker, Track, box_iou, find_blobs_detector, segmenter_detector
+from .scene import StaticSceneGate
+from .preview import MaskPreview
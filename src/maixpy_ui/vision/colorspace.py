@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import os
+import warnings
+from collections import OrderedDict
+from typing import Dict, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 查找表需要 NumPy
+    np = None
+
+# 查找表文件的默认缓存目录
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'maixpy_ui')
+
+# 查找表格式的版本，改变构建方式时递增，使旧的缓存文件失效
+_LUT_VERSION = 1
+
+# LAB 的 a、b 通道在表中加上该偏移后以 uint8 保存
+_AB_OFFSET = 128
+
+# 按帧尺寸缓存的中间缓冲区的数量上限，处理尺寸不断变化的 ROI 时淘汰最早的
+MAX_BUFFER_SHAPES = 4
+
+
+def _rgb_to_hsv(rgb):
+    """按 OpenCV 8 位图像的约定将 RGB 转换为 HSV：H 为 [0, 180)，S、V 为 [0, 255]。"""
+    rgb = rgb.astype(np.float64)
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    v = rgb.max(axis=1)
+    delta = v - rgb.min(axis=1)
+    s = np.where(v > 0, delta * 255 / np.maximum(v, 1), 0)
+    safe = np.maximum(delta, 1e-9)
+    h = np.where(v == r, (g - b) / safe,
+                 np.where(v == g, 2 + (b - r) / safe, 4 + (r - g) / safe)) * 60
+    h = np.where(delta > 0, np.mod(h, 360), 0)
+    hsv = np.stack([np.round(h / 2) % 180, np.round(s), v], axis=1)
+    return hsv.astype(np.uint8)
+
+
+def _rgb_to_lab(rgb):
+    """将 sRGB 转换为 LAB（D65）：L 为 [0, 100]，a、b 加上 128 后保存。"""
+    c = rgb.astype(np.float64) / 255
+    c = np.where(c > 0.04045, ((c + 0.055) / 1.055) ** 2.4, c / 12.92)
+    xyz = c @ np.array([[0.412453, 0.212671, 0.019334],
+                        [0.357580, 0.715160, 0.119193],
+                        [0.180423, 0.072169, 0.950227]])
+    xyz /= np.array([0.950456, 1.0, 1.088754])
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+    lab = np.stack([116 * f[:, 1] - 16,
+                    500 * (f[:, 0] - f[:, 1]),
+                    200 * (f[:, 1] - f[:, 2])], axis=1)
+    lab[:, 0] = np.clip(np.round(lab[:, 0]), 0, 100)
+    lab[:, 1:] = np.clip(np.round(lab[:, 1:]), -128, 127) + _AB_OFFSET
+    return lab.astype(np.uint8)
+
+
+_CONVERTERS = {'hsv': _rgb_to_hsv, 'lab': _rgb_to_lab}
+
+
+class ColorLUT:
+    """量化的 RGB 到 HSV/LAB 三维查找表。
+
+    每个通道取高 `bits` 位，共 `2**(3*bits)` 个格子，每个格子保存其中心
+    颜色转换后的值（6 位时为 64³ 个格子、768 KB）。查找表在第一次使用时
+    才会构建，并保存到 `cache_dir` 中，之后直接从文件加载。
+
+    单个像素的转换只需一次下标计算和三次读取。整帧的阈值分割先将阈值
+    预先展开为一张“格子是否在阈值内”的表（按阈值缓存），之后每帧只需
+    计算格子下标并做一次查表，所有中间数组都复用预先分配的缓冲区，也
+    不需要经过 `cv2.cvtColor`。
+
+    HSV 的通道约定与 OpenCV 的 8 位图像相同（H 为 0~180，S、V 为 0~255）；
+    LAB 的约定与 `find_blobs` 相同（L 为 0~100，a、b 为 -128~127）。
+
+    Attributes:
+        space (str): 颜色空间，`'hsv'` 或 `'lab'`。
+        bits (int): 每个通道保留的位数。
+        cache_dir (str | None): 查找表文件的缓存目录，为 None 时不保存。
+    """
+
+    def __init__(self, space: str, bits: int = 6, cache_dir: str | None = DEFAULT_CACHE_DIR,
+                 max_cached_thresholds: int = 8):
+        """初始化查找表，此时尚未构建或加载表。
+
+        Args:
+            space (str): 颜色空间，`'hsv'` 或 `'lab'`。
+            bits (int): 每个通道保留的位数，范围为 1~8。
+            cache_dir (str | None): 查找表文件的缓存目录，为 None 时不保存。
+            max_cached_thresholds (int): 缓存的阈值表的数量上限。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果颜色空间未知或 `bits` 超出范围。
+        """
+        if np is None:
+            raise RuntimeError("ColorLUT 需要 NumPy")
+        if space not in _CONVERTERS:
+            raise ValueError(f"未知的颜色空间 '{space}'")
+        if not 1 <= bits <= 8:
+            raise ValueError("bits 必须在 1~8 之间")
+        self.space = space
+        self.bits = bits
+        self.cache_dir = cache_dir
+        self._shift = 8 - bits
+        self._table = None
+        self._flat = None
+        self._thresholds = OrderedDict()  # 阈值元组 -> 格子是否在阈值内的表
+        self._max_thresholds = max_cached_thresholds
+        self._buffers = {}  # 帧的 (高, 宽) -> (下标, 临时) 缓冲区
+
+    @property
+    def path(self) -> str | None:
+        """查找表文件的路径。"""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{self.space}_{self.bits}bit_v{_LUT_VERSION}.npy")
+
+    @property
+    def table(self):
+        """形状为 `(2**(3*bits), 3)` 的 uint8 查找表，第一次访问时加载或构建。"""
+        if self._table is None:
+            self._load()
+        return self._table
+
+    def _load(self):
+        """从缓存文件加载查找表，文件不存在或损坏时重新构建并保存。"""
+        cells = 1 << (3 * self.bits)
+        path = self.path
+        table = None
+        if path is not None and os.path.exists(path):
+            try:
+                table = np.load(path)
+            except (OSError, ValueError):
+                table = None
+            if table is not None and (table.shape != (cells, 3) or table.dtype != np.uint8):
+                table = None
+        if table is None:
+            table = self._build()
+            if path is not None:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    tmp = path + '.tmp.npy'
+                    np.save(tmp, table)
+                    os.replace(tmp, path)
+                except OSError as e:
+                    warnings.warn(f"保存颜色查找表失败: {e}", RuntimeWarning)
+        self._table = table
+        self._flat = memoryview(table).cast('B')
+
+    def _build(self):
+        """以每个格子的中心颜色构建查找表。"""
+        n = 1 << self.bits
+        centers = (np.arange(n, dtype=np.uint16) << self._shift) + ((1 << self._shift) >> 1)
+        r, g, b = np.meshgrid(centers, centers, centers, indexing='ij')
+        rgb = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+        return _CONVERTERS[self.space](rgb)
+
+    def convert(self, r: int, g: int, b: int) -> Tuple[int, int, int]:
+        """转换单个像素。
+
+        Args:
+            r (int): 红色分量（0~255）。
+            g (int): 绿色分量（0~255）。
+            b (int): 蓝色分量（0~255）。
+
+        Returns:
+            tuple[int, int, int]: HSV 或 LAB 值。
+        """
+        if self._flat is None:
+            self._load()
+        s, bits = self._shift, self.bits
+        i = (((r >> s) << (2 * bits)) | ((g >> s) << bits) | (b >> s)) * 3
+        flat = self._flat
+        if self.space == 'lab':
+            return flat[i], flat[i + 1] - _AB_OFFSET, flat[i + 2] - _AB_OFFSET
+        return flat[i], flat[i + 1], flat[i + 2]
+
+    def threshold_table(self, threshold: Sequence[int]):
+        """返回阈值对应的格子表：在阈值内的格子为 255，否则为 0。
+
+        Args:
+            threshold (Sequence[int]): `[c0_min, c0_max, c1_min, c1_max, c2_min, c2_max]`。
+                HSV 的 H 通道最小值大于最大值时表示跨越 0 度的区间（如红色）。
+
+        Returns:
+            numpy.ndarray: 长度为 `2**(3*bits)` 的 uint8 数组。
+        """
+        key = tuple(int(v) for v in threshold)
+        cached = self._thresholds.get(key)
+        if cached is not None:
+            self._thresholds.move_to_end(key)
+            return cached
+        values = self.table.astype(np.int16)
+        if self.space == 'lab':
+            values[:, 1:] -= _AB_OFFSET
+        inside = np.ones(len(values), dtype=bool)
+        for ch in range(3):
+            lo, hi = key[2 * ch], key[2 * ch + 1]
+            v = values[:, ch]
+            if self.space == 'hsv' and ch == 0 and lo > hi:
+                inside &= (v >= lo) | (v <= hi)
+            else:
+                inside &= (v >= lo) & (v <= hi)
+        result = inside.astype(np.uint8) * 255
+        self._thresholds[key] = result
+        if len(self._thresholds) > self._max_thresholds:
+            self._thresholds.popitem(last=False)
+        return result
+
+    def index(self, frame):
+        """计算整帧每个像素所在的格子下标。
+
+        返回的数组是按帧尺寸复用的内部缓冲区，在下一次调用前有效。
+
+        Args:
+            frame (numpy.ndarray): 形状为 `(高, 宽, 3)` 的 RGB 图像。
+
+        Returns:
+            numpy.ndarray: 形状为 `(高, 宽)` 的 uint32 下标。
+        """
+        shape = frame.shape[:2]
+        buffers = self._buffers.get(shape)
+        if buffers is None:
+            if len(self._buffers) >= MAX_BUFFER_SHAPES:
+                self._buffers.pop(next(iter(self._buffers)))
+            buffers = self._buffers[shape] = (np.empty(shape, np.uint32), np.empty(shape, np.uint32))
+        idx, tmp = buffers
+        s, bits = self._shift, self.bits
+        np.right_shift(frame[..., 0], s, out=idx)
+        np.left_shift(idx, 2 * bits, out=idx)
+        np.right_shift(frame[..., 1], s, out=tmp)
+        np.left_shift(tmp, bits, out=tmp)
+        np.bitwise_or(idx, tmp, out=idx)
+        np.right_shift(frame[..., 2], s, out=tmp)
+        np.bitwise_or(idx, tmp, out=idx)
+        return idx
+
+    def mask(self, frame, threshold: Sequence[int], out=None):
+        """对整帧做阈值分割，在阈值内的像素为 255。
+
+        结果只在查找表的量化精度内与 `cv2.inRange` 相同：同一格子中的像素都按
+        格子中心的颜色判断，因此颜色落在阈值边缘附近的像素可能与逐像素转换
+        的结果不同。`bits` 越大差异越小。
+
+        Args:
+            frame (numpy.ndarray): 形状为 `(高, 宽, 3)` 的 RGB 图像。
+            threshold (Sequence[int]): 阈值，见 `threshold_table`。
+            out (numpy.ndarray | None): 形状为 `(高, 宽)` 的 uint8 输出缓冲区，
+                为 None 时新建。
+
+        Returns:
+            numpy.ndarray: 掩码。
+        """
+        table = self.threshold_table(threshold)
+        idx = self.index(frame)
+        if out is None:
+            out = np.empty(idx.shape, np.uint8)
+        np.take(table, idx, out=out)
+        return out
+
+
+_shared: Dict[Tuple[str, int], ColorLUT] = {}
+
+
+def get_lut(space: str, bits: int = 6) -> ColorLUT:
+    """返回共享的查找表实例，相同的颜色空间和位数只会加载一次。
+
+    Args:
+        space (str): 颜色空间，`'hsv'` 或 `'lab'`。
+        bits (int): 每个通道保留的位数。
+
+    Returns:
+        ColorLUT: 查找表。
+    """
+    lut = _shared.get((space, bits))
+    if lut is None:
+        lut = _shared[(space, bits)] = ColorLUT(space, bits)
+    return lut
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+from typing import Sequence
+
+import maix.image as image
+
+from .colorspace import get_lut
+
+try:
+    import numpy as np
+except ImportError:  # 掩码预览需要 NumPy
+    np = None
+
+
+class MaskPreview:
+    """以较低分辨率计算、用于显示的阈值掩码预览。
+
+    调节阈值时显示的二值图只是给人看的，不需要全分辨率。`set_frame` 只记录
+    当前帧和阈值，不做任何计算：访问 `display` 时，在按 `downscale` 隔行
+    隔列取样的帧上计算小掩码（像素数为原来的 1/downscale²），再按最近邻
+    放大写入显示缓冲区；只有访问 `mask` 时才计算全分辨率掩码。如果本帧的
+    全分辨率掩码已经算过，`display` 会直接复制它而不再计算小掩码。
+
+    `display` 每次访问都会重新写入显示缓冲区，调用方可以直接在上面绘制
+    组件而不会影响之后的结果。所有缓冲区都只在帧尺寸改变时重新分配。
+
+    Attributes:
+        downscale (int): 预览的缩小倍数，例如 2 为 1/2、4 为 1/4。
+        preview_count (int): 计算小掩码的次数。
+        full_count (int): 计算全分辨率掩码的次数。
+    """
+
+    def __init__(self, downscale: int = 2, bits: int = 6):
+        """初始化掩码预览。
+
+        Args:
+            downscale (int): 预览的缩小倍数，至少为 1。
+            bits (int): 使用的颜色查找表每个通道的位数，见 `get_lut`。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果 `downscale` 小于 1。
+        """
+        if np is None:
+            raise RuntimeError("MaskPreview 需要 NumPy")
+        if downscale < 1:
+            raise ValueError("downscale 至少为 1")
+        self.downscale = int(downscale)
+        self.bits = bits
+        self.preview_count = 0
+        self.full_count = 0
+        self._frame = None
+        self._threshold = None
+        self._lut = None
+        self._small = self._full = self._display = None
+        self._small_valid = self._full_valid = False
+
+    def set_frame(self, frame, threshold: Sequence[int], space: str = 'hsv'):
+        """设置当前帧和阈值，之前计算的掩码随之失效。
+
+        帧只被引用而不会被复制，在访问完本帧的掩码之前不应修改其内容。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): 形状为 `(高, 宽, 3)` 的 RGB 图像。
+            threshold (Sequence[int]): 阈值，见 `ColorLUT.threshold_table`。
+            space (str): 阈值的颜色空间，`'hsv'` 或 `'lab'`。
+        """
+        if not isinstance(frame, np.ndarray):
+            frame = image.image2cv(frame, ensure_bgr=False, copy=False)
+        self._frame = frame
+        self._threshold = threshold
+        self._lut = get_lut(space, self.bits)
+        self._small_valid = self._full_valid = False
+
+    def _buffer(self, name: str, shape):
+        """返回指定形状的缓冲区，形状改变时重新分配。"""
+        buf = getattr(self, name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            setattr(self, name, buf)
+        return buf
+
+    def _require_frame(self):
+        """确认已经设置了帧。"""
+        if self._frame is None:
+            raise RuntimeError("尚未调用 set_frame")
+
+    @property
+    def small(self):
+        """低分辨率的掩码，形状约为 `(高 / downscale, 宽 / downscale)`。"""
+        self._require_frame()
+        if not self._small_valid:
+            f = self.downscale
+            sub = self._frame[::f, ::f]
+            out = self._buffer('_small', sub.shape[:2])
+            self._lut.mask(sub, self._threshold, out=out)
+            self._small_valid = True
+            self.preview_count += 1
+        return self._small
+
+    @property
+    def mask(self):
+        """全分辨率的掩码，第一次访问时才计算。"""
+        self._require_frame()
+        if not self._full_valid:
+            out = self._buffer('_full', self._frame.shape[:2])
+            self._lut.mask(self._frame, self._threshold, out=out)
+            self._full_valid = True
+            self.full_count += 1
+        return self._full
+
+    @property
+    def display(self):
+        """用于显示的全尺寸掩码，由小掩码按最近邻放大得到（全分辨率掩码已算过时直接复制）。"""
+        self._require_frame()
+        h, w = self._frame.shape[:2]
+        out = self._buffer('_display', (h, w))
+        if self._full_valid or self.downscale == 1:
+            np.copyto(out, self.mask)
+            return out
+        small = self.small
+        f = self.downscale
+        sh, sw = small.shape
+        fh, fw = h // f, w // f
+        # 整块部分通过一次广播赋值放大，不能整除时余下的行列取最后一个取样
+        out[:fh * f, :fw * f].reshape(fh, f, fw, f)[...] = small[:fh, None, :fw, None]
+        if fw < sw:
+            out[:fh * f, fw * f:] = np.repeat(small[:fh, fw:], f, axis=0)
+        if fh < sh:
+            out[fh * f:, :] = np.repeat(small[fh], f)[:w]
+        return out
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import maix.image as image
+
+try:
+    import numpy as np
+except ImportError:  # 缩略图需要 NumPy
+    np = None
+
+# 每个缩略图格子在每个方向上取样的像素数
+_SAMPLES_PER_CELL = 4
+
+# 灰度的整数权重 (R, G, B)，和为 256
+_GRAY_WEIGHTS = (77, 150, 29)
+
+
+class StaticSceneGate:
+    """画面静止时跳过视觉处理的闸门。
+
+    每帧从图像中按固定网格取样（每个格子 4x4 个像素），转换为灰度并按格子
+    求平均，得到一张很小的缩略图（默认 32x24），与上一次真正处理过的帧的
+    缩略图比较。灰度差超过 `pixel_threshold` 的格子数达到 `min_changed` 时
+    认为画面发生了变化，需要重新处理；否则调用方可以直接沿用上一次的检测
+    结果和叠加层。取样只读取约 1.2 万个像素，与帧的分辨率无关。
+
+    比较的基准是上一次处理时的缩略图，而不是上一帧，因此缓慢的变化会
+    逐渐累积，最终仍会触发重新处理。处理参数（例如阈值）改变时，通过
+    `key` 传入新的值即可强制重新处理。
+
+    Attributes:
+        size (tuple[int, int]): 缩略图的尺寸 `(宽, 高)`。
+        pixel_threshold (float): 一个格子的灰度差（0~255）超过该值时视为变化。
+        min_changed (int): 至少有多少个格子变化时需要重新处理。
+        max_skip (int | None): 最多连续跳过的帧数，为 None 时不限制。
+        result (Any): 上一次处理的结果，见 `run`。
+        changed_cells (int): 最近一次比较时变化的格子数，可用于调整灵敏度。
+        processed (int): 需要处理的帧数。
+        skipped (int): 被跳过的帧数。
+    """
+
+    def __init__(self, size: Tuple[int, int] = (32, 24), pixel_threshold: float = 10,
+                 min_changed: int = 1, max_skip: int | None = None):
+        """初始化闸门。
+
+        Args:
+            size (tuple[int, int]): 缩略图的尺寸 `(宽, 高)`。
+            pixel_threshold (float): 格子的灰度差阈值，越小越灵敏。
+            min_changed (int): 触发重新处理所需的变化格子数，越小越灵敏。
+            max_skip (int | None): 最多连续跳过的帧数，达到后强制处理一次。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果 `min_changed` 小于 1。
+        """
+        if np is None:
+            raise RuntimeError("StaticSceneGate 需要 NumPy")
+        if min_changed < 1:
+            raise ValueError("min_changed 至少为 1")
+        self.size = (int(size[0]), int(size[1]))
+        self.pixel_threshold = pixel_threshold
+        self.min_changed = min_changed
+        self.max_skip = max_skip
+        self.result = None
+        self.changed_cells = 0
+        self.processed = 0
+        self.skipped = 0
+        self._reference = None
+        self._key = None
+        self._run_length = 0  # 当前连续跳过的帧数
+        self._samples: Dict[Tuple[int, int], Tuple[Any, Any]] = {}  # 帧的 (高, 宽) -> 取样下标
+
+    @property
+    def skip_ratio(self) -> float:
+        """被跳过的帧占全部帧的比例。"""
+        total = self.processed + self.skipped
+        return self.skipped / total if total else 0.0
+
+    def reset(self):
+        """清除基准缩略图和缓存的结果，下一帧一定会被处理。"""
+        self._reference = None
+        self.result = None
+
+    def thumbnail(self, frame):
+        """生成帧的灰度缩略图。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): RGB 或灰度图像。
+
+        Returns:
+            numpy.ndarray: 形状为 `(高, 宽)` 的 float32 缩略图。
+        """
+        if not isinstance(frame, np.ndarray):
+            frame = image.image2cv(frame, ensure_bgr=False, copy=False)
+        shape = frame.shape[:2]
+        samples = self._samples.get(shape)
+        if samples is None:
+            tw, th = self.size
+            n = _SAMPLES_PER_CELL
+            ys = ((np.arange(th * n) + 0.5) * shape[0] / (th * n)).astype(np.intp)
+            xs = ((np.arange(tw * n) + 0.5) * shape[1] / (tw * n)).astype(np.intp)
+            samples = self._samples[shape] = (ys[:, None], xs[None, :])
+        sub = frame[samples]
+        if sub.ndim == 3:
+            r, g, b = _GRAY_WEIGHTS
+            gray = (sub[..., 0] * np.uint16(r) + sub[..., 1] * np.uint16(g) + sub[..., 2] * np.uint16(b)) >> 8
+        else:
+            gray = sub
+        tw, th = self.size
+        n = _SAMPLES_PER_CELL
+        return gray.reshape(th, n, tw, n).mean(axis=(1, 3), dtype=np.float32)
+
+    def changed(self, frame, key: Hashable = None) -> bool:
+        """判断本帧是否需要处理；需要时以本帧作为新的比较基准。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): 当前帧。
+            key (Hashable): 处理参数的标识，例如阈值的版本号；与上一次处理时不同
+                时一定需要处理。
+
+        Returns:
+            bool: True 表示画面或参数发生了变化，调用方应重新处理本帧。
+        """
+        thumb = self.thumbnail(frame)
+        if self._reference is None or key != self._key:
+            self.changed_cells = thumb.size
+        else:
+            self.changed_cells = int(np.count_nonzero(np.abs(thumb - self._reference) > self.pixel_threshold))
+        need = (self.changed_cells >= self.min_changed
+                or (self.max_skip is not None and self._run_length >= self.max_skip))
+        if need:
+            self._reference = thumb
+            self._key = key
+            self._run_length = 0
+            self.processed += 1
+        else:
+            self._run_length += 1
+            self.skipped += 1
+        return need
+
+    def run(self, frame, process: Callable[[Any], Any], key: Hashable = None) -> Any:
+        """画面变化时调用 `process(frame)` 并缓存其结果，否则直接返回缓存的结果。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): 当前帧。
+            process (Callable): 处理函数，参数为 `frame`。
+            key (Hashable): 处理参数的标识，见 `changed`。
+
+        Returns:
+            Any: 本帧或上一次处理的结果。
+        """
+        if self.changed(frame, key):
+            try:
+                self.result = process(frame)
+            except Exception:
+                self._reference = None  # 处理失败时下一帧重新处理
+                raise
+        return self.result
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+from typing import Dict, List, Sequence, Tuple
+
+from .colorspace import MAX_BUFFER_SHAPES, ColorLUT, get_lut
+
+try:
+    import numpy as np
+except ImportError:  # 分割需要 NumPy
+    np = None
+
+# 一组阈值最多可以包含的阈值数量（每个阈值占用位掩码中的一位）
+MAX_THRESHOLDS = 64
+
+
+class Region:
+    """一个标签在整帧中的外接矩形和面积。
+
+    Attributes:
+        label (int): 标签，即阈值在列表中的下标加 1。
+        x (int): 外接矩形左上角的 x 坐标。
+        y (int): 外接矩形左上角的 y 坐标。
+        w (int): 外接矩形的宽度。
+        h (int): 外接矩形的高度。
+        area (int): 属于该标签的像素数。
+    """
+    __slots__ = ('label', 'x', 'y', 'w', 'h', 'area')
+
+    def __init__(self, label: int, x: int, y: int, w: int, h: int, area: int):
+        self.label = label
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.area = area
+
+    def rect(self) -> Tuple[int, int, int, int]:
+        """返回 `(x, y, w, h)`。"""
+        return self.x, self.y, self.w, self.h
+
+    def __repr__(self) -> str:
+        return f"Region(label={self.label}, rect=({self.x}, {self.y}, {self.w}, {self.h}), area={self.area})"
+
+
+class ColorSegmenter:
+    """一次遍历完成多组颜色阈值的分割。
+
+    构建时先为三个通道各生成一张 256 项的位掩码表（第 k 位表示该通道的值
+    落在第 k 个阈值的范围内），再用它们把 `ColorLUT` 的每个格子展开为
+    一个标签：三个通道的位掩码按位与后取最低的一位，即第一个包含该颜色
+    的阈值。之后每帧只需计算像素所在的格子并查一次标签表，得到标签图，
+    耗时与阈值的数量无关。
+
+    各标签的外接矩形和面积由 `regions` 通过两次 `bincount`（按行、按列）
+    一次性统计，同样与阈值的数量基本无关。注意这里统计的是每种颜色在
+    整帧中的范围，而不是每个连通块。
+
+    Attributes:
+        space (str): 颜色空间，`'lab'` 或 `'hsv'`。
+        thresholds (List[List[int]]): 阈值列表，标签 k 对应 `thresholds[k - 1]`。
+    """
+
+    def __init__(self, thresholds: Sequence[Sequence[int]], space: str = 'lab', lut: ColorLUT | None = None):
+        """初始化分割器。
+
+        Args:
+            thresholds (Sequence[Sequence[int]]): 阈值列表，每个阈值为
+                `[c0_min, c0_max, c1_min, c1_max, c2_min, c2_max]`。
+            space (str): 颜色空间。
+            lut (ColorLUT | None): 使用的查找表，为 None 时使用共享的 6 位查找表。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+        """
+        if np is None:
+            raise RuntimeError("ColorSegmenter 需要 NumPy")
+        self.space = space
+        self._lut = lut if lut is not None else get_lut(space)
+        self.thresholds = []
+        self._labels_table = None
+        self._buffers = {}  # 帧的 (高, 宽) -> 统计用的缓冲区
+        self.set_thresholds(thresholds)
+
+    def set_thresholds(self, thresholds: Sequence[Sequence[int]]) -> bool:
+        """修改阈值列表，只有阈值真正改变时才重新生成标签表。
+
+        Args:
+            thresholds (Sequence[Sequence[int]]): 新的阈值列表。
+
+        Returns:
+            bool: 标签表是否被重新生成。
+
+        Raises:
+            ValueError: 如果阈值数量超过 `MAX_THRESHOLDS` 或某个阈值的长度不为 6。
+        """
+        new = [[int(v) for v in t] for t in thresholds]
+        if len(new) > MAX_THRESHOLDS:
+            raise ValueError(f"最多支持 {MAX_THRESHOLDS} 个阈值")
+        if any(len(t) != 6 for t in new):
+            raise ValueError("每个阈值必须包含 6 个值")
+        if new == self.thresholds and self._labels_table is not None:
+            return False
+        self.thresholds = new
+        self._labels_table = self._build_labels_table()
+        return True
+
+    def _channel_masks(self, ch: int, offset: int):
+        """生成一个通道的位掩码表，下标为表中保存的通道值（0~255）。"""
+        values = np.arange(256, dtype=np.int16) - offset
+        masks = np.zeros(256, dtype=np.uint64)
+        for k, t in enumerate(self.thresholds):
+            lo, hi = t[2 * ch], t[2 * ch + 1]
+            if self.space == 'hsv' and ch == 0 and lo > hi:
+                inside = (values >= lo) | (values <= hi)
+            else:
+                inside = (values >= lo) & (values <= hi)
+            masks[inside] |= np.uint64(1 << k)
+        return masks
+
+    def _build_labels_table(self):
+        """将每个格子展开为标签：第一个包含该格子的阈值的下标加 1，没有时为 0。"""
+        table = self._lut.table
+        bits = np.full(len(table), ~np.uint64(0), dtype=np.uint64)
+        for ch in range(3):
+            offset = 128 if self.space == 'lab' and ch > 0 else 0
+            bits &= self._channel_masks(ch, offset)[table[:, ch]]
+        labels = np.zeros(len(table), dtype=np.uint8)
+        # 从后往前赋值，使编号较小的阈值优先
+        for k in range(len(self.thresholds) - 1, -1, -1):
+            labels[(bits & np.uint64(1 << k)) != 0] = k + 1
+        return labels
+
+    def segment(self, frame, out=None):
+        """生成整帧的标签图。
+
+        Args:
+            frame (numpy.ndarray): 形状为 `(高, 宽, 3)` 的 RGB 图像。
+            out (numpy.ndarray | None): 形状为 `(高, 宽)` 的 uint8 输出缓冲区，
+                为 None 时新建。
+
+        Returns:
+            numpy.ndarray: 标签图，0 为背景，k 表示第 k 个阈值。
+        """
+        idx = self._lut.index(frame)
+        if out is None:
+            out = np.empty(idx.shape, np.uint8)
+        np.take(self._labels_table, idx, out=out)
+        return out
+
+    def regions(self, labels, min_area: int = 0) -> Dict[int, Region]:
+        """统计每个标签的外接矩形和面积。
+
+        Args:
+            labels (numpy.ndarray): `segment` 生成的标签图。
+            min_area (int): 面积小于该值的标签会被忽略。
+
+        Returns:
+            dict[int, Region]: 标签 -> 区域，不包含背景和未出现的标签。
+        """
+        h, w = labels.shape
+        n = len(self.thresholds) + 1
+        key = (h, w, n)
+        buffers = self._buffers.get(key)
+        if buffers is None:
+            if len(self._buffers) >= MAX_BUFFER_SHAPES:
+                self._buffers.pop(next(iter(self._buffers)))
+            rows = (np.arange(h, dtype=np.intp) * n)[:, None]
+            cols = (np.arange(w, dtype=np.intp) * n)[None, :]
+            buffers = self._buffers[key] = (rows, cols, np.empty((h, w), np.intp))
+        rows, cols, tmp = buffers
+        np.add(labels, rows, out=tmp)
+        per_row = np.bincount(tmp.ravel(), minlength=h * n).reshape(h, n)
+        np.add(labels, cols, out=tmp)
+        per_col = np.bincount(tmp.ravel(), minlength=w * n).reshape(w, n)
+        areas = per_row.sum(axis=0)
+        result = {}
+        for label in range(1, n):
+            area = int(areas[label])
+            if area == 0 or area < min_area:
+                continue
+            ys = np.flatnonzero(per_row[:, label])
+            xs = np.flatnonzero(per_col[:, label])
+            result[label] = Region(label, int(xs[0]), int(ys[0]),
+                                   int(xs[-1] - xs[0] + 1), int(ys[-1] - ys[0] + 1), area)
+        return result
+
+
+_segmenters: Dict[Tuple[str, Tuple[Tuple[int, ...], ...]], ColorSegmenter] = {}
+
+
+def multi_blobs(frame, mask, params) -> List[Tuple[int, int, int, int, int, int]]:
+    """用于 `VisionWorker` 的处理函数：多组阈值一次分割。
+
+    Args:
+        frame (numpy.ndarray): RGB 图像。
+        mask (numpy.ndarray | None): 标签图的输出缓冲区。
+        params (dict): `thresholds` 为阈值列表，可选的 `space`（默认 `'lab'`）
+            和 `min_area`（默认 0）。
+
+    Returns:
+        list: 每个出现的标签一项 `(label, x, y, w, h, area)`。
+    """
+    space = params.get('space', 'lab')
+    key = (space, tuple(tuple(t) for t in params['thresholds']))
+    segmenter = _segmenters.get(key)
+    if segmenter is None:
+        _segmenters.clear()  # 阈值改变后旧的分割器不再需要
+        segmenter = _segmenters[key] = ColorSegmenter(params['thresholds'], space)
+    labels = segmenter.segment(frame, out=mask)
+    regions = segmenter.regions(labels, params.get('min_area', 0))
+    return [(r.label, r.x, r.y, r.w, r.h, r.area) for r in regions.values()]
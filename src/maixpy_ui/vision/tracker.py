@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import itertools
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .segment import ColorSegmenter
+
+try:
+    import numpy as np
+except ImportError:  # 关联需要 NumPy
+    np = None
+
+# 检测函数的签名：detect(frame, roi) -> 检测结果序列，每项为 (x, y, w, h, ...)，
+# roi 为 (x, y, w, h) 或 None（整帧）
+Detector = Callable[[object, Optional[Tuple[int, int, int, int]]], Sequence[Sequence[float]]]
+
+
+def _frame_size(frame) -> Tuple[int, int]:
+    """返回帧的 (宽, 高)，支持 maix.image.Image 和 NumPy 数组。"""
+    if hasattr(frame, 'shape'):
+        return frame.shape[1], frame.shape[0]
+    return frame.width(), frame.height()
+
+
+def box_iou(a, b):
+    """计算两组矩形两两之间的 IoU。
+
+    Args:
+        a (numpy.ndarray): 形状为 `(N, 4)` 的 `(x, y, w, h)`。
+        b (numpy.ndarray): 形状为 `(M, 4)` 的 `(x, y, w, h)`。
+
+    Returns:
+        numpy.ndarray: 形状为 `(N, M)` 的 IoU 矩阵。
+    """
+    ax1, ay1 = a[:, 0:1], a[:, 1:2]
+    ax2, ay2 = ax1 + a[:, 2:3], ay1 + a[:, 3:4]
+    bx1, by1 = b[:, 0], b[:, 1]
+    bx2, by2 = bx1 + b[:, 2], by1 + b[:, 3]
+    iw = np.clip(np.minimum(ax2, bx2) - np.maximum(ax1, bx1), 0, None)
+    ih = np.clip(np.minimum(ay2, by2) - np.maximum(ay1, by1), 0, None)
+    inter = iw * ih
+    union = a[:, 2:3] * a[:, 3:4] + b[:, 2] * b[:, 3] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+class Track:
+    """一个被持续跟踪的目标。
+
+    Attributes:
+        track_id (int): 稳定的目标 ID。
+        box (tuple): 最近一次检测到的 `(x, y, w, h)`。
+        detection (tuple): 最近一次检测结果的完整内容（包括面积、标签等附加字段）。
+        velocity (tuple): 最近一次更新时中心点的位移 `(dx, dy)`，用于预测 ROI。
+        hits (int): 被检测到的总帧数。
+        missed (int): 连续未被检测到的帧数。
+    """
+    __slots__ = ('track_id', 'box', 'detection', 'velocity', 'hits', 'missed')
+
+    def __init__(self, track_id: int, detection: Sequence[float]):
+        self.track_id = track_id
+        self.detection = tuple(detection)
+        self.box = tuple(detection[:4])
+        self.velocity = (0.0, 0.0)
+        self.hits = 1
+        self.missed = 0
+
+    def update(self, detection: Sequence[float]):
+        """用新的检测结果更新目标。"""
+        x, y, w, h = detection[:4]
+        px, py, pw, ph = self.box
+        self.velocity = (x + w / 2 - px - pw / 2, y + h / 2 - py - ph / 2)
+        self.detection = tuple(detection)
+        self.box = (x, y, w, h)
+        self.hits += 1
+        self.missed = 0
+
+    def predicted_box(self) -> Tuple[float, float, float, float]:
+        """按上一次的位移外推出下一帧的位置。"""
+        x, y, w, h = self.box
+        return x + self.velocity[0], y + self.velocity[1], w, h
+
+    def __repr__(self) -> str:
+        return f"Track(id={self.track_id}, box={self.box}, hits={self.hits}, missed={self.missed})"
+
+
+class BlobTracker:
+    """帧间关联检测结果并分配稳定 ID 的跟踪器。
+
+    每隔 `full_scan_interval` 帧（或者没有任何目标时）在整帧上检测一次；
+    其余帧只在已知目标的预测位置周围、按 `roi_padding` 扩大后的 ROI 内
+    检测，相互重叠的 ROI 会被合并。目标少且小时，检测的像素数远小于整帧。
+    新出现的目标在下一次整帧检测时被发现。
+
+    检测结果与已有目标通过向量化的 IoU 矩阵（或中心点距离）关联，按匹配
+    程度从高到低贪心地一一配对；未匹配的检测成为新目标，连续 `max_missed`
+    帧未被检测到的目标被移除。
+
+    Attributes:
+        tracks (List[Track]): 当前的目标列表。
+        full_scans (int): 整帧检测的次数。
+        roi_scans (int): 只在 ROI 内检测的帧数。
+        scanned_pixels (int): 累计检测的像素数，可与整帧像素数比较检测开销。
+    """
+
+    def __init__(self, detect: Detector, full_scan_interval: int = 10, roi_padding: float = 0.5,
+                 min_padding: int = 8, match: str = 'iou', iou_threshold: float = 0.2,
+                 max_distance: float = 1.0, max_missed: int = 3):
+        """初始化跟踪器。
+
+        Args:
+            detect (Callable): 检测函数 `detect(frame, roi)`，`roi` 为 None 时检测整帧，
+                返回 `(x, y, w, h, ...)` 的序列，坐标均相对于整帧。
+            full_scan_interval (int): 整帧检测的间隔帧数。
+            roi_padding (float): ROI 在目标每侧扩大的比例（相对于目标的宽高）。
+            min_padding (int): ROI 每侧至少扩大的像素数。
+            match (str): 关联方式，`'iou'` 或 `'centroid'`。
+            iou_threshold (float): 按 IoU 关联时的最小 IoU。
+            max_distance (float): 按中心点关联时的最大距离，相对于目标宽高中的较大者。
+            max_missed (int): 目标连续未被检测到多少帧后被移除。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果 `match` 不是 `'iou'` 或 `'centroid'`。
+        """
+        if np is None:
+            raise RuntimeError("BlobTracker 需要 NumPy")
+        if match not in ('iou', 'centroid'):
+            raise ValueError("match 必须是 'iou' 或 'centroid'")
+        self.detect = detect
+        self.full_scan_interval = max(1, full_scan_interval)
+        self.roi_padding = roi_padding
+        self.min_padding = min_padding
+        self.match = match
+        self.iou_threshold = iou_threshold
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.tracks = []
+        self._ids = itertools.count(1)
+        self._frame = 0
+        self.full_scans = 0
+        self.roi_scans = 0
+        self.scanned_pixels = 0
+
+    def reset(self):
+        """清除所有目标，下一帧进行整帧检测。"""
+        self.tracks.clear()
+        self._frame = 0
+
+    def _rois(self, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        """根据目标的预测位置生成合并后的 ROI。"""
+        rects = []
+        for track in self.tracks:
+            x, y, w, h = track.predicted_box()
+            px = max(self.min_padding, w * self.roi_padding)
+            py = max(self.min_padding, h * self.roi_padding)
+            x1, y1 = max(0, int(x - px)), max(0, int(y - py))
+            x2, y2 = min(width, int(x + w + px + 1)), min(height, int(y + h + py + 1))
+            if x2 > x1 and y2 > y1:
+                rects.append([x1, y1, x2, y2])
+        # 反复合并相交的矩形，直到没有相交为止
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(rects)):
+                for j in range(i + 1, len(rects)):
+                    a, b = rects[i], rects[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        rects[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        del rects[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        return [(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in rects]
+
+    def _associate(self, detections) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """将检测结果与目标配对，返回 (配对列表, 未匹配的检测下标)。"""
+        if not self.tracks or len(detections) == 0:
+            return [], list(range(len(detections)))
+        boxes = np.array([t.predicted_box() for t in self.tracks], dtype=np.float64)
+        det = detections[:, :4]
+        if self.match == 'iou':
+            score = box_iou(boxes, det)
+            valid = score >= self.iou_threshold
+        else:
+            tc = boxes[:, :2] + boxes[:, 2:4] / 2
+            dc = det[:, :2] + det[:, 2:4] / 2
+            dist = np.hypot(tc[:, None, 0] - dc[None, :, 0], tc[:, None, 1] - dc[None, :, 1])
+            limit = np.maximum(boxes[:, 2], boxes[:, 3])[:, None] * self.max_distance
+            score = -dist
+            valid = dist <= limit
+        pairs = []
+        used_t, used_d = set(), set()
+        for flat in np.argsort(-score, axis=None):
+            ti, di = divmod(int(flat), score.shape[1])
+            if not valid[ti, di]:
+                continue
+            if ti in used_t or di in used_d:
+                continue
+            pairs.append((ti, di))
+            used_t.add(ti)
+            used_d.add(di)
+            if len(used_t) == len(self.tracks) or len(used_d) == len(det):
+                break
+        return pairs, [i for i in range(len(det)) if i not in used_d]
+
+    def update(self, frame) -> List[Track]:
+        """处理一帧：检测、关联并更新目标。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): 当前帧，会原样传给检测函数。
+
+        Returns:
+            List[Track]: 本帧被检测到的目标（`missed == 0`）。
+        """
+        width, height = _frame_size(frame)
+        full = not self.tracks or self._frame % self.full_scan_interval == 0
+        self._frame += 1
+        if full:
+            rows = list(self.detect(frame, None))
+            self.full_scans += 1
+            self.scanned_pixels += width * height
+        else:
+            rows = []
+            for roi in self._rois(width, height):
+                rows.extend(self.detect(frame, roi))
+                self.scanned_pixels += roi[2] * roi[3]
+            self.roi_scans += 1
+        detections = np.array(rows, dtype=np.float64).reshape(len(rows), -1) if rows else np.zeros((0, 4))
+
+        pairs, unmatched = self._associate(detections)
+        matched = set()
+        for ti, di in pairs:
+            self.tracks[ti].update(rows[di])
+            matched.add(ti)
+        for ti, track in enumerate(self.tracks):
+            if ti not in matched:
+                track.missed += 1
+        self.tracks = [t for t in self.tracks if t.missed <= self.max_missed]
+        for di in unmatched:
+            self.tracks.append(Track(next(self._ids), rows[di]))
+        return [t for t in self.tracks if t.missed == 0]
+
+
+def find_blobs_detector(thresholds: Sequence[Sequence[int]], pixels_threshold: int = 10,
+                        merge: bool = False) -> Detector:
+    """生成基于 `maix.image.Image.find_blobs` 的检测函数，ROI 直接交给 `find_blobs`。
+
+    Args:
+        thresholds (Sequence[Sequence[int]]): LAB 阈值列表，可以传入 `ThresholdTuner.blob_thresholds`
+            使阈值随调节器更新。
+        pixels_threshold (int): 色块的最小像素数。
+        merge (bool): 是否合并相交的色块。
+
+    Returns:
+        Callable: 检测函数，返回 `(x, y, w, h, pixels)`。
+    """
+    def detect(img, roi):
+        kwargs = {'pixels_threshold': pixels_threshold, 'merge': merge}
+        if roi is not None:
+            kwargs['roi'] = list(roi)
+        return [(b.x(), b.y(), b.w(), b.h(), b.pixels()) for b in img.find_blobs(thresholds, **kwargs)]
+    return detect
+
+
+def segmenter_detector(segmenter: ColorSegmenter, min_area: int = 10) -> Detector:
+    """生成基于 `ColorSegmenter` 的检测函数，ROI 内只分割裁剪出的区域。
+
+    每个 ROI 内每种颜色返回一个区域，因此适合每种颜色只有一个目标，或目标
+    之间相距较远、ROI 互不重叠的场景。
+
+    Args:
+        segmenter (ColorSegmenter): 分割器。
+        min_area (int): 区域的最小面积。
+
+    Returns:
+        Callable: 检测函数，返回 `(x, y, w, h, area, label)`，帧为 NumPy 数组。
+    """
+    def detect(frame, roi):
+        ox = oy = 0
+        if roi is not None:
+            ox, oy, w, h = roi
+            frame = frame[oy:oy + h, ox:ox + w]
+        labels = segmenter.segment(frame)
+        return [(r.x + ox, r.y + oy, r.w, r.h, r.area, r.label)
+                for r in segmenter.regions(labels, min_area).values()]
+    return detect
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+__author__ = 'HYKMAX'
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import maix.image as image
+
+from .colorspace import get_lut
+
+try:
+    import numpy as np
+except ImportError:  # 共享内存帧需要 NumPy
+    np = None
+
+
+def hsv_blobs(frame, mask, params) -> list:
+    """内置的处理函数：HSV 阈值分割并返回色块的外接矩形。
+
+    与示例中 `ColorThresholdPage` 的 HSV 模式相同：按阈值生成掩码并查找外
+    轮廓。掩码通过 HSV 查找表（见 `ColorLUT`）一次查表得到，直接写入共享
+    内存中的 `mask`。
+
+    Args:
+        frame (numpy.ndarray): RGB 图像。
+        mask (numpy.ndarray | None): 单通道掩码的输出缓冲区。
+        params (dict): `threshold` 为 `[h_min, h_max, s_min, s_max, v_min, v_max]`，
+            可选的 `min_area` 为色块的最小面积（像素），默认为 0。
+
+    Returns:
+        list: 按面积从大到小排列的 `(x, y, w, h, area)`。
+    """
+    import cv2
+
+    mask = get_lut('hsv').mask(frame, params['threshold'], out=mask)
+    min_area = params.get('min_area', 0)
+    blobs = []
+    for c in cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2]:
+        area = int(cv2.contourArea(c))
+        if area >= min_area:
+            blobs.append((*cv2.boundingRect(c), area))
+    blobs.sort(key=lambda b: b[4], reverse=True)
+    return blobs
+
+
+def _worker_main(process: Callable, frame_names: Sequence[str], mask_names: Sequence[str] | None,
+                 shape: Tuple[int, ...], jobs, results):
+    """子进程的主循环：从 `jobs` 接收槽位编号，处理后将结果发回 `results`。
+
+    共享内存由父进程创建和释放，子进程只按名称映射。
+    """
+    segments = [shared_memory.SharedMemory(name=name) for name in frame_names]
+    segments += [shared_memory.SharedMemory(name=name) for name in mask_names or ()]
+    slots = len(frame_names)
+    frames = [np.ndarray(shape, np.uint8, shm.buf) for shm in segments[:slots]]
+    masks = [np.ndarray(shape[:2], np.uint8, shm.buf) for shm in segments[slots:]] or [None] * slots
+    params = None
+    try:
+        while True:
+            job = jobs.recv()
+            if job is None:
+                break
+            slot, seq, changed, new_params = job
+            if changed:
+                params = new_params
+            start = time.perf_counter()
+            try:
+                data, error = process(frames[slot], masks[slot], params), None
+            except Exception as e:
+                data, error = None, f"{type(e).__name__}: {e}"
+            results.send((slot, seq, data, error, time.perf_counter() - start))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del frames, masks
+        for shm in segments:
+            shm.close()
+
+
+class VisionResult:
+    """视觉子进程返回的一次处理结果。
+
+    Attributes:
+        seq (int): 对应帧的序号，即 `submit` 的返回值。
+        data (Any): 处理函数的返回值，例如色块列表；出错时为 None。
+        mask (numpy.ndarray | None): 处理函数写入的掩码，直接引用共享内存，
+            只在取得下一个结果之前有效，需要长期保存时应复制。
+        error (str | None): 处理函数抛出的异常，没有出错时为 None。
+        elapsed (float): 处理函数的耗时（秒）。
+        latency (float): 从提交帧到取得结果的时间（秒）。
+    """
+    __slots__ = ('seq', 'data', 'mask', 'error', 'elapsed', 'latency')
+
+    def __init__(self, seq: int, data: Any, mask, error: str | None, elapsed: float, latency: float):
+        self.seq, self.data, self.mask = seq, data, mask
+        self.error = error
+        self.elapsed, self.latency = elapsed, latency
+
+
+class VisionWorker:
+    """在独立进程中运行视觉处理的工作者。
+
+    UI 线程每帧调用 `submit` 提交图像，用 `poll` 取回最新的结果并叠加绘制。
+    图像通过共享内存中的环形缓冲区传递，每个槽位一帧，子进程直接在共享
+    内存上处理，不经过序列化；进程间只传递槽位编号、参数和处理函数的
+    （通常很小的）返回值。掩码同样写在每个槽位对应的共享内存中。
+
+    三个槽位分别用于子进程正在处理的帧、排队等待处理的帧和最新结果所
+    引用的帧。没有空闲槽位时 `submit` 直接放弃本帧并返回 None，因此视觉
+    处理再慢也不会拖慢 UI 的帧率，只是结果更新得更慢。
+
+    处理函数的签名为 `process(frame, mask, params)`，在子进程中调用，必须
+    是可以被 pickle 的模块级函数，可参考内置的 `hsv_blobs`。
+
+    Attributes:
+        shape (tuple): 帧的形状 `(高, 宽, 通道数)`。
+        latest (VisionResult | None): 最新的处理结果。
+        dropped (int): 因为没有空闲槽位而放弃的帧数。
+    """
+
+    def __init__(self, process: Callable, width: int, height: int, channels: int = 3,
+                 params: Any = None, with_mask: bool = True, slots: int = 3,
+                 start_method: str | None = None):
+        """创建共享内存并启动子进程。
+
+        Args:
+            process (Callable): 处理函数 `process(frame, mask, params)`。
+            width (int): 帧的宽度。
+            height (int): 帧的高度。
+            channels (int): 帧的通道数。
+            params (Any): 传给处理函数的初始参数，可通过 `set_params` 修改。
+            with_mask (bool): 是否为每个槽位分配单通道掩码缓冲区。
+            slots (int): 环形缓冲区的槽位数，至少为 2。
+            start_method (str | None): 子进程的启动方式（`'fork'`、`'spawn'` 等），
+                为 None 时使用平台默认方式。
+
+        Raises:
+            RuntimeError: 如果没有安装 NumPy。
+            ValueError: 如果 `slots` 小于 2。
+        """
+        if np is None:
+            raise RuntimeError("VisionWorker 需要 NumPy")
+        if slots < 2:
+            raise ValueError("slots 至少为 2")
+        self.shape = (height, width, channels)
+        frame_size = height * width * channels
+        self._frame_shm = [shared_memory.SharedMemory(create=True, size=frame_size) for _ in range(slots)]
+        self._mask_shm = [shared_memory.SharedMemory(create=True, size=height * width)
+                          for _ in range(slots)] if with_mask else []
+        self._frames = [np.ndarray(self.shape, np.uint8, shm.buf) for shm in self._frame_shm]
+        self._masks = [np.ndarray((height, width), np.uint8, shm.buf) for shm in self._mask_shm]
+        self._free = list(range(slots))
+        self._submitted = {}   # 槽位 -> (序号, 提交时刻)
+        self._held = None      # 最新结果引用的槽位
+        self._exited = False   # 结果管道已读到 EOF，即子进程已经退出
+        self._seq = 0
+        self._params = params
+        self._params_dirty = True
+        self.latest = None
+        self._fresh = False    # latest 是否尚未被 poll 取走
+        self.dropped = 0
+        self._results_count = 0
+        self._started_at = time.perf_counter()
+
+        ctx = multiprocessing.get_context(start_method)
+        jobs_reader, self._jobs = ctx.Pipe(duplex=False)
+        self._results, results_writer = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_worker_main, name='VisionWorker', daemon=True,
+            args=(process, [shm.name for shm in self._frame_shm],
+                  [shm.name for shm in self._mask_shm] or None, self.shape,
+                  jobs_reader, results_writer))
+        self._process.start()
+        # 关闭父进程中属于子进程的一端，子进程退出时 recv 才会收到 EOFError
+        jobs_reader.close()
+        results_writer.close()
+
+    @property
+    def alive(self) -> bool:
+        """子进程是否仍在运行。"""
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def busy(self) -> bool:
+        """是否有已提交但尚未处理完的帧。"""
+        return bool(self._submitted)
+
+    @property
+    def fps(self) -> float:
+        """自创建以来子进程平均每秒返回的结果数。"""
+        elapsed = time.perf_counter() - self._started_at
+        return self._results_count / elapsed if elapsed > 0 else 0.0
+
+    def set_params(self, params: Any):
+        """修改处理参数，随下一次提交的帧一起发送给子进程。
+
+        Args:
+            params (Any): 新的参数，必须可以被 pickle。
+        """
+        self._params = params
+        self._params_dirty = True
+
+    def submit(self, frame) -> Optional[int]:
+        """将一帧复制到空闲槽位并交给子进程处理。
+
+        Args:
+            frame (maix.image.Image | numpy.ndarray): 要处理的图像，尺寸必须与
+                创建时指定的一致。
+
+        Returns:
+            int | None: 帧的序号；没有空闲槽位或子进程已退出时放弃本帧并返回 None。
+        """
+        if self._process is None:
+            return None
+        self._drain()
+        if self._exited:
+            return None
+        if not self._free:
+            self.dropped += 1
+            return None
+        if not isinstance(frame, np.ndarray):
+            frame = image.image2cv(frame, ensure_bgr=False, copy=False)
+        slot = self._free.pop()
+        np.copyto(self._frames[slot], frame.reshape(self.shape))
+        self._seq += 1
+        changed, self._params_dirty = self._params_dirty, False
+        try:
+            self._jobs.send((slot, self._seq, changed, self._params if changed else None))
+        except (BrokenPipeError, OSError):
+            self._free.append(slot)
+            self._params_dirty = changed
+            return None
+        self._submitted[slot] = (self._seq, time.perf_counter())
+        return self._seq
+
+    def _drain(self):
+        """取回子进程已经返回的所有结果；子进程退出时收回其未处理完的槽位。"""
+        if self._exited:
+            return
+        while self._results.poll():
+            try:
+                slot, seq, data, error, elapsed = self._results.recv()
+            except EOFError:
+                # 子进程已经退出（例如处理中崩溃），它不会再归还这些槽位
+                self._exited = True
+                self._free.extend(self._submitted)
+                self._submitted.clear()
+                break
+            _, submitted_at = self._submitted.pop(slot)
+            if self._held is not None:
+                self._free.append(self._held)
+            self._held = slot
+            self.latest = VisionResult(seq, data, self._masks[slot] if self._masks else None,
+                                       error, elapsed, time.perf_counter() - submitted_at)
+            self._results_count += 1
+            self._fresh = True
+
+    def poll(self) -> Optional[VisionResult]:
+        """取回最新的处理结果，不会阻塞。
+
+        Returns:
+            VisionResult | None: 自上次调用以来有新结果时返回最新的结果，否则返回 None。
+                没有新结果时可以继续使用 `latest`。调用 `close` 之后始终返回 None。
+        """
+        if self._process is None:
+            return None
+        self._drain()
+        if not self._fresh:
+            return None
+        self._fresh = False
+        return self.latest
+
+    def close(self, timeout: float = 1.0):
+        """停止子进程并释放共享内存。
+
+        Args:
+            timeout (float): 等待子进程退出的时间（秒），超时后强制结束。
+        """
+        if self._process is None:
+            return
+        try:
+            self._jobs.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+        self._jobs.close()
+        self._results.close()
+        self.latest = None
+        self._frames.clear()
+        self._masks.clear()
+        for shm in self._frame_shm + self._mask_shm:
+            try:
+                shm.close()
+            except BufferError:
+                pass  # 调用方仍持有掩码的引用，映射在其释放后回收
+            shm.unlink()
+
+    def __enter__(self) -> 'VisionWorker':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()